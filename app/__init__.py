@@ -7,15 +7,63 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Fetch the event snapshot before workers are forked (gunicorn --preload)
+PRELOAD_WARMUP = os.getenv('PRELOAD_WARMUP', 'true').lower() in ('1', 'true', 'yes')
+
 socketio = SocketIO()
 
 def create_app():
+    """
+    Build the application: every blueprint, the Socket.IO handlers, metrics,
+    tracing and the built static assets
+
+    Returns:
+        Flask: The configured application
+    """
+    from app.utils.metrics import register_metrics
+    from app.utils.tracing import register_tracing
+    from app.utils.static_assets import register_static_assets
+    from app.utils.socketio_config import socketio_options
+    from app.routes.main import main_bp
+    from app.routes.api import api_bp
+    # Importing the module registers the Socket.IO event handlers
+    from app.routes import sockets  # noqa: F401
+
     app = Flask(__name__,
                 static_folder='static',
                 template_folder='templates')
-    
+
     app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'default-secret-key')
-    
-    socketio.init_app(app)
-    
-    return app 
\ No newline at end of file
+
+    register_metrics(app)
+    register_tracing(app)
+    register_static_assets(app)
+
+    app.register_blueprint(main_bp)
+    app.register_blueprint(api_bp, url_prefix='/api')
+
+    socketio.init_app(app, **socketio_options())
+
+    return app
+
+def warm_up():
+    """
+    Fill the event cache, store and search index ahead of the first request
+
+    Called by gunicorn.conf.py in the master once the app is preloaded, so
+    every forked worker starts with the snapshot already in memory and
+    shares those pages copy-on-write instead of fetching its own.
+    """
+    from app.utils.logging_config import get_logger
+    from app.utils.sports_api import get_sports_data, balldontlie_ingest_state
+
+    logger = get_logger(__name__)
+    # Threads do not survive the fork, so the workers start their own
+    # BallDontLie ingest (post_worker_init) instead of the master
+    balldontlie_ingest_state['autostart'] = False
+    try:
+        events = get_sports_data('all')
+        logger.info("Warmed event snapshot with %d upcoming events", len(events))
+    except Exception:
+        # Workers fetch on first request instead
+        logger.exception("Event snapshot warm-up failed")
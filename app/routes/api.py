@@ -1,33 +1,175 @@
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, Response, request, jsonify
+from app import socketio
 from app.utils.sports_api import get_sports_data, get_api_football_data
+from app.utils.search_index import search_events, DEFAULT_PAGE_SIZE
+from app.utils.event_store import page_events, upcoming_since, InvalidCursorError, DEFAULT_PAGE_LIMIT
+from app.utils.export import export_events, parse_since, InvalidExportError
+from app.utils.chatbot import process_query, process_batch, get_query_tier_stats, CHAT_BATCH_MAX
+from app.utils.conversation_memory import validate_session_id, forget_session, InvalidSessionError
+from app.utils.timezones import localize_events, get_timezone_table, InvalidTimezoneError
+from app.utils.ingest import (authenticate, read_ndjson, read_webhook, ingest_records,
+                              IngestError, INGEST_TOKENS)
+from app.utils.live_poller import EVENTS_UPDATED
+from app.utils.logging_config import get_logger
 import requests
 from datetime import datetime, timedelta
 import random
+from app.utils.demo_data import DEMO_SEED
+
+logger = get_logger(__name__)
 
 api_bp = Blueprint('api', __name__)
 
+def request_timezone():
+    """
+    Timezone the client asked for with ?tz= or the X-Timezone header
+
+    Returns:
+        str: tz database name, or None to leave events in canonical form
+
+    Raises:
+        InvalidTimezoneError: If the name is unknown
+    """
+    name = request.args.get('tz') or request.headers.get('X-Timezone')
+    if name:
+        get_timezone_table(name)
+    return name or None
+
+@api_bp.errorhandler(InvalidTimezoneError)
+def invalid_timezone(e):
+    return jsonify({'error': str(e)}), 400
+
+@api_bp.route('/sports/events', methods=['GET'])
+def get_events():
+    sport_type = request.args.get('type', 'all')
+    tz = request_timezone()
+    events = get_sports_data(sport_type)
+
+    # Without paging parameters keep returning the plain upcoming list
+    if 'limit' not in request.args and 'cursor' not in request.args:
+        return jsonify(localize_events(events, tz) if tz else events)
+
+    sport = request.args.get('sport') or (sport_type if sport_type != 'all' else None)
+    try:
+        # The first page starts at ?since=, by default at the upcoming events
+        since = parse_since(request.args.get('since'))
+        page = page_events(
+            limit=request.args.get('limit', DEFAULT_PAGE_LIMIT, type=int),
+            cursor=request.args.get('cursor'),
+            sport=sport,
+            competition=request.args.get('competition'),
+            start_timestamp=upcoming_since() if since is None else since
+        )
+    except (InvalidCursorError, InvalidExportError) as e:
+        return jsonify({'error': str(e)}), 400
+    if tz:
+        page['events'] = localize_events(page['events'], tz)
+    return jsonify(page)
+
+@api_bp.route('/sports/search', methods=['GET'])
+def search():
+    query = request.args.get('q', '')
+    page = request.args.get('page', 1, type=int)
+    per_page = request.args.get('per_page', DEFAULT_PAGE_SIZE, type=int)
+    tz = request_timezone()
+    # Make sure the index has been filled by at least one refresh
+    get_sports_data('all')
+    result = search_events(query, page, per_page)
+    if tz:
+        result['results'] = localize_events(result['results'], tz)
+    return jsonify(result)
+
+@api_bp.errorhandler(InvalidSessionError)
+def invalid_session(e):
+    return jsonify({'error': str(e)}), 400
+
+@api_bp.route('/sports/export', methods=['GET'])
+def export():
+    """
+    Stream every stored event as NDJSON (default) or ?format=csv
+
+    ?sport= limits the export to one sport and ?since= to events starting
+    at or after a unix timestamp or ISO 8601 time. The body is generated
+    while it is sent (chunked), so it can be as large as the store.
+    """
+    # Make sure the store has been filled by at least one refresh
+    get_sports_data('all')
+    export_format = request.args.get('format', 'ndjson').lower()
+    try:
+        body, mimetype = export_events(export_format, request.args.get('sport'), request.args.get('since'))
+    except InvalidExportError as e:
+        return jsonify({'error': str(e)}), 400
+    return Response(body, mimetype=mimetype,
+                    headers={'Content-Disposition': f'attachment; filename=events.{export_format}'})
+
 @api_bp.route('/chat', methods=['POST'])
 def chat():
-    data = request.json
+    data = request.get_json(silent=True) or {}
     message = data.get('message', '')
-    
-    if not message:
+    if not isinstance(message, str) or not message.strip():
         return jsonify({'error': 'No message provided'}), 400
-    
-    # Process the message using the chatbot
-    from app.utils.chatbot import get_chatbot_response
-    response = get_chatbot_response(message)
-    
-    return jsonify({'response': response})
+    # Clients keep the returned session_id and send it with follow-up questions
+    session_id = validate_session_id(data.get('session_id'))
+    response = process_query(message, session_id)
+    return jsonify({'response': response, 'session_id': session_id})
 
-@api_bp.route('/sports/events', methods=['GET'])
-def get_sports_events():
-    sport_type = request.args.get('type', 'all')
-    current_app.logger.info(f"Getting sports events for type: {sport_type}")
-    
-    events = get_sports_data(sport_type)
-    
-    return jsonify(events)
+@api_bp.route('/chat/batch', methods=['POST'])
+def chat_batch():
+    data = request.get_json(silent=True) or {}
+    queries = data.get('queries')
+    if not isinstance(queries, list) or not queries or not all(isinstance(query, str) for query in queries):
+        return jsonify({'error': 'queries must be a non-empty list of strings'}), 400
+    if len(queries) > CHAT_BATCH_MAX:
+        return jsonify({'error': f'At most {CHAT_BATCH_MAX} queries per batch'}), 400
+    responses = process_batch(queries)
+    return jsonify({'results': [{'query': query, 'response': response}
+                                for query, response in zip(queries, responses)]})
+
+@api_bp.route('/chat/session/<session_id>', methods=['DELETE'])
+def end_chat_session(session_id):
+    forget_session(validate_session_id(session_id))
+    return '', 204
+
+@api_bp.route('/chat/stats', methods=['GET'])
+def chat_stats():
+    return jsonify(get_query_tier_stats())
+
+@api_bp.route('/ingest', methods=['POST'])
+def ingest():
+    """
+    Push fixtures into the event store
+
+    Authenticated with a token from INGEST_TOKENS (Authorization: Bearer
+    <token>). An application/x-ndjson body is validated and stored one line
+    at a time as it streams in; a JSON body is a webhook carrying one event,
+    a list or {"events": [...]}. Changed events are pushed to Socket.IO
+    clients straight away.
+    """
+    if not INGEST_TOKENS:
+        return jsonify({'error': 'Ingest is not enabled'}), 404
+    source = authenticate(request.headers.get('Authorization') or request.headers.get('X-Ingest-Token'))
+    if source is None:
+        return jsonify({'error': 'Invalid ingest token'}), 401
+
+    def notify(changed):
+        socketio.emit(EVENTS_UPDATED, {'events': changed})
+
+    if request.mimetype in ('application/x-ndjson', 'application/jsonl', 'application/json-seq'):
+        records = read_ndjson(request.stream)
+    elif request.mimetype == 'application/json':
+        payload = request.get_json(silent=True)
+        if payload is None:
+            return jsonify({'error': 'Body is not valid JSON'}), 400
+        records = read_webhook(payload)
+    else:
+        return jsonify({'error': 'Send application/x-ndjson or application/json'}), 415
+
+    try:
+        summary = ingest_records(records, source, notify)
+    except IngestError as e:
+        return jsonify({'error': str(e)}), 400
+    status = 400 if summary['received'] and not summary['accepted'] else 200
+    return jsonify(summary), status
 
 @api_bp.route('/football/test', methods=['GET'])
 def test_football_api():
@@ -72,8 +214,8 @@ def alternate_football_api():
             {"name": "Wolverhampton", "city": "Wolverhampton"}
         ]
         
-        # Shuffle teams and create matchups
-        random.shuffle(teams)
+        # Shuffle teams and create matchups - seeded so every call returns the same fixtures
+        random.Random(DEMO_SEED).shuffle(teams)
         
         today = datetime.now()
         # Force year to 2024 to avoid system date issues
@@ -109,7 +251,7 @@ def alternate_football_api():
         })
             
     except Exception as e:
-        current_app.logger.error(f"Error in alternate football API: {str(e)}")
+        logger.error("Error in alternate football API: %s", e)
         return jsonify({
             'count': 0,
             'events': [],
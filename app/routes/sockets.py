@@ -0,0 +1,19 @@
+from app import socketio
+from app.utils.logging_config import get_logger
+from app.utils.metrics import socketio_connections
+from app.utils.live_poller import start_live_poller
+
+logger = get_logger(__name__)
+
+@socketio.on('connect')
+def handle_connect():
+    # Under the development server the poller starts with the first client;
+    # gunicorn workers start it in post_worker_init
+    start_live_poller(socketio)
+    socketio_connections.inc()
+    logger.debug('Client connected')
+
+@socketio.on('disconnect')
+def handle_disconnect():
+    socketio_connections.dec()
+    logger.debug('Client disconnected')
@@ -1,6 +1,10 @@
 document.addEventListener('DOMContentLoaded', function() {
-    // Initialize Socket.IO
-    const socket = io();
+    // Initialize Socket.IO - WebSocket first, so no sticky sessions are
+    // needed when the server runs several processes; fall back to polling
+    const socket = io({ transports: ['websocket'] });
+    socket.on('connect_error', function() {
+        socket.io.opts.transports = ['polling', 'websocket'];
+    });
     
     // DOM elements
     const userMessageInput = document.getElementById('user-message');
@@ -68,26 +72,39 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     });
     
-    // Function to search events
+    // Search as the user types, once they pause
+    let searchTimer = null;
+    searchInput.addEventListener('input', function() {
+        clearTimeout(searchTimer);
+        searchTimer = setTimeout(() => searchEvents(searchInput.value), 200);
+    });
+    
+    // Function to search events on the server (covers every stored fixture,
+    // not just the cards currently rendered)
+    let searchRequestId = 0;
     function searchEvents(query) {
-        query = query.toLowerCase().trim();
-        const eventCards = document.querySelectorAll('.event-card');
+        query = query.trim();
+        const requestId = ++searchRequestId;
         
         if (query === '') {
-            eventCards.forEach(card => {
-                card.style.display = 'block';
-            });
+            const activeFilter = document.querySelector('.filter-btn.active');
+            loadEvents(activeFilter ? activeFilter.getAttribute('data-type') : 'all');
             return;
         }
         
-        eventCards.forEach(card => {
-            const cardText = card.textContent.toLowerCase();
-            if (cardText.includes(query)) {
-                card.style.display = 'block';
-            } else {
-                card.style.display = 'none';
-            }
-        });
+        fetch(`/api/sports/search?q=${encodeURIComponent(query)}&per_page=50`)
+            .then(response => response.json())
+            .then(data => {
+                // Ignore responses for queries the user has already typed past
+                if (requestId !== searchRequestId) {
+                    return;
+                }
+                eventsCursor = null;
+                renderEvents(data.results, `No events match "${query}".`);
+            })
+            .catch(error => {
+                console.error('Error:', error);
+            });
     }
     
     // Event listener for send button click
@@ -132,6 +149,11 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     });
 
+    // The server remembers the conversation under this id, so follow-up
+    // questions ("and their next away game?") have context; it lasts as
+    // long as the tab
+    let chatSessionId = sessionStorage.getItem('chatSessionId');
+
     // Function to send message
     function sendMessage() {
         const message = userMessageInput.value.trim();
@@ -152,10 +174,18 @@ document.addEventListener('DOMContentLoaded', function() {
                 headers: {
                     'Content-Type': 'application/json'
                 },
-                body: JSON.stringify({ message: message })
+                body: JSON.stringify({ message: message, session_id: chatSessionId })
             })
             .then(response => response.json())
             .then(data => {
+                if (data.error) {
+                    // A stale or malformed id - start a new conversation
+                    chatSessionId = null;
+                    sessionStorage.removeItem('chatSessionId');
+                    throw new Error(data.error);
+                }
+                chatSessionId = data.session_id;
+                sessionStorage.setItem('chatSessionId', chatSessionId);
                 // Remove typing indicator
                 removeTypingIndicator();
                 // Add bot response to chat
@@ -273,50 +303,247 @@ document.addEventListener('DOMContentLoaded', function() {
         chatMessages.scrollTop = chatMessages.scrollHeight;
     }
 
+    // Paging state for the events list - more pages load on scroll
+    const EVENTS_PAGE_SIZE = 20;
+    let eventsType = 'all';
+    let eventsCursor = null;
+    let eventsLoading = false;
+    let eventsLoadId = 0;
+    
+    // Marker below the list; reaching it loads the next page
+    const eventsSentinel = document.createElement('div');
+    eventsSentinel.classList.add('events-sentinel');
+    eventsList.after(eventsSentinel);
+    
+    const eventsObserver = new IntersectionObserver(entries => {
+        if (entries[0].isIntersecting && eventsCursor && !eventsLoading) {
+            fetchEventsPage(false);
+        }
+    }, { rootMargin: '200px' });
+    eventsObserver.observe(eventsSentinel);
+    
     // Function to load events
     function loadEvents(type = 'all') {
-        // Show loading
-        eventsList.innerHTML = `<div class="loading"><i class="fas fa-spinner fa-spin"></i> Loading events...</div>`;
+        eventsType = type;
+        eventsCursor = null;
+        eventsContainer.scrollTop = 0;
+        
+        // Show the list from the last visit right away while it refreshes;
+        // the refresh reuses every card whose event did not change
+        const cached = eventsCache.get(type);
+        if (cached && cached.length) {
+            renderEvents(cached, '');
+        } else {
+            showEventsMessage(`<div class="loading"><i class="fas fa-spinner fa-spin"></i> Loading events...</div>`);
+        }
+        
+        fetchEventsPage(true);
+    }
+    
+    // Function to fetch one page of events, replacing or extending the list
+    function fetchEventsPage(reset) {
+        const loadId = reset ? ++eventsLoadId : eventsLoadId;
+        const type = eventsType;
+        let url = `/api/sports/events?type=${type}&limit=${EVENTS_PAGE_SIZE}`;
+        if (!reset && eventsCursor) {
+            url += `&cursor=${encodeURIComponent(eventsCursor)}`;
+        }
         
-        // Fetch events from API
-        fetch(`/api/sports/events?type=${type}`)
+        eventsLoading = true;
+        fetch(url)
             .then(response => response.json())
             .then(data => {
-                // Clear events list
-                eventsList.innerHTML = '';
-                
-                if (data.length === 0) {
-                    eventsList.innerHTML = `
-                        <div class="no-events">
-                            <i class="fas fa-calendar-times"></i>
-                            <p>No ${type !== 'all' ? type : 'sports'} events found.</p>
-                        </div>
-                    `;
+                // A newer filter selection has replaced this list
+                if (loadId !== eventsLoadId) {
                     return;
                 }
-                
-                // Add events to list with staggered animations
-                data.forEach((event, index) => {
-                    const eventCard = createEventCard(event);
-                    eventCard.style.animationDelay = `${index * 0.1}s`;
-                    eventsList.appendChild(eventCard);
-                });
+                if (reset) {
+                    renderEvents(data.events, `No ${type !== 'all' ? type : 'sports'} events found.`);
+                } else {
+                    appendEvents(data.events);
+                }
+                eventsCache.set(type, eventsView.events);
+                eventsCursor = data.next_cursor;
             })
             .catch(error => {
-                eventsList.innerHTML = `
-                    <div class="error">
-                        <i class="fas fa-exclamation-circle"></i>
-                        <p>Error loading events. Please try again.</p>
-                    </div>
-                `;
+                if (reset && !eventsView.events.length) {
+                    showEventsMessage(`
+                        <div class="error">
+                            <i class="fas fa-exclamation-circle"></i>
+                            <p>Error loading events. Please try again.</p>
+                        </div>
+                    `);
+                }
                 console.error('Error:', error);
+            })
+            .finally(() => {
+                eventsLoading = false;
             });
     }
 
+    // Virtualized events list: only the rows in or near the visible part of
+    // the scroll container are in the DOM, the rest is stood in for by the
+    // list's padding. Cards are keyed by event id, so a refresh or a live
+    // update rebuilds only the cards whose event changed.
+    const eventsContainer = eventsList.closest('.events-container');
+    const OVERSCAN_ROWS = 2;
+    const INITIAL_ROWS = 6;
+    const eventsView = {
+        events: [],              // every loaded event, in display order
+        positions: new Map(),    // event id -> index in events
+        cards: new Map(),        // event id -> card element
+        signatures: new Map(),   // event id -> JSON of the event its card shows
+        rowHeight: 0             // tallest card so far; every row gets this height
+    };
+    // Lists of the sport filters visited, shown instantly when switching back
+    const eventsCache = new Map();
+    let renderScheduled = false;
+    
+    function scheduleRender() {
+        if (renderScheduled) {
+            return;
+        }
+        renderScheduled = true;
+        requestAnimationFrame(() => {
+            renderScheduled = false;
+            renderVisibleEvents();
+        });
+    }
+    
+    // Card for an event - the existing one unless the event changed
+    function cardFor(event) {
+        const signature = JSON.stringify(event);
+        let card = eventsView.cards.get(event.id);
+        if (!card || eventsView.signatures.get(event.id) !== signature) {
+            card = createEventCard(event);
+            eventsView.cards.set(event.id, card);
+            eventsView.signatures.set(event.id, signature);
+        }
+        return card;
+    }
+    
+    // Put the cards of the visible rows into the list, in order
+    function renderVisibleEvents() {
+        const events = eventsView.events;
+        if (!events.length) {
+            return;
+        }
+        const listStyle = getComputedStyle(eventsList);
+        const columns = Math.max(1, listStyle.gridTemplateColumns.split(' ').filter(Boolean).length);
+        const rowGap = parseFloat(listStyle.rowGap) || 0;
+        const rows = Math.ceil(events.length / columns);
+        
+        let firstRow = 0;
+        let lastRow = Math.min(rows - 1, INITIAL_ROWS);
+        const pitch = eventsView.rowHeight + rowGap;
+        if (eventsView.rowHeight) {
+            // Offset of the first row from the top of the scrolled content
+            const listTop = eventsList.getBoundingClientRect().top - eventsContainer.getBoundingClientRect().top
+                + eventsContainer.scrollTop;
+            const viewTop = eventsContainer.scrollTop - listTop;
+            firstRow = Math.min(rows - 1, Math.max(0, Math.floor(viewTop / pitch) - OVERSCAN_ROWS));
+            lastRow = Math.min(rows - 1, Math.max(firstRow, Math.ceil((viewTop + eventsContainer.clientHeight) / pitch) + OVERSCAN_ROWS));
+        }
+        
+        // Keyed patch: cards already in place stay untouched; anything left
+        // over (scrolled out, changed, or a loading message) ends up after
+        // the last wanted card and is removed
+        let node = eventsList.firstElementChild;
+        const rendered = [];
+        for (let index = firstRow * columns; index < Math.min(events.length, (lastRow + 1) * columns); index++) {
+            const card = cardFor(events[index]);
+            rendered.push(card);
+            if (node === card) {
+                node = node.nextElementSibling;
+            } else {
+                eventsList.insertBefore(card, node);
+            }
+        }
+        while (node) {
+            const next = node.nextElementSibling;
+            node.remove();
+            node = next;
+        }
+        
+        eventsList.style.paddingTop = `${firstRow * pitch}px`;
+        eventsList.style.paddingBottom = `${(rows - 1 - lastRow) * pitch}px`;
+        
+        // Grow the row height to the tallest card, then lay out again
+        const tallest = Math.max(...rendered.map(card => card.offsetHeight));
+        if (tallest > eventsView.rowHeight) {
+            eventsView.rowHeight = tallest;
+            eventsList.style.setProperty('--event-card-height', `${tallest}px`);
+            scheduleRender();
+        }
+    }
+    
+    // Function to show a loading, empty or error message instead of events
+    function showEventsMessage(html) {
+        eventsView.events = [];
+        eventsView.positions.clear();
+        eventsList.style.paddingTop = '';
+        eventsList.style.paddingBottom = '';
+        eventsList.innerHTML = html;
+    }
+
+    // Function to render a list of events, or a message when it is empty
+    function renderEvents(events, emptyMessage) {
+        if (events.length === 0) {
+            showEventsMessage('<div class="no-events"><i class="fas fa-calendar-times"></i><p></p></div>');
+            eventsList.querySelector('p').textContent = emptyMessage;
+            return;
+        }
+        
+        eventsView.events = [];
+        eventsView.positions.clear();
+        appendEvents(events);
+        
+        // Forget cards of events that are no longer listed
+        for (const id of eventsView.cards.keys()) {
+            if (!eventsView.positions.has(id)) {
+                eventsView.cards.delete(id);
+                eventsView.signatures.delete(id);
+            }
+        }
+    }
+    
+    // Function to add events to the end of the list (an event already listed is updated in place)
+    function appendEvents(events) {
+        events.forEach(event => {
+            const position = eventsView.positions.get(event.id);
+            if (position !== undefined) {
+                eventsView.events[position] = event;
+            } else {
+                eventsView.positions.set(event.id, eventsView.events.length);
+                eventsView.events.push(event);
+            }
+        });
+        scheduleRender();
+    }
+    
+    // Function to apply changed events to the listed ones, e.g. live scores
+    function updateEvents(events) {
+        let changed = false;
+        events.forEach(event => {
+            const position = eventsView.positions.get(event.id);
+            if (position !== undefined) {
+                eventsView.events[position] = event;
+                changed = true;
+            }
+        });
+        if (changed) {
+            scheduleRender();
+        }
+    }
+    
+    eventsContainer.addEventListener('scroll', scheduleRender, { passive: true });
+    new ResizeObserver(scheduleRender).observe(eventsContainer);
+
     // Function to create event card
     function createEventCard(event) {
         const eventCard = document.createElement('div');
         eventCard.classList.add('event-card', event.sport.toLowerCase());
+        eventCard.dataset.eventId = event.id;
         
         let statusClass = 'upcoming';
         if (event.status === 'LIVE') {
@@ -371,6 +598,11 @@ document.addEventListener('DOMContentLoaded', function() {
         return eventCard;
     }
 
+    // Live score and status changes pushed by the server's fixture poller
+    socket.on('events_updated', function(data) {
+        updateEvents(data.events);
+    });
+
     // Load events on page load
     loadEvents();
     
@@ -0,0 +1,67 @@
+import time
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+
+class RateLimiter:
+    """
+    Space calls out to at most `rate` per second across threads
+
+    A rate of 0 or less disables limiting.
+    """
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the caller may make its next call"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def fetch_concurrently(func, items, max_workers=4, rate_limiter=None):
+    """
+    Call func(item) for every item on a bounded thread pool
+
+    Exceptions are returned in place of results so one failing item does
+    not cancel the rest of the batch.
+
+    Args:
+        func (callable): Called with one item
+        items (list): Inputs
+        max_workers (int): Upper bound on concurrent calls
+        rate_limiter (RateLimiter): Optional limiter applied before each call
+
+    Returns:
+        list: Results (or exceptions) in the same order as items
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    def call(item):
+        if rate_limiter is not None:
+            rate_limiter.wait()
+        try:
+            return func(item)
+        except Exception as e:
+            return e
+
+    if len(items) == 1 or max_workers <= 1:
+        return [call(item) for item in items]
+
+    # Run each call in a copy of the caller's context so tracing spans
+    # opened by func attach to the current request
+    contexts = [contextvars.copy_context() for _ in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(lambda pair: pair[0].run(call, pair[1]), zip(contexts, items)))
@@ -1,17 +1,22 @@
 import os
 import json
 import re
+import threading
+import time
 from dotenv import load_dotenv
 from datetime import datetime
-import requests
-from .sports_api import get_sports_data
+from .sports_api import get_sports_data, event_snapshot
+from .batch_fetch import fetch_concurrently
+from .logging_config import get_logger
+from .metrics import counter, histogram
+from .tracing import span, traced
+from .llm_dispatch import dispatch_chat, get_active_providers, probe_providers, LLMDispatchError
+from .conversation_memory import get_context, record_turn
 
 # Load environment variables
-load_dotenv(override=True)  # Force reload environment variables
+load_dotenv()  # Variables already set in the environment take precedence
 
-# Debugging: Print all environment variables for OpenRouter
-print("Reloading environment variables...")
-print(f"OPENROUTER_API_KEY from env: {os.environ.get('OPENROUTER_API_KEY', '')[:10]}...")
+logger = get_logger(__name__)
 
 # Set up API keys
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
@@ -19,90 +24,25 @@ OPENROUTER_API_KEY = os.getenv('OPENROUTER_API_KEY', '')
 OPENROUTER_API_BASE = os.getenv('OPENROUTER_API_BASE', 'https://openrouter.ai/api/v1')
 OPENROUTER_MODEL = os.getenv('OPENROUTER_MODEL', 'deepseek/deepseek-r1:free')
 
-print(f"OpenAI API Key (first 5 chars): {OPENAI_API_KEY[:5] if OPENAI_API_KEY else 'Not set'}")
-print(f"OpenRouter API Key (first 5 chars): {OPENROUTER_API_KEY[:5] if OPENROUTER_API_KEY else 'Not set'}")
-print(f"OpenRouter API Base: {OPENROUTER_API_BASE}")
-print(f"OpenRouter Model: {OPENROUTER_MODEL}")
+logger.info("OpenAI API Key: %s", 'Set' if OPENAI_API_KEY else 'Not set')
+logger.info("OpenRouter API Key: %s", 'Set' if OPENROUTER_API_KEY else 'Not set')
+logger.info("OpenRouter API Base: %s", OPENROUTER_API_BASE)
+logger.info("OpenRouter Model: %s", OPENROUTER_MODEL)
 
-# Initialize API client variables
-openai_client = None
-use_openrouter = False
+# Batch settings: queries accepted per /api/chat/batch call, and how many of
+# them may wait on an AI provider at once
+CHAT_BATCH_MAX = int(os.getenv('CHAT_BATCH_MAX', '20'))
+CHAT_BATCH_CONCURRENCY = int(os.getenv('CHAT_BATCH_CONCURRENCY', '4'))
 
-# Flag to track if we properly initialized any API
-api_initialized = False
-
-# Try to set up the OpenAI client if API key is available
-if OPENAI_API_KEY:
-    try:
-        # Import OpenAI and initialize client
-        import openai
-        from openai import OpenAI
-        openai_client = OpenAI(api_key=OPENAI_API_KEY)
-        # Test the API with a small request
-        response = openai_client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": "Hello"}],
-            max_tokens=5
-        )
-        print("OpenAI API connection successful")
-        api_initialized = True
-    except Exception as e:
-        print(f"Error initializing OpenAI client: {str(e)}")
-        OPENAI_API_KEY = None
-        openai_client = None
+# Check which AI providers respond; failing ones are skipped by the dispatcher
+if os.getenv('LLM_STARTUP_PROBE', 'true').lower() in ('1', 'true', 'yes'):
+    probe_providers()
 
-# Check if OpenRouter API key is available
-if OPENROUTER_API_KEY:
-    try:
-        # Print full API key for debugging (only first 10 chars for security)
-        print(f"Using OpenRouter API Key: {OPENROUTER_API_KEY[:10]}...")
-        print(f"OpenRouter API Key length: {len(OPENROUTER_API_KEY)}")
-        
-        # Test the OpenRouter API using the exact format provided by the user
-        print(f"OpenRouter API Key is set. Testing connection with DeepSeek R1...")
-        
-        headers = {
-            "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-            "HTTP-Referer": "https://www.plantai.com",
-            "X-Title": "Plant AI",
-            "Content-Type": "application/json"
-        }
-        
-        # Use the same model as specified in the environment
-        data = {
-            "model": OPENROUTER_MODEL,
-            "messages": [{"role": "user", "content": "Hello"}]
-        }
-        
-        print(f"Sending test request to OpenRouter with model {OPENROUTER_MODEL}...")
-        print(f"Request URL: {OPENROUTER_API_BASE}/chat/completions")
-        print(f"Auth header: Bearer {OPENROUTER_API_KEY[:10]}...")
-        
-        response = requests.post(
-            f"{OPENROUTER_API_BASE}/chat/completions",
-            headers=headers,
-            json=data
-        )
-        
-        print(f"OpenRouter response status: {response.status_code}")
-        
-        if response.status_code == 200:
-            response_text = response.text[:200] + "..." if len(response.text) > 200 else response.text
-            print(f"OpenRouter response content: {response_text}")
-            print("OpenRouter API connection successful")
-            use_openrouter = True
-            api_initialized = True
-        else:
-            print(f"OpenRouter API error: {response.text}")
-    except Exception as e:
-        print(f"Error connecting to OpenRouter API: {str(e)}")
-        print(f"Exception type: {type(e)}")
-        if hasattr(e, '__traceback__'):
-            import traceback
-            print(f"Traceback: {traceback.format_tb(e.__traceback__)}")
+# Flag to track if we properly initialized any API
+api_initialized = len(get_active_providers()) > 0
 
 if not api_initialized:
-    print("WARNING: No AI API services were successfully initialized. Using rule-based processing only.")
+    logger.warning("No AI API services were successfully initialized. Using rule-based processing only.")
 
 # Intent patterns for sports queries
 INTENT_PATTERNS = {
@@ -157,6 +97,13 @@ TOPIC_PATTERNS = {
     ]
 }
 
+# Compile the patterns once at import - with gunicorn --preload this happens
+# in the master and every worker inherits the compiled objects
+INTENT_PATTERNS = {intent: [re.compile(pattern) for pattern in patterns]
+                   for intent, patterns in INTENT_PATTERNS.items()}
+TOPIC_PATTERNS = {topic: [re.compile(pattern) for pattern in patterns]
+                  for topic, patterns in TOPIC_PATTERNS.items()}
+
 def detect_topic(query):
     """
     Detect if a query is sports-related or not
@@ -169,54 +116,284 @@ def detect_topic(query):
     """
     for topic, patterns in TOPIC_PATTERNS.items():
         for pattern in patterns:
-            if re.search(pattern, query):
+            if pattern.search(query):
                 return topic
     
     # Default to sports if unclear
     return 'sports'
 
-def process_query(query):
+# Sport names the event data is keyed by, plus the aliases users type for them
+SPORT_ALIASES = {
+    'football': 'football',
+    'soccer': 'football',
+    'epl': 'football',
+    'basketball': 'basketball',
+    'nba': 'basketball',
+    'cricket': 'cricket',
+    'ipl': 'cricket',
+    't20': 'cricket'
+}
+
+# Phrasing that asks for opinion or reasoning - these always go to the AI tier
+OPEN_ENDED_PATTERN = re.compile(
+    r'(?i)\b(why|how\s+(?:did|do|does|will|would|good)|who\s+(?:will|would|should|is\s+better)|'
+    r'predict\w*|prediction|should|compare|explain|opinion|think|chances?|odds|better|best|worst)\b'
+)
+
+# Usage counters for each routing tier of process_query
+query_tier_stats = {
+    'fast_path': {'count': 0, 'total_seconds': 0.0},
+    'ai': {'count': 0, 'total_seconds': 0.0},
+    'ai_fallback': {'count': 0, 'total_seconds': 0.0},
+    'rules': {'count': 0, 'total_seconds': 0.0}
+}
+query_tier_lock = threading.Lock()
+
+# The same counts exported at /metrics
+chat_queries = counter('chat_queries', 'Chat queries answered by routing tier', ('tier',))
+chat_query_duration = histogram('chat_query_duration_seconds', 'Chat query latency by routing tier', ('tier',))
+
+def record_query_tier(tier, started_at):
+    """Add one query answered by the given tier to query_tier_stats"""
+    elapsed = time.perf_counter() - started_at
+    with query_tier_lock:
+        query_tier_stats[tier]['count'] += 1
+        query_tier_stats[tier]['total_seconds'] += elapsed
+    chat_queries.inc(tier=tier)
+    chat_query_duration.observe(elapsed, tier=tier)
+
+def get_query_tier_stats():
+    """
+    Snapshot of how often each routing tier answered a query
+
+    Returns:
+        dict: Per-tier count, total and average latency in seconds
+    """
+    with query_tier_lock:
+        snapshot = {}
+        for tier, stats in query_tier_stats.items():
+            count = stats['count']
+            snapshot[tier] = {
+                'count': count,
+                'total_seconds': round(stats['total_seconds'], 6),
+                'avg_seconds': round(stats['total_seconds'] / count, 6) if count else 0.0
+            }
+        return snapshot
+
+def answer_structured_query(query):
+    """
+    Answer a query straight from the event data when its intent is unambiguous
+
+    Only schedule lookups for a known sport or a team that appears in the
+    current events are answered here; anything open-ended returns None so the
+    caller can hand it to the AI provider.
+
+    Args:
+        query (str): The user's query
+
+    Returns:
+        str or None: The formatted response, or None if the query needs the AI tier
+    """
+    if OPEN_ENDED_PATTERN.search(query):
+        return None
+
+    intent, params = extract_intent(query)
+
+    if intent == 'get_sport_specific_events':
+        sport_type = SPORT_ALIASES.get(params.get('sport_type', '').lower())
+        if not sport_type:
+            return None
+        events = get_sports_data(sport_type)
+        if not events:
+            return None
+        return format_events_response(events, sport_type)
+
+    if intent == 'get_team_schedule':
+        team_name = params.get('team_name', '').strip().lower()
+        if len(team_name) < 3 or team_name in SPORT_ALIASES:
+            return None
+        all_events = get_sports_data('all')
+        team_events = [
+            event for event in all_events
+            if team_name in event.get('home_team', '').lower()
+            or team_name in event.get('away_team', '').lower()
+        ]
+        if not team_events:
+            return None
+        return format_team_events_response(team_events, team_name)
+
+    return None
+
+def process_query(query, session_id=None):
     """
     Process a user query and return an appropriate response
-    
+
+    Queries are routed through tiers: structured schedule lookups are answered
+    directly from the event data, open-ended questions go to the AI provider
+    when one is configured, and everything else uses rule-based processing.
+
+    With a session id the AI tier also sees the session's recent turns and a
+    summary of older ones, so follow-up questions can be answered, and the
+    exchange is remembered for the next query.
+
     Args:
         query (str): The user's query
-        
+        session_id (str): Conversation the query belongs to, if any
+
+    Returns:
+        str: The chatbot's response
+    """
+    context = get_context(session_id) if session_id else None
+    response = answer_query(query, context)
+    if session_id:
+        record_turn(session_id, query, response, query_subjects(query))
+    return response
+
+def answer_query(query, context=None):
+    """
+    Answer one query through the routing tiers of process_query
+
+    Args:
+        query (str): The user's query
+        context (dict): Earlier turns from conversation_memory.get_context
+
     Returns:
         str: The chatbot's response
     """
+    started_at = time.perf_counter()
+
     # Check if API keys are available and initialized
     if api_initialized:
-        if (OPENAI_API_KEY and openai_client) or (OPENROUTER_API_KEY and use_openrouter):
-            try:
-                # Use AI models for natural language processing
-                print("Using AI processing (OpenAI or OpenRouter)...")
-                return process_with_ai(query)
-            except Exception as e:
-                print(f"Error with AI processing: {str(e)}")
-                print(f"Exception type: {type(e)}")
-                if hasattr(e, '__traceback__'):
-                    import traceback
-                    print(f"Traceback: {traceback.format_tb(e.__traceback__)}")
-                # Fall back to rule-based processing if AI fails
-                return process_with_rules(query)
+        if get_active_providers():
+            # Fast path - skip the AI round trip for structured lookups
+            response = answer_structured_query(query)
+            if response is not None:
+                record_query_tier('fast_path', started_at)
+                return response
+
+            return answer_with_ai(query, context, started_at)
         else:
-            print("No active API clients available despite initialization, using rule-based processing")
-            return process_with_rules(query)
+            logger.debug("No active API clients available despite initialization, using rule-based processing")
     else:
-        print("No API initialized, using rule-based processing")
-        # Use rule-based processing if no API keys
-        return process_with_rules(query)
+        logger.debug("No API initialized, using rule-based processing")
+
+    # Use rule-based processing if no API keys
+    response = process_with_rules(query)
+    record_query_tier('rules', started_at)
+    return response
 
-def process_with_ai(query):
+def answer_with_ai(query, context=None, started_at=None):
     """
-    Process the query using AI models (OpenAI or OpenRouter)
+    Answer a query with the AI tier, falling back to rules if it fails
+
+    Args:
+        query (str): The user's query
+        context (dict): Earlier turns from conversation_memory.get_context
+        started_at (float): perf_counter() when the query arrived
+
+    Returns:
+        str: The chatbot's response
+    """
+    started_at = started_at or time.perf_counter()
+    try:
+        # Use AI models for natural language processing
+        logger.debug("Using AI processing (OpenAI or OpenRouter)...")
+        response = process_with_ai(query, context)
+        record_query_tier('ai', started_at)
+        return response
+    except LLMDispatchError as e:
+        logger.warning("AI providers unavailable: %s", e)
+        response = process_with_rules(query)
+        record_query_tier('ai_fallback', started_at)
+        return response
+    except Exception as e:
+        logger.exception("Error with AI processing: %s", e)
+        # Fall back to rule-based processing if AI fails
+        response = process_with_rules(query)
+        record_query_tier('ai_fallback', started_at)
+        return response
+
+def process_batch(queries):
+    """
+    Answer several independent queries in one pass
+
+    Every query is classified first against one shared event snapshot:
+    fast-path and rule-based answers are produced inline, and the queries
+    that need the AI tier are then sent concurrently, at most
+    CHAT_BATCH_CONCURRENCY at a time. Queries are not treated as a
+    conversation; each is answered on its own.
+
+    Args:
+        queries (list): The user's queries
+
+    Returns:
+        list: Responses in the same order as the queries
+    """
+    started_at = time.perf_counter()
+    responses = [None] * len(queries)
+    use_ai = api_initialized and bool(get_active_providers())
+
+    with event_snapshot():
+        ai_positions = []
+        for position, query in enumerate(queries):
+            query_started_at = time.perf_counter()
+            if use_ai:
+                response = answer_structured_query(query)
+                if response is None:
+                    ai_positions.append(position)
+                    continue
+                record_query_tier('fast_path', query_started_at)
+            else:
+                response = process_with_rules(query)
+                record_query_tier('rules', query_started_at)
+            responses[position] = response
+
+        # The AI queries reuse the snapshot: fetch_concurrently runs each
+        # call in a copy of this context. Each is timed from its own start,
+        # so the AI tier's latency does not include the rest of the batch.
+        answers = fetch_concurrently(lambda position: answer_with_ai(queries[position], None, time.perf_counter()),
+                                     ai_positions, max_workers=CHAT_BATCH_CONCURRENCY)
+        for position, answer in zip(ai_positions, answers):
+            if isinstance(answer, Exception):
+                logger.warning("Batch query failed: %s", answer)
+                answer = process_with_rules(queries[position])
+            responses[position] = answer
+
+    logger.debug("Answered batch of %d queries (%d via AI) in %.3fs",
+                 len(queries), len(ai_positions), time.perf_counter() - started_at)
+    return responses
+
+def query_subjects(query):
+    """
+    Teams or sports a query is about, for the conversation summary
+
+    Args:
+        query (str): The user's query
+
+    Returns:
+        list: Team names and sport names, possibly empty
+    """
+    intent, params = extract_intent(query)
+    if intent == 'get_team_schedule':
+        team_name = ' '.join(params.get('team_name', '').split())
+        if len(team_name) >= 3 and team_name.lower() not in SPORT_ALIASES:
+            return [team_name]
+    elif intent == 'get_sport_specific_events':
+        sport_type = SPORT_ALIASES.get(params.get('sport_type', '').lower())
+        if sport_type:
+            return [sport_type]
+    return []
+
+@traced('prompt_build')
+def build_system_message(query):
+    """
+    Build the system prompt for the AI providers, including relevant events
     
     Args:
         query (str): The user's query
         
     Returns:
-        str: The chatbot's response
+        str: The system message
     """
     # Check if query is sports-related
     topic = detect_topic(query)
@@ -284,86 +461,40 @@ def process_with_ai(query):
                 f"The full set of events includes football matches from the Premier League, "
                 f"basketball games, and cricket matches. Respond to the user's query based on the events data."
             )
+
+    return system_message
+
+def process_with_ai(query, context=None):
+    """
+    Process the query using AI models (OpenAI or OpenRouter)
     
-    try:
-        if OPENAI_API_KEY and openai_client:
-            # Use OpenAI
-            print("Sending request to OpenAI API...")
-            response = openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": query}
-                ],
-                max_tokens=150,
-                temperature=0.7,
-            )
-            print("Received response from OpenAI API")
-            return response.choices[0].message.content.strip()
-        elif OPENROUTER_API_KEY and use_openrouter:
-            # Use OpenRouter with DeepSeek R1 following the exact structure from user example
-            print("Sending request to OpenRouter API with DeepSeek R1...")
-            print(f"Using current OpenRouter API key: {OPENROUTER_API_KEY[:10]}...")
-            print(f"OpenRouter API key length: {len(OPENROUTER_API_KEY)}")
-            
-            # Create headers using exact same format as user example
-            headers = {
-                "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-                "HTTP-Referer": "https://www.plantai.com",
-                "X-Title": "Plant AI",
-                "Content-Type": "application/json"
-            }
-            
-            # Add system message to the array
-            messages = [
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": query}
-            ]
-            
-            # Create the request body exactly as in the user example
-            data = {
-                "model": OPENROUTER_MODEL,
-                "messages": messages
-            }
-            
-            print(f"OpenRouter request URL: {OPENROUTER_API_BASE}/chat/completions")
-            print(f"Auth header: Bearer {OPENROUTER_API_KEY[:10]}...")
-            
-            # Make the API request
-            response = requests.post(
-                f"{OPENROUTER_API_BASE}/chat/completions",
-                headers=headers,
-                json=data
-            )
-            
-            print(f"OpenRouter response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                print("Received successful response from OpenRouter API")
-                response_json = response.json()
-                
-                # Extract the response content
-                if 'choices' in response_json and len(response_json['choices']) > 0:
-                    if 'message' in response_json['choices'][0] and 'content' in response_json['choices'][0]['message']:
-                        return response_json['choices'][0]['message']['content'].strip()
-                
-                # If we couldn't parse the response properly
-                print("Couldn't extract content from response, falling back to rule-based")
-                return process_with_rules(query)
-            else:
-                print(f"OpenRouter API error: {response.text}")
-                return process_with_rules(query)
-        else:
-            print("No API clients available")
-            return process_with_rules(query)
-    except Exception as e:
-        print(f"AI API error: {e}")
-        print(f"Exception type: {type(e)}")
-        if hasattr(e, '__traceback__'):
-            import traceback
-            print(f"Traceback: {traceback.format_tb(e.__traceback__)}")
-        # Fall back to rule-based processing if AI fails
-        return process_with_rules(query)
+    Args:
+        query (str): The user's query
+        context (dict): Earlier turns from conversation_memory.get_context
+        
+    Returns:
+        str: The chatbot's response
+
+    Raises:
+        LLMDispatchError: If none of the providers answered in time
+    """
+    system_message = build_system_message(query)
+    if context and context['summary']:
+        system_message = f"{system_message}\n\n{context['summary']}"
+
+    # Only the last few turns are sent verbatim, so the prompt does not grow
+    # with the length of the conversation
+    messages = [{"role": "system", "content": system_message}]
+    if context:
+        messages.extend(context['messages'])
+    messages.append({"role": "user", "content": query})
+
+    # Providers are tried with per-provider timeouts (and optional hedging);
+    # LLMDispatchError propagates so process_query can fall back to rules
+    with span('llm'):
+        response_text, provider_name = dispatch_chat(messages)
+    logger.debug("Received response from %s", provider_name)
+    return response_text
 
 # Rename the old function name to match our new naming
 def process_with_openai(query):
@@ -457,7 +588,7 @@ def extract_intent(query):
     """
     for intent, patterns in INTENT_PATTERNS.items():
         for pattern in patterns:
-            match = re.search(pattern, query)
+            match = pattern.search(query)
             if match:
                 if intent == 'get_sport_specific_events' and match.group(1):
                     return intent, {'sport_type': match.group(1)}
@@ -512,7 +643,7 @@ def format_events_response(events, sport_type):
                 # Format nicely with day of week
                 formatted_date = date_obj.strftime('%A, %B %d, %Y at %I:%M %p')
         except Exception as e:
-            print(f"Error formatting date: {e}")
+            logger.warning("Error formatting date: %s", e)
             formatted_date = date_str
         
         response += f"{i}. {away_team} at {home_team}\n"
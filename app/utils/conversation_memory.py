@@ -0,0 +1,181 @@
+import os
+import re
+import time
+import threading
+import secrets
+from collections import OrderedDict, deque
+from .metrics import counter, gauge
+
+# Memory settings: sessions idle for CONVERSATION_TTL seconds are forgotten,
+# and past CONVERSATION_MAX_SESSIONS the least recently used one is dropped
+CONVERSATION_TTL = float(os.getenv('CONVERSATION_TTL', '1800'))
+CONVERSATION_MAX_SESSIONS = int(os.getenv('CONVERSATION_MAX_SESSIONS', '10000'))
+
+# Turns (a question and its answer) kept verbatim; older ones are folded into
+# the summary, so the prompt stays the same size however long the chat gets
+CONVERSATION_RECENT_TURNS = int(os.getenv('CONVERSATION_RECENT_TURNS', '3'))
+# Earlier questions and subjects (teams, sports) the summary keeps
+SUMMARY_QUESTIONS = int(os.getenv('CONVERSATION_SUMMARY_QUESTIONS', '5'))
+SUMMARY_SUBJECTS = int(os.getenv('CONVERSATION_SUMMARY_SUBJECTS', '8'))
+
+# Characters of each remembered message; answers listing events are long
+# and the model only needs their gist to resolve a follow-up
+MAX_QUESTION_CHARS = 200
+MAX_ANSWER_CHARS = 600
+
+SESSION_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{8,64}$')
+
+conversation_evictions = counter(
+    'conversation_evictions',
+    'Chat sessions forgotten, by reason',
+    ('reason',)
+)
+conversation_sessions = gauge(
+    'conversation_sessions',
+    'Chat sessions currently remembered'
+)
+
+# session id -> conversation, least recently used first
+conversations = OrderedDict()
+conversations_lock = threading.Lock()
+
+
+class InvalidSessionError(ValueError):
+    """Raised when a client sends a malformed session id"""
+
+
+def _truncate(text, limit):
+    text = ' '.join(str(text).split())
+    return text if len(text) <= limit else text[:limit - 1] + '…'
+
+
+def _new_conversation():
+    return {
+        'turns': deque(),
+        'questions': deque(maxlen=SUMMARY_QUESTIONS),
+        'subjects': deque(maxlen=SUMMARY_SUBJECTS),
+        'turn_count': 0,
+        'updated_at': 0.0
+    }
+
+
+def new_session_id():
+    """Random id for a new chat session"""
+    return secrets.token_urlsafe(16)
+
+
+def validate_session_id(session_id):
+    """
+    Check a client-supplied session id
+
+    Args:
+        session_id (str): The id, or None for a new session
+
+    Returns:
+        str: The id, or a new one if none was given
+
+    Raises:
+        InvalidSessionError: If the id is not 8-64 URL-safe characters
+    """
+    if session_id is None or session_id == '':
+        return new_session_id()
+    if not isinstance(session_id, str) or not SESSION_ID_PATTERN.match(session_id):
+        raise InvalidSessionError('session_id must be 8-64 letters, digits, "-" or "_"')
+    return session_id
+
+
+def _evict_expired(now):
+    """Drop idle sessions from the least recently used end; caller holds the lock"""
+    while conversations:
+        session_id, conversation = next(iter(conversations.items()))
+        if now - conversation['updated_at'] < CONVERSATION_TTL:
+            break
+        del conversations[session_id]
+        conversation_evictions.inc(reason='ttl')
+
+
+def get_context(session_id, now=None):
+    """
+    What the model needs to know about a session's earlier turns
+
+    Args:
+        session_id (str): The session
+        now (float): Current time, default time.time()
+
+    Returns:
+        dict: 'summary' (str, empty for short conversations) and 'messages',
+        the recent turns as chat messages, oldest first
+    """
+    now = now or time.time()
+    with conversations_lock:
+        _evict_expired(now)
+        conversation = conversations.get(session_id)
+        if conversation is None:
+            return {'summary': '', 'messages': []}
+        messages = []
+        for question, answer in conversation['turns']:
+            messages.append({'role': 'user', 'content': question})
+            messages.append({'role': 'assistant', 'content': answer})
+        return {'summary': _render_summary(conversation), 'messages': messages}
+
+
+def _render_summary(conversation):
+    """Summary of the turns no longer kept verbatim"""
+    parts = []
+    earlier = conversation['turn_count'] - len(conversation['turns'])
+    if earlier > 0 and conversation['questions']:
+        questions = '; '.join(f'"{question}"' for question in conversation['questions'])
+        parts.append(f"Earlier in this conversation ({earlier} exchanges) the user asked: {questions}.")
+    if conversation['subjects']:
+        # Most recent first - that is what "they" or "that game" refers to
+        parts.append(f"Subjects discussed, most recent first: {', '.join(reversed(conversation['subjects']))}.")
+    return ' '.join(parts)
+
+
+def record_turn(session_id, question, answer, subjects=(), now=None):
+    """
+    Remember one exchange of a session
+
+    The oldest verbatim turn beyond CONVERSATION_RECENT_TURNS is folded into
+    the rolling summary: only its question is kept, and the summary itself
+    holds a bounded number of questions and subjects.
+
+    Args:
+        session_id (str): The session
+        question (str): What the user asked
+        answer (str): What the chatbot replied
+        subjects (iterable): Teams or sports the question was about
+        now (float): Current time, default time.time()
+    """
+    now = now or time.time()
+    question = _truncate(question, MAX_QUESTION_CHARS)
+    with conversations_lock:
+        conversation = conversations.get(session_id)
+        if conversation is None:
+            conversation = conversations[session_id] = _new_conversation()
+        else:
+            conversations.move_to_end(session_id)
+
+        conversation['turns'].append((question, _truncate(answer, MAX_ANSWER_CHARS)))
+        conversation['turn_count'] += 1
+        conversation['updated_at'] = now
+        while len(conversation['turns']) > CONVERSATION_RECENT_TURNS:
+            old_question, _ = conversation['turns'].popleft()
+            conversation['questions'].append(old_question)
+        for subject in subjects:
+            if subject in conversation['subjects']:
+                conversation['subjects'].remove(subject)
+            conversation['subjects'].append(subject)
+
+        _evict_expired(now)
+        while len(conversations) > CONVERSATION_MAX_SESSIONS:
+            conversations.popitem(last=False)
+            conversation_evictions.inc(reason='size')
+        conversation_sessions.set(len(conversations))
+
+
+def forget_session(session_id):
+    """Drop a session's memory, e.g. when the user starts over"""
+    with conversations_lock:
+        conversations.pop(session_id, None)
+        conversation_sessions.set(len(conversations))
@@ -0,0 +1,318 @@
+import os
+import random
+import threading
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import accumulate
+import pytz
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Demo provider settings (API_PROVIDER=demo)
+DEMO_SEED = int(os.getenv('DEMO_SEED', '42'))
+DEMO_LEAGUES = int(os.getenv('DEMO_LEAGUES', '6'))
+DEMO_TEAMS_PER_LEAGUE = int(os.getenv('DEMO_TEAMS_PER_LEAGUE', '20'))
+DEMO_FIXTURES_PER_LEAGUE = int(os.getenv('DEMO_FIXTURES_PER_LEAGUE', '380'))
+DEMO_DAYS_BACK = int(os.getenv('DEMO_DAYS_BACK', '3'))      # finished fixtures before today
+DEMO_DAYS_AHEAD = int(os.getenv('DEMO_DAYS_AHEAD', '60'))   # scheduled fixtures after today
+
+# How each sport is played out: match length in minutes, local kickoff
+# slots (weighted), and how many scoring plays each side makes and for how
+# many points
+SPORT_PROFILES = {
+    'football': {
+        'duration': 105,
+        'kickoffs': [('12:30', 2), ('15:00', 5), ('17:30', 2), ('20:00', 3)],
+        'plays': (1.4, 1.1),
+        'points': [1],
+        'innings': False,
+        'suffixes': ['United', 'City', 'Rovers', 'Athletic', 'Wanderers', 'FC', 'Albion', 'Town']
+    },
+    'basketball': {
+        'duration': 150,
+        'kickoffs': [('19:00', 3), ('19:30', 4), ('20:00', 2), ('22:00', 1)],
+        'plays': (42, 5),
+        'points': [2, 2, 2, 3, 1],
+        'innings': False,
+        'suffixes': ['Hawks', 'Kings', 'Comets', 'Giants', 'Storm', 'Rockets', 'Lions', 'Blaze']
+    },
+    'cricket': {
+        'duration': 200,
+        'kickoffs': [('14:00', 1), ('15:30', 2), ('19:30', 4)],
+        'plays': (60, 10),
+        'points': [1, 1, 1, 2, 4, 6],
+        'innings': True,  # home bats first, away chases in the second half
+        'suffixes': ['Strikers', 'Warriors', 'Titans', 'Chargers', 'Royals', 'Knights', 'Super Kings', 'Capitals']
+    }
+}
+
+# Leagues cycle through these regions; the timezone sets local kickoff times
+DEMO_REGIONS = [
+    ('England', 'Europe/London', ['London', 'Manchester', 'Liverpool', 'Leeds', 'Bristol', 'Norwich', 'Brighton', 'Derby', 'Hull', 'York']),
+    ('America', 'US/Eastern', ['Boston', 'Denver', 'Chicago', 'Miami', 'Dallas', 'Seattle', 'Phoenix', 'Atlanta', 'Detroit', 'Houston']),
+    ('India', 'Asia/Kolkata', ['Mumbai', 'Chennai', 'Delhi', 'Kolkata', 'Jaipur', 'Pune', 'Lucknow', 'Mohali', 'Indore', 'Kochi']),
+    ('Spain', 'Europe/Madrid', ['Madrid', 'Sevilla', 'Valencia', 'Bilbao', 'Malaga', 'Cadiz', 'Girona', 'Vigo', 'Getafe', 'Elche']),
+    ('Australia', 'Australia/Sydney', ['Sydney', 'Perth', 'Adelaide', 'Hobart', 'Brisbane', 'Darwin', 'Geelong', 'Cairns', 'Canberra', 'Newcastle'])
+]
+
+
+def round_robin(team_count):
+    """
+    Yield rounds of (home, away) team index pairs using the circle method,
+    repeating with home and away swapped after every full cycle
+    """
+    order = list(range(team_count + team_count % 2))
+    bye = team_count if team_count % 2 else None
+    cycle = 0
+    while True:
+        for _ in range(len(order) - 1):
+            pairs = []
+            for i in range(len(order) // 2):
+                home, away = order[i], order[-1 - i]
+                if bye in (home, away):
+                    continue
+                pairs.append((away, home) if cycle % 2 else (home, away))
+            yield pairs
+            order.insert(1, order.pop())
+        cycle += 1
+
+
+class DemoDataEngine:
+    """
+    Seeded synthetic sports data: N leagues of M teams with K fixtures each
+
+    Everything is a pure function of the seed and the anchor day, so two
+    engines built with the same arguments produce identical fixtures.
+    Fixtures are built once on first use; scores are derived from a seeded
+    per-fixture timeline of scoring plays, so a fixture's status and score
+    at any moment are reproducible and progress as time passes.
+
+    Args:
+        seed (int): Random seed
+        leagues (int): Number of leagues (N), cycling through the sports
+        teams_per_league (int): Teams per league (M)
+        fixtures_per_league (int): Fixtures per league (K)
+        days_back (int): Days before the anchor the schedule starts
+        days_ahead (int): Days after the anchor the schedule ends
+        anchor (datetime): Day the schedule is built around, default today (UTC)
+    """
+
+    def __init__(self, seed=DEMO_SEED, leagues=DEMO_LEAGUES, teams_per_league=DEMO_TEAMS_PER_LEAGUE,
+                 fixtures_per_league=DEMO_FIXTURES_PER_LEAGUE, days_back=DEMO_DAYS_BACK,
+                 days_ahead=DEMO_DAYS_AHEAD, anchor=None):
+        self.seed = seed
+        self.league_count = leagues
+        self.teams_per_league = max(2, teams_per_league)
+        self.fixtures_per_league = fixtures_per_league
+        self.days_back = days_back
+        self.days_ahead = days_ahead
+        anchor = anchor or datetime.now(timezone.utc)
+        self.anchor = anchor.replace(hour=0, minute=0, second=0, microsecond=0)
+        self._fixtures = None
+        self._fixtures_by_id = None
+        self._lock = threading.Lock()
+        self._timeline = lru_cache(maxsize=65536)(self._build_timeline)
+
+    def _build_leagues(self):
+        sports = list(SPORT_PROFILES)
+        leagues = []
+        for index in range(self.league_count):
+            sport = sports[index % len(sports)]
+            region, tz_name, cities = DEMO_REGIONS[index % len(DEMO_REGIONS)]
+            tier = index // len(DEMO_REGIONS) + 1
+            suffixes = SPORT_PROFILES[sport]['suffixes']
+            teams = []
+            for team_index in range(self.teams_per_league):
+                city = cities[team_index % len(cities)]
+                suffix = suffixes[(team_index // len(cities) + index) % len(suffixes)]
+                name = f"{city} {suffix}"
+                rounds_of_names = team_index // (len(cities) * len(suffixes))
+                if rounds_of_names:
+                    name = f"{name} {rounds_of_names + 1}"
+                teams.append({'name': name, 'city': city})
+            leagues.append({
+                'id': f"demo-{index}",
+                'name': f"{region} {sport.title()} League {tier}",
+                'sport': sport,
+                'timezone': pytz.timezone(tz_name),
+                'teams': teams
+            })
+        return leagues
+
+    def _build_fixtures(self):
+        fixtures = []
+        first_day = self.anchor - timedelta(days=self.days_back)
+        span_days = self.days_back + self.days_ahead + 1
+        for league in self._build_leagues():
+            profile = SPORT_PROFILES[league['sport']]
+            rng = random.Random(f"{self.seed}:{league['id']}")
+            slots = [slot for slot, _ in profile['kickoffs']]
+            weights = [weight for _, weight in profile['kickoffs']]
+            tz = league['timezone']
+            teams = league['teams']
+
+            rounds = round_robin(len(teams))
+            matches_per_round = max(1, len(teams) // 2)
+            round_count = -(-self.fixtures_per_league // matches_per_round)
+            created = 0
+            for round_index in range(round_count):
+                # Spread rounds evenly over the schedule window
+                day = first_day + timedelta(days=round_index * span_days // round_count)
+                for home, away in next(rounds):
+                    if created == self.fixtures_per_league:
+                        break
+                    # Matches of a round can slip a day either side
+                    match_day = day + timedelta(days=rng.choice((0, 0, 0, 1, -1)))
+                    hour, minute = map(int, rng.choices(slots, weights)[0].split(':'))
+                    local_kickoff = tz.localize(datetime(match_day.year, match_day.month, match_day.day, hour, minute))
+                    fixtures.append({
+                        'id': f"{league['id']}-{created}",
+                        'sport': league['sport'],
+                        'competition': league['name'],
+                        'home_team': teams[home]['name'],
+                        'away_team': teams[away]['name'],
+                        'city': teams[home]['city'],
+                        'kickoff': local_kickoff.astimezone(timezone.utc)
+                    })
+                    created += 1
+
+        fixtures.sort(key=lambda fixture: (fixture['kickoff'], fixture['id']))
+        logger.debug("Built %s demo fixtures in %s leagues", len(fixtures), self.league_count)
+        return fixtures
+
+    @property
+    def fixtures(self):
+        """All fixtures in kickoff order, built on first access"""
+        if self._fixtures is None:
+            with self._lock:
+                if self._fixtures is None:
+                    fixtures = self._build_fixtures()
+                    self._fixtures_by_id = {fixture['id']: fixture for fixture in fixtures}
+                    self._fixtures = fixtures
+        return self._fixtures
+
+    @property
+    def fixtures_by_id(self):
+        """Fixture id -> fixture"""
+        self.fixtures
+        return self._fixtures_by_id
+
+    def _build_timeline(self, fixture_id, sport):
+        """(minutes, cumulative points) of the scoring plays of each side"""
+        profile = SPORT_PROFILES[sport]
+        rng = random.Random(f"{self.seed}:{fixture_id}:score")
+        duration = profile['duration']
+        mean, spread = profile['plays']
+        sides = []
+        for side in range(2):
+            if profile['innings']:
+                start, end = (0, duration / 2) if side == 0 else (duration / 2, duration)
+            else:
+                start, end = 0, duration
+            plays = max(0, round(rng.gauss(mean, spread)))
+            minutes = sorted(rng.uniform(start, end) for _ in range(plays))
+            points = list(accumulate(rng.choice(profile['points']) for _ in range(plays)))
+            sides.append((minutes, points))
+        return sides
+
+    def fixture_state(self, fixture, now):
+        """
+        Status and score of a fixture at a moment in time
+
+        Returns:
+            dict: 'status' (Scheduled, LIVE or COMPLETED), plus 'home_score',
+            'away_score' and 'minute' once it has kicked off
+        """
+        elapsed = (now - fixture['kickoff']).total_seconds() / 60
+        if elapsed < 0:
+            return {'status': 'Scheduled'}
+        duration = SPORT_PROFILES[fixture['sport']]['duration']
+        minute = min(elapsed, duration)
+        scores = []
+        for minutes, points in self._timeline(fixture['id'], fixture['sport']):
+            played = bisect_right(minutes, minute)
+            scores.append(points[played - 1] if played else 0)
+        return {
+            'status': 'COMPLETED' if elapsed >= duration else 'LIVE',
+            'home_score': scores[0],
+            'away_score': scores[1],
+            'minute': int(minute)
+        }
+
+    def events(self, sport=None, now=None):
+        """
+        Fixtures as app events with their status and score at `now`
+
+        Args:
+            sport (str): Only fixtures of this sport; None or 'all' for every sport
+            now (datetime): Moment to evaluate scores at, default the current time
+
+        Returns:
+            list: Event dictionaries in kickoff order
+        """
+        now = now or datetime.now(timezone.utc)
+        return [self._event(fixture, now) for fixture in self.fixtures
+                if not sport or sport == 'all' or fixture['sport'] == sport]
+
+    def events_by_id(self, event_ids, now=None):
+        """
+        Current state of the given fixtures, e.g. for the live poller
+
+        Args:
+            event_ids (iterable): Event ids; unknown ids are skipped
+            now (datetime): Moment to evaluate scores at, default the current time
+
+        Returns:
+            list: Event dictionaries
+        """
+        now = now or datetime.now(timezone.utc)
+        by_id = self.fixtures_by_id
+        return [self._event(by_id[event_id], now) for event_id in event_ids if event_id in by_id]
+
+    def _event(self, fixture, now):
+        event = {
+            'id': fixture['id'],
+            'date': fixture['kickoff'].strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'home_team': fixture['home_team'],
+            'away_team': fixture['away_team'],
+            'competition': fixture['competition'],
+            'venue': f"{fixture['city']} Stadium",
+            'location': fixture['city'],
+            'sport': fixture['sport'],
+            'provider': 'demo'
+        }
+        state = self.fixture_state(fixture, now)
+        event.update(state)
+        if state['status'] != 'Scheduled':
+            event['scores'] = f"{state['home_score']} - {state['away_score']}"
+        return event
+
+
+# Engine behind API_PROVIDER=demo, rebuilt when the day changes
+demo_engine = None
+demo_engine_lock = threading.Lock()
+
+
+def get_demo_engine():
+    """The shared engine configured from the DEMO_* settings, anchored to today (UTC)"""
+    global demo_engine
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    with demo_engine_lock:
+        if demo_engine is None or demo_engine.anchor != today:
+            demo_engine = DemoDataEngine(anchor=today)
+        return demo_engine
+
+
+def get_demo_data(sport_type='all'):
+    """
+    Events from the demo engine, the network-free stand-in provider
+
+    Args:
+        sport_type (str): Sport to return, or 'all'
+
+    Returns:
+        list: Event dictionaries
+    """
+    return get_demo_engine().events(sport_type.lower())
@@ -0,0 +1,302 @@
+import os
+import json
+import time
+import base64
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timezone
+
+# Page size limits for page_events
+DEFAULT_PAGE_LIMIT = 20
+MAX_PAGE_LIMIT = 200
+
+# Events read per lock acquisition by iter_events
+ITER_CHUNK_SIZE = 500
+
+# Events with no parsable date sort after everything else
+UNDATED_TIMESTAMP = float('inf')
+
+# Events that kicked off this long ago (seconds) may still be running, so
+# listings of upcoming events start this far back
+UPCOMING_LOOKBACK = int(os.getenv('UPCOMING_LOOKBACK', str(12 * 3600)))
+
+# Normalized events, kept ordered by (start timestamp, id) overall and per sport
+event_store = {
+    'events': {},          # event id -> event as served (after prepare)
+    'raw': {},             # event id -> event as received, for change detection
+    'keys': {},            # event id -> (start timestamp, event id)
+    'order': [],           # sorted (start timestamp, event id) for every event
+    'order_by_sport': {}   # sport -> sorted (start timestamp, event id)
+}
+event_store_lock = threading.RLock()
+
+# Bumped on every change to the store, so views read from it can tell they
+# are stale without comparing events
+event_store_state = {'version': 0}
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def event_timestamp(event):
+    """
+    Start time of an event as a UTC unix timestamp
+
+    Returns:
+        float: Seconds since the epoch, or UNDATED_TIMESTAMP if the date is missing or invalid
+    """
+    date_str = event.get('date', '')
+    if not date_str:
+        return UNDATED_TIMESTAMP
+    try:
+        dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except ValueError:
+        return UNDATED_TIMESTAMP
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def event_sort_key(event):
+    """The (start timestamp, id) key events are ordered by"""
+    return (event_timestamp(event), str(event.get('id', '')))
+
+
+def _remove_key(order, key):
+    position = bisect_left(order, key)
+    if position < len(order) and order[position] == key:
+        del order[position]
+
+
+def upsert_events(events, prepare=None):
+    """
+    Insert new events and replace existing ones with the same id
+
+    Events identical to the version received last time are skipped, so
+    only changed events are re-keyed and re-prepared.
+
+    Args:
+        events (list): Event dictionaries with an 'id'
+        prepare (callable): Called with a copy of each new or changed event
+            to add derived fields before it is stored
+
+    Returns:
+        list: Ids of events that were added or whose content changed
+    """
+    changed = []
+    with event_store_lock:
+        stored = event_store['events']
+        raw = event_store['raw']
+        keys = event_store['keys']
+        for event in events:
+            event_id = event.get('id')
+            if not event_id:
+                continue
+            event_id = str(event_id)
+            previous = raw.get(event_id)
+            if previous == event:
+                continue
+
+            key = event_sort_key(event)
+            sport = event.get('sport', 'unknown')
+            old_key = keys.get(event_id)
+            old_sport = previous.get('sport', 'unknown') if previous else None
+
+            if old_key != key or old_sport != sport:
+                if old_key is not None:
+                    _remove_key(event_store['order'], old_key)
+                    _remove_key(event_store['order_by_sport'].get(old_sport, []), old_key)
+                insort(event_store['order'], key)
+                insort(event_store['order_by_sport'].setdefault(sport, []), key)
+                keys[event_id] = key
+
+            raw[event_id] = event
+            if prepare is not None:
+                event = dict(event)
+                prepare(event)
+            stored[event_id] = event
+            changed.append(event_id)
+        if changed:
+            event_store_state['version'] += 1
+    return changed
+
+
+def remove_events(event_ids):
+    """Drop events from the store"""
+    with event_store_lock:
+        for event_id in event_ids:
+            event_id = str(event_id)
+            event = event_store['raw'].pop(event_id, None)
+            event_store['events'].pop(event_id, None)
+            key = event_store['keys'].pop(event_id, None)
+            if key is None:
+                continue
+            _remove_key(event_store['order'], key)
+            _remove_key(event_store['order_by_sport'].get(event.get('sport', 'unknown'), []), key)
+            event_store_state['version'] += 1
+
+
+def store_version():
+    """Version of the store, changed by every upsert or removal that changes an event"""
+    return event_store_state['version']
+
+
+def upcoming_since(now=None):
+    """Where listings of upcoming events start: UPCOMING_LOOKBACK before now, as a UTC unix timestamp"""
+    return (now or time.time()) - UPCOMING_LOOKBACK
+
+
+def get_event(event_id):
+    """Look up a stored event by id"""
+    return event_store['events'].get(str(event_id))
+
+
+def events_in_range(sport=None, start_timestamp=None, end_timestamp=None):
+    """
+    Stored events starting within [start_timestamp, end_timestamp), in order
+
+    Args:
+        sport (str): Only events of this sport
+        start_timestamp (float): Inclusive lower bound, None for no bound
+        end_timestamp (float): Exclusive upper bound, None for no bound
+
+    Returns:
+        list: Event dictionaries
+    """
+    with event_store_lock:
+        order = event_store['order_by_sport'].get(sport, []) if sport else event_store['order']
+        start = bisect_left(order, (start_timestamp, '')) if start_timestamp is not None else 0
+        end = bisect_left(order, (end_timestamp, '')) if end_timestamp is not None else len(order)
+        stored = event_store['events']
+        return [stored[key[1]] for key in order[start:end]]
+
+
+def iter_events(sport=None, start_timestamp=None, chunk_size=ITER_CHUNK_SIZE):
+    """
+    Every stored event starting at or after start_timestamp, in order
+
+    The store is read chunk_size events at a time, each chunk under the lock
+    and resuming after the last key of the previous one, so a slow consumer
+    neither copies the store nor blocks refreshes while it reads. Events
+    that change meanwhile are seen as they are when their chunk is read.
+
+    Args:
+        sport (str): Only events of this sport
+        start_timestamp (float): Inclusive lower bound, None for no bound
+        chunk_size (int): Events read per lock acquisition
+
+    Yields:
+        dict: Event dictionaries
+    """
+    last_key = None
+    while True:
+        with event_store_lock:
+            order = event_store['order_by_sport'].get(sport, []) if sport else event_store['order']
+            if last_key is not None:
+                position = bisect_right(order, last_key)
+            elif start_timestamp is not None:
+                position = bisect_left(order, (start_timestamp, ''))
+            else:
+                position = 0
+            keys = order[position:position + chunk_size]
+            stored = event_store['events']
+            chunk = [stored[key[1]] for key in keys]
+        if not chunk:
+            return
+        yield from chunk
+        last_key = keys[-1]
+
+
+def ordered_events(event_ids):
+    """
+    Stored events for the given ids in (start time, id) order
+
+    Sorts the precomputed keys, so no dates are parsed. Unknown ids are skipped.
+    """
+    with event_store_lock:
+        keys = event_store['keys']
+        ordered = sorted(keys[event_id] for event_id in {str(event_id) for event_id in event_ids}
+                         if event_id in keys)
+        stored = event_store['events']
+        return [stored[key[1]] for key in ordered]
+
+
+def encode_cursor(key):
+    """Encode a (timestamp, id) key as an opaque URL-safe cursor"""
+    timestamp, event_id = key
+    payload = json.dumps([None if timestamp == UNDATED_TIMESTAMP else timestamp, event_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by encode_cursor
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        timestamp, event_id = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        if timestamp is None:
+            timestamp = UNDATED_TIMESTAMP
+        return (float(timestamp), str(event_id))
+    except (ValueError, TypeError, UnicodeDecodeError):
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+
+
+def page_events(limit=DEFAULT_PAGE_LIMIT, cursor=None, sport=None, competition=None, start_timestamp=None):
+    """
+    Return one page of stored events in start time order
+
+    Args:
+        limit (int): Events per page, capped at MAX_PAGE_LIMIT
+        cursor (str): next_cursor from the previous page, or None for the first page
+        sport (str): Only events of this sport
+        competition (str): Only events of this competition (case-insensitive)
+        start_timestamp (float): Where the first page starts (inclusive), None
+            for the oldest event; later pages follow their cursor
+
+    Returns:
+        dict: 'events' and 'next_cursor' (None on the last page)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    limit = max(1, min(limit, MAX_PAGE_LIMIT))
+    after_key = decode_cursor(cursor) if cursor else None
+    competition = competition.lower() if competition else None
+
+    page = []
+    last_key = None
+    has_more = False
+    with event_store_lock:
+        if sport:
+            order = event_store['order_by_sport'].get(sport.lower(), [])
+        else:
+            order = event_store['order']
+        if after_key:
+            position = bisect_right(order, after_key)
+        elif start_timestamp is not None:
+            position = bisect_left(order, (start_timestamp, ''))
+        else:
+            position = 0
+
+        stored = event_store['events']
+        while position < len(order):
+            key = order[position]
+            position += 1
+            event = stored[key[1]]
+            if competition and (event.get('competition') or '').lower() != competition:
+                continue
+            if len(page) == limit:
+                has_more = True
+                break
+            page.append(event)
+            last_key = key
+
+    return {
+        'events': page,
+        'next_cursor': encode_cursor(last_key) if has_more else None
+    }
@@ -0,0 +1,124 @@
+import io
+import csv
+import json
+from datetime import datetime, timezone
+from .event_store import iter_events
+
+# Columns of the CSV export; NDJSON carries every field of the stored event
+CSV_COLUMNS = [
+    'id', 'sport', 'provider', 'competition', 'home_team', 'away_team', 'date', 'timestamp',
+    'status', 'home_score', 'away_score', 'venue', 'location'
+]
+
+# Events written per chunk of the response body
+EXPORT_FLUSH_EVENTS = 200
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+
+class InvalidExportError(ValueError):
+    """Raised when export parameters cannot be used"""
+
+
+def parse_since(value):
+    """
+    Lower bound of an export's start times
+
+    Args:
+        value (str): UTC unix timestamp or ISO 8601 date/time; a time without
+            a zone is taken as UTC
+
+    Returns:
+        float: UTC unix timestamp, or None if no value was given
+
+    Raises:
+        InvalidExportError: If the value is neither
+    """
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        raise InvalidExportError(f"since must be a unix timestamp or ISO 8601 date: {value}")
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def export_ndjson(events):
+    """
+    One JSON object per line, written in chunks of EXPORT_FLUSH_EVENTS
+
+    Args:
+        events (iterable): Events, e.g. from iter_events
+
+    Yields:
+        str: Chunks of the response body
+    """
+    lines = []
+    for event in events:
+        lines.append(json.dumps(event, separators=(',', ':')))
+        if len(lines) == EXPORT_FLUSH_EVENTS:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+
+def export_csv(events):
+    """
+    A header row and one row per event with CSV_COLUMNS, written in chunks
+
+    Args:
+        events (iterable): Events, e.g. from iter_events
+
+    Yields:
+        str: Chunks of the response body
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_COLUMNS, extrasaction='ignore')
+    writer.writeheader()
+    rows = 0
+    for event in events:
+        writer.writerow(event)
+        rows += 1
+        if rows == EXPORT_FLUSH_EVENTS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def export_events(export_format='ndjson', sport=None, since=None):
+    """
+    Stream the whole event store in a format
+
+    Memory use does not depend on the size of the store: events are read
+    from it chunk by chunk as the body is sent.
+
+    Args:
+        export_format (str): 'ndjson' or 'csv'
+        sport (str): Only events of this sport
+        since (str): Only events starting at or after this time (see parse_since)
+
+    Returns:
+        tuple: (generator of body chunks, mimetype)
+
+    Raises:
+        InvalidExportError: If the format or since is invalid
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise InvalidExportError(f"format must be one of {', '.join(EXPORT_FORMATS)}")
+    # Parsed before the response starts, so a bad value is still a 400
+    events = iter_events(sport=sport.lower() if sport else None, start_timestamp=parse_since(since))
+    writer = export_csv if export_format == 'csv' else export_ndjson
+    return writer(events), EXPORT_FORMATS[export_format]
@@ -0,0 +1,84 @@
+import os
+
+# Lifecycle phases of a fixture
+SCHEDULED = 'scheduled'
+LIVE = 'live'
+FINISHED = 'finished'
+
+# Refresh settings (seconds): live fixtures are polled every LIVE_POLL_INTERVAL,
+# fixtures kicking off within KICKOFF_WINDOW every KICKOFF_POLL_INTERVAL;
+# anything else is left to the hourly refresh of get_sports_data
+LIVE_POLL_INTERVAL = float(os.getenv('LIVE_POLL_INTERVAL', '5'))
+KICKOFF_POLL_INTERVAL = float(os.getenv('KICKOFF_POLL_INTERVAL', '60'))
+KICKOFF_WINDOW = float(os.getenv('KICKOFF_WINDOW', '1800'))
+
+# How long a fixture usually lasts, including breaks (seconds). Used to infer
+# the phase when a provider's status lags behind the clock, and to bound how
+# far back the poller looks for fixtures that may still be running.
+FIXTURE_DURATION = {
+    'football': 2 * 3600,
+    'basketball': int(2.5 * 3600),
+    'cricket': 4 * 3600
+}
+DEFAULT_FIXTURE_DURATION = 3 * 3600
+MAX_FIXTURE_DURATION = max(DEFAULT_FIXTURE_DURATION, *FIXTURE_DURATION.values())
+
+# Provider status texts (lower case) by phase
+FINISHED_STATUSES = {
+    'completed', 'final', 'finished', 'match finished', 'ft', 'aet', 'pen',
+    'match finished after extra time', 'match finished after penalty', 'ended', 'result'
+}
+LIVE_STATUSES = {
+    'live', 'in progress', 'in play', 'first half', 'second half', 'halftime', 'half time', 'ht',
+    '1h', '2h', 'et', 'extra time', 'penalty in progress', 'break time', 'innings break'
+}
+# Statuses that mean the fixture will not be played at the scheduled time
+CANCELLED_STATUSES = {'postponed', 'cancelled', 'canceled', 'abandoned', 'match postponed', 'match cancelled'}
+
+
+def fixture_phase(event, now):
+    """
+    Lifecycle phase of a fixture
+
+    The provider's status wins when it is conclusive. Otherwise the phase is
+    inferred from the clock: a fixture that has kicked off is live until its
+    usual duration has passed.
+
+    Args:
+        event (dict): Event with 'status', 'sport' and 'timestamp'
+        now (float): Current UTC unix timestamp
+
+    Returns:
+        str: SCHEDULED, LIVE or FINISHED
+    """
+    status = str(event.get('status') or '').strip().lower()
+    if status in FINISHED_STATUSES or status in CANCELLED_STATUSES:
+        return FINISHED
+    if status in LIVE_STATUSES:
+        return LIVE
+
+    kickoff = event.get('timestamp')
+    if kickoff is None or now < kickoff:
+        return SCHEDULED
+    if now < kickoff + FIXTURE_DURATION.get(event.get('sport'), DEFAULT_FIXTURE_DURATION):
+        return LIVE
+    return FINISHED
+
+
+def poll_interval(event, now):
+    """
+    How often a fixture should be refreshed from its provider right now
+
+    Args:
+        event (dict): Event with 'status', 'sport' and 'timestamp'
+        now (float): Current UTC unix timestamp
+
+    Returns:
+        float: Seconds between polls, or None if the fixture needs no polling
+    """
+    phase = fixture_phase(event, now)
+    if phase == LIVE:
+        return LIVE_POLL_INTERVAL
+    if phase == SCHEDULED and event.get('timestamp') is not None and event['timestamp'] - now <= KICKOFF_WINDOW:
+        return KICKOFF_POLL_INTERVAL
+    return None
@@ -0,0 +1,233 @@
+import os
+import re
+import itertools
+import threading
+import unicodedata
+from functools import lru_cache
+from .event_store import event_timestamp, UNDATED_TIMESTAMP
+
+# Providers in order of trust: when two providers report the same fixture,
+# fields of the earlier one win. Events without a provider (generated
+# fallback data) rank below all of them.
+PROVIDER_PRIORITY = [name.strip() for name in
+                     os.getenv('PROVIDER_PRIORITY', 'balldontlie,api-football,cricapi,thesportsdb,demo').split(',')
+                     if name.strip()]
+
+# Two reports of the same teams in the same sport are one fixture when their
+# kickoffs are at most this far apart (seconds). Generous, because some
+# providers only give a date (midnight UTC) or a local time without a zone.
+FIXTURE_MATCH_WINDOW = int(os.getenv('FIXTURE_MATCH_WINDOW', str(12 * 3600)))
+
+# Words that do not tell teams apart: 'Arsenal FC' and 'Arsenal' are the same club
+TEAM_NAME_NOISE = {'fc', 'afc', 'cf', 'sc', 'ac', 'the', 'club', 'de'}
+
+# Every report stored so far, grouped into fixtures as reports arrive, so a
+# new or changed report is matched against the existing fixtures without
+# regrouping the rest. A fixture's id is the id of its primary report.
+fixture_registry = {
+    'reports': {},      # report id -> report as received
+    'group_of': {},     # report id -> id of the group it belongs to
+    'groups': {},       # group id -> {'reports', 'kickoff', 'slot', 'fixture_id'}
+    'slots': {},        # (sport, teams, bucket) -> ids of the groups in that bucket
+    'by_fixture': {}    # fixture id -> group id
+}
+# Held across a registry change and the store writes that follow it
+fixture_registry_lock = threading.RLock()
+
+_group_ids = itertools.count()
+
+
+@lru_cache(maxsize=4096)
+def normalize_team(name):
+    """
+    Comparable form of a team name: ASCII, lower case, no punctuation or club suffixes
+
+    'Atlético de Madrid' and 'Atletico Madrid' both become 'atletico madrid'.
+    """
+    ascii_name = unicodedata.normalize('NFKD', name or '').encode('ascii', 'ignore').decode('ascii')
+    words = re.findall(r'[a-z0-9]+', ascii_name.lower())
+    return ' '.join(word for word in words if word not in TEAM_NAME_NOISE)
+
+
+def _priority(event):
+    provider = event.get('provider')
+    return PROVIDER_PRIORITY.index(provider) if provider in PROVIDER_PRIORITY else len(PROVIDER_PRIORITY)
+
+
+def _merge(reports):
+    """One event from several reports of a fixture, by provider priority"""
+    reports = sorted(reports, key=_priority)
+    merged = {}
+    # Lowest priority first, so every field is overwritten by better sources;
+    # missing values never overwrite known ones
+    for report in reversed(reports):
+        merged.update((key, value) for key, value in report.items() if value not in (None, '', 'Unknown'))
+    merged['id'] = reports[0]['id']
+    merged['provider'] = reports[0].get('provider')
+    merged['sources'] = [report['provider'] for report in reports if report.get('provider')]
+    return merged
+
+
+def new_registry():
+    """An empty registry shaped like fixture_registry"""
+    return {'reports': {}, 'group_of': {}, 'groups': {}, 'slots': {}, 'by_fixture': {}}
+
+
+def _slot(report):
+    """(sport, teams, bucket) of a dated report and its kickoff timestamp, or (None, UNDATED_TIMESTAMP)"""
+    timestamp = event_timestamp(report)
+    if timestamp == UNDATED_TIMESTAMP:
+        return None, timestamp
+    teams = tuple(sorted((normalize_team(report.get('home_team')), normalize_team(report.get('away_team')))))
+    return (report.get('sport'), teams, int(timestamp // FIXTURE_MATCH_WINDOW)), timestamp
+
+
+def _place(report_id, registry):
+    """Add a report to the group of its fixture, or to a new group; returns the group id"""
+    reports = registry['reports']
+    report = reports[report_id]
+    slot, timestamp = _slot(report)
+    if slot is not None:
+        sport, teams, bucket = slot
+        for candidate_bucket in (bucket, bucket - 1, bucket + 1):
+            for group_id in registry['slots'].get((sport, teams, candidate_bucket), ()):
+                group = registry['groups'][group_id]
+                if (abs(group['kickoff'] - timestamp) <= FIXTURE_MATCH_WINDOW
+                        and all(reports[member].get('provider') != report.get('provider')
+                                for member in group['reports'])):
+                    group['reports'].append(report_id)
+                    registry['group_of'][report_id] = group_id
+                    return group_id
+
+    group_id = next(_group_ids)
+    registry['groups'][group_id] = {'reports': [report_id], 'kickoff': timestamp, 'slot': slot, 'fixture_id': None}
+    if slot is not None:
+        registry['slots'].setdefault(slot, []).append(group_id)
+    registry['group_of'][report_id] = group_id
+    return group_id
+
+
+def _detach(report_id, registry, touched, dropped):
+    """
+    Take a report out of its group
+
+    The group is dissolved and its other reports placed again, since the
+    report may have been what held them together.
+    """
+    group_id = registry['group_of'].pop(report_id)
+    group = registry['groups'].pop(group_id)
+    touched.pop(group_id, None)
+    if group['slot'] is not None:
+        registry['slots'][group['slot']].remove(group_id)
+        if not registry['slots'][group['slot']]:
+            del registry['slots'][group['slot']]
+    if group['fixture_id'] is not None:
+        registry['by_fixture'].pop(group['fixture_id'], None)
+        dropped.add(group['fixture_id'])
+    for member in group['reports']:
+        if member != report_id:
+            del registry['group_of'][member]
+            touched[_place(member, registry)] = True
+
+
+def _settle(registry, touched, dropped):
+    """Merged fixtures of the touched groups, and the fixture ids that no longer exist"""
+    fixtures = []
+    for group_id in touched:
+        group = registry['groups'][group_id]
+        reports = [registry['reports'][member] for member in group['reports']]
+        fixture = reports[0] if len(reports) == 1 else _merge(reports)
+        fixture_id = str(fixture['id'])
+        if group['fixture_id'] not in (None, fixture_id):
+            registry['by_fixture'].pop(group['fixture_id'], None)
+            dropped.add(group['fixture_id'])
+        group['fixture_id'] = fixture_id
+        registry['by_fixture'][fixture_id] = group_id
+        fixtures.append(fixture)
+    removed = [fixture_id for fixture_id in dropped if fixture_id not in registry['by_fixture']]
+    return fixtures, removed
+
+
+def apply_reports(reports, registry=None):
+    """
+    Add new and changed reports to the fixtures they belong to
+
+    A fixture's key is its sport, the normalized pair of team names (in
+    either order) and its kickoff bucket, FIXTURE_MATCH_WINDOW wide. Each
+    report is hashed on that key; the lookup also checks the two
+    neighbouring buckets so kickoffs straddling a bucket edge still match.
+    Reports from the same provider are never merged with each other.
+    Reports identical to the stored version are skipped.
+
+    Args:
+        reports (list): Event dictionaries with an 'id', from any provider
+        registry (dict): Registry to update, defaults to fixture_registry
+
+    Returns:
+        tuple: (fixtures, removed) - the merged fixtures that are new or may
+        have changed, and the ids of fixtures that no longer exist
+    """
+    registry = fixture_registry if registry is None else registry
+    touched = {}    # group ids in the order they were touched
+    dropped = set()
+    for report in reports:
+        report_id = report.get('id')
+        if not report_id:
+            continue
+        report_id = str(report_id)
+        if registry['reports'].get(report_id) == report:
+            continue
+        if report_id in registry['group_of']:
+            _detach(report_id, registry, touched, dropped)
+        registry['reports'][report_id] = report
+        touched[_place(report_id, registry)] = True
+    return _settle(registry, touched, dropped)
+
+
+def withdraw_reports(report_ids, registry=None):
+    """
+    Remove reports from the fixtures they belong to
+
+    Args:
+        report_ids (iterable): Ids of the reports to remove; unknown ids are skipped
+        registry (dict): Registry to update, defaults to fixture_registry
+
+    Returns:
+        tuple: (fixtures, removed) as returned by apply_reports
+    """
+    registry = fixture_registry if registry is None else registry
+    touched = {}
+    dropped = set()
+    for report_id in report_ids:
+        report_id = str(report_id)
+        if report_id in registry['group_of']:
+            _detach(report_id, registry, touched, dropped)
+            del registry['reports'][report_id]
+    return _settle(registry, touched, dropped)
+
+
+def fixture_reports(fixture_id, registry=None):
+    """The reports merged into a fixture, empty if it is unknown"""
+    registry = fixture_registry if registry is None else registry
+    group_id = registry['by_fixture'].get(str(fixture_id))
+    if group_id is None:
+        return []
+    return [registry['reports'][report_id] for report_id in registry['groups'][group_id]['reports']]
+
+
+def merge_duplicate_fixtures(events):
+    """
+    Collapse reports of the same fixture from different providers into one event
+
+    Groups the events on a registry of their own, the way apply_reports
+    groups stored reports.
+
+    Args:
+        events (list): Events from every provider, in any order
+
+    Returns:
+        list: Events in their original order with duplicates merged into the
+        first occurrence
+    """
+    fixtures, _ = apply_reports(events, registry=new_registry())
+    return fixtures
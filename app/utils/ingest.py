@@ -0,0 +1,213 @@
+import os
+import hmac
+import json
+import math
+from datetime import datetime, timezone
+from .logging_config import get_logger
+from .metrics import counter
+from .event_store import event_timestamp, UNDATED_TIMESTAMP
+from .sports_api import feed_events
+
+logger = get_logger(__name__)
+
+# Who may push events: comma-separated name:token pairs. The name is the
+# provider of every event a token pushes and prefixes their ids, so a pusher
+# can neither pass its events off as a polled provider's nor replace them.
+# Ingest is off when empty.
+INGEST_TOKENS = dict(
+    pair.strip().split(':', 1) for pair in os.getenv('INGEST_TOKENS', '').split(',') if ':' in pair
+)
+
+# Events are validated as they are read and stored this many at a time, so
+# a large NDJSON load never sits in memory and its first events are live
+# while the rest is still uploading
+INGEST_BATCH_SIZE = int(os.getenv('INGEST_BATCH_SIZE', '500'))
+MAX_LINE_BYTES = 64 * 1024
+# Rejected lines reported back in the response; the rest are only counted
+MAX_REPORTED_ERRORS = 20
+
+REQUIRED_FIELDS = ('id', 'sport', 'home_team', 'away_team', 'date')
+TEXT_FIELDS = ('competition', 'venue', 'location', 'status', 'scores', 'score')
+NUMBER_FIELDS = ('home_score', 'away_score', 'minute')
+
+ingest_events = counter(
+    'ingest_events',
+    'Events received through /api/ingest, by source and outcome',
+    ('source', 'outcome')
+)
+
+
+class IngestError(ValueError):
+    """Raised when a pushed record or payload is not usable"""
+
+
+def authenticate(header_value):
+    """
+    Source name of an ingest token
+
+    Args:
+        header_value (str): 'Bearer <token>' or the bare token
+
+    Returns:
+        str: The source the token belongs to, or None if it is unknown
+    """
+    if not header_value:
+        return None
+    token = header_value[7:] if header_value.lower().startswith('bearer ') else header_value
+    token = token.strip()
+    source = None
+    # Compare against every token so the time taken does not reveal a match
+    for name, expected in INGEST_TOKENS.items():
+        if hmac.compare_digest(token.encode(), expected.strip().encode()):
+            source = name.strip()
+    return source
+
+
+def validate_event(record, source):
+    """
+    Normalized event from a pushed record
+
+    Only known fields are kept; the date is rewritten as UTC ISO 8601 so it
+    sorts and renders like provider events. The id is scoped to the source
+    ('<source>:<id>'), so pushed events only ever update the same source's.
+
+    Args:
+        record (dict): Decoded JSON record
+        source (str): Authenticated source name
+
+    Returns:
+        dict: The event, ready for the event store
+
+    Raises:
+        IngestError: If a required field is missing or a field has the wrong type
+    """
+    if not isinstance(record, dict):
+        raise IngestError('record must be a JSON object')
+    missing = [field for field in REQUIRED_FIELDS if record.get(field) in (None, '')]
+    if missing:
+        raise IngestError(f"missing {', '.join(missing)}")
+
+    timestamp = event_timestamp({'date': str(record['date'])})
+    if timestamp == UNDATED_TIMESTAMP:
+        raise IngestError(f"date is not ISO 8601: {record['date']}")
+
+    event = {
+        'id': f"{source}:{record['id']}",
+        'sport': str(record['sport']).strip().lower(),
+        'home_team': str(record['home_team']).strip(),
+        'away_team': str(record['away_team']).strip(),
+        'date': datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'provider': source
+    }
+    for field in TEXT_FIELDS:
+        if record.get(field) is not None:
+            event[field] = str(record[field])
+    for field in NUMBER_FIELDS:
+        value = record.get(field)
+        if value is None:
+            continue
+        # json.loads accepts NaN and Infinity, which no score can be
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            raise IngestError(f"{field} must be a finite number")
+        event[field] = value
+    return event
+
+
+def read_ndjson(stream):
+    """
+    Records of an NDJSON body, read one line at a time
+
+    Args:
+        stream: File-like request body
+
+    Yields:
+        tuple: (line number, decoded record or IngestError)
+    """
+    line_number = 0
+    while True:
+        line = stream.readline(MAX_LINE_BYTES + 1)
+        if not line:
+            return
+        line_number += 1
+        if len(line) > MAX_LINE_BYTES and not line.endswith(b'\n'):
+            # Skip the rest of the oversized line
+            while line and not line.endswith(b'\n'):
+                line = stream.readline(MAX_LINE_BYTES)
+            yield line_number, IngestError(f"line longer than {MAX_LINE_BYTES} bytes")
+            continue
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as e:
+            yield line_number, IngestError(f"invalid JSON: {e}")
+
+
+def read_webhook(payload):
+    """
+    Records of a JSON webhook body: one event, a list, or {"events": [...]}
+
+    Yields:
+        tuple: (position, record)
+
+    Raises:
+        IngestError: If the payload has none of those shapes
+    """
+    if isinstance(payload, dict) and isinstance(payload.get('events'), list):
+        records = payload['events']
+    elif isinstance(payload, list):
+        records = payload
+    elif isinstance(payload, dict):
+        records = [payload]
+    else:
+        raise IngestError('payload must be an event, a list of events or {"events": [...]}')
+    for position, record in enumerate(records, 1):
+        yield position, record
+
+
+def ingest_records(records, source, emit=None):
+    """
+    Validate and store pushed records in batches, notifying subscribers of changes
+
+    Args:
+        records (iterable): (line number, record or IngestError) pairs
+        source (str): Authenticated source name
+        emit (callable): Called as emit(changed events) after each stored batch
+
+    Returns:
+        dict: Counts of received, accepted, changed and rejected records,
+        and the first MAX_REPORTED_ERRORS errors by line
+    """
+    summary = {'received': 0, 'accepted': 0, 'changed': 0, 'rejected': 0, 'errors': []}
+    batch = []
+
+    def flush():
+        changed = feed_events(batch)
+        summary['changed'] += len(changed)
+        batch.clear()
+        if changed and emit is not None:
+            emit(changed)
+
+    for line_number, record in records:
+        summary['received'] += 1
+        try:
+            if isinstance(record, IngestError):
+                raise record
+            batch.append(validate_event(record, source))
+            summary['accepted'] += 1
+        except IngestError as e:
+            summary['rejected'] += 1
+            if len(summary['errors']) < MAX_REPORTED_ERRORS:
+                summary['errors'].append({'line': line_number, 'error': str(e)})
+            continue
+        if len(batch) >= INGEST_BATCH_SIZE:
+            flush()
+    if batch:
+        flush()
+
+    ingest_events.inc(summary['accepted'], source=source, outcome='accepted')
+    ingest_events.inc(summary['rejected'], source=source, outcome='rejected')
+    logger.info("Ingested %d events from %s (%d changed, %d rejected)",
+                summary['accepted'], source, summary['changed'], summary['rejected'])
+    return summary
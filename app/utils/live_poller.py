@@ -0,0 +1,248 @@
+import os
+import time
+import tempfile
+import threading
+from .logging_config import get_logger
+from .metrics import counter
+from .event_store import events_in_range, get_event, event_timestamp
+from .fixture_lifecycle import poll_interval, MAX_FIXTURE_DURATION, KICKOFF_WINDOW
+from .shared_state import shared_lease, shared_snapshot
+from .socketio_config import SOCKETIO_MESSAGE_QUEUE
+from .sports_api import apply_live_updates, live_refreshers
+
+logger = get_logger(__name__)
+
+# Poller settings
+LIVE_POLLER_ENABLED = os.getenv('LIVE_POLLER_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+LIVE_POLLER_TICK = float(os.getenv('LIVE_POLLER_TICK', '1'))  # seconds between scans for due fixtures
+
+# Only one process per deployment polls; the others wait to take over. With
+# REDIS_URL the lease is a Redis key shared by every instance, renewed each
+# tick and expiring LIVE_POLLER_LEASE_TTL seconds after its holder stops.
+# Without Redis it is an exclusive lock on a file, shared by the workers of
+# one host and released when the holder exits.
+LIVE_POLLER_REDIS_URL = os.getenv('REDIS_URL') or None
+LIVE_POLLER_LEASE_KEY = os.getenv('LIVE_POLLER_LEASE_KEY', 'sports-tracker:live-poller')
+LIVE_POLLER_LEASE_TTL = float(os.getenv('LIVE_POLLER_LEASE_TTL', '15'))
+LIVE_POLLER_LOCK_FILE = os.getenv('LIVE_POLLER_LOCK_FILE',
+                                  os.path.join(tempfile.gettempdir(), 'sports-tracker-live-poller.lock'))
+
+# The holder publishes the reports it refreshed to a snapshot in Redis (or,
+# without Redis, a file next to the lock), and every other process applies
+# them to its own event store within a tick
+LIVE_UPDATES_KEY = os.getenv('LIVE_UPDATES_KEY', 'sports-tracker:live-updates')
+LIVE_UPDATES_FILE = os.getenv('LIVE_UPDATES_FILE',
+                              os.path.join(tempfile.gettempdir(), 'sports-tracker-live-updates.json'))
+
+# Fixtures a provider still reports as live can overrun their usual
+# duration (extra time, rain delays), so look back twice as far
+LIVE_LOOKBACK = 2 * MAX_FIXTURE_DURATION
+
+# Socket.IO event carrying changed events to the browser
+EVENTS_UPDATED = 'events_updated'
+
+live_poll_requests = counter(
+    'live_poll_requests',
+    'Provider refreshes made by the live poller',
+    ('provider', 'outcome')
+)
+
+# When each fixture is next due (event id -> unix timestamp), the reports
+# in the live updates snapshot (report id -> report) and the process the
+# poller runs in (gunicorn forks workers from a preloaded master)
+poller_state = {'next_poll': {}, 'published': {}, 'pid': None}
+poller_lock = threading.Lock()
+
+
+def due_fixtures(now):
+    """
+    Fixtures that are live or about to kick off and are due for a refresh
+
+    Only the slice of the event store between LIVE_LOOKBACK ago and the
+    kickoff window ahead is scanned.
+
+    Args:
+        now (float): Current UTC unix timestamp
+
+    Returns:
+        dict: provider -> list of due events
+    """
+    next_poll = poller_state['next_poll']
+    due = {}
+    for event in events_in_range(start_timestamp=now - LIVE_LOOKBACK, end_timestamp=now + KICKOFF_WINDOW):
+        provider = event.get('provider')
+        if provider not in live_refreshers or poll_interval(event, now) is None:
+            continue
+        if next_poll.get(event['id'], 0) <= now:
+            due.setdefault(provider, []).append(event)
+    return due
+
+
+def poll_once(emit=None, now=None, publish=None):
+    """
+    Refresh every due fixture from its provider and store the results
+
+    Args:
+        emit (callable): Called as emit(EVENTS_UPDATED, payload) with the changed events
+        now (float): Current UTC unix timestamp, default the current time
+        publish (callable): Called with the refreshed reports, for the other processes
+
+    Returns:
+        list: Stored versions of the events that changed
+    """
+    now = now or time.time()
+    next_poll = poller_state['next_poll']
+    changed = []
+    for provider, events in due_fixtures(now).items():
+        try:
+            refreshed = live_refreshers[provider](events)
+            live_poll_requests.inc(provider=provider, outcome='success')
+        except Exception as e:
+            live_poll_requests.inc(provider=provider, outcome='error')
+            logger.warning("Live refresh from %s failed: %s", provider, e)
+            refreshed = []
+        changed.extend(apply_live_updates(refreshed))
+        if refreshed and publish is not None:
+            publish(refreshed)
+
+        # Schedule the next poll from the stored (possibly refreshed) state;
+        # fixtures that need no more polling are forgotten
+        for event in events:
+            current = get_event(event['id']) or event
+            interval = poll_interval(current, now)
+            if interval:
+                next_poll[event['id']] = now + interval
+            else:
+                next_poll.pop(event['id'], None)
+
+    if changed and emit is not None:
+        emit(EVENTS_UPDATED, {'events': changed})
+        logger.debug("Live poller: %s events changed", len(changed))
+    return changed
+
+
+def publish_live_updates(reports, snapshot, now=None):
+    """
+    Add refreshed reports to the live updates snapshot
+
+    The snapshot holds the latest report of every fixture refreshed in the
+    last LIVE_LOOKBACK seconds and is only written when one of them changed.
+
+    Args:
+        reports (list): Reports returned by the providers' live refreshers
+        snapshot: RedisSnapshot or FileSnapshot to write
+        now (float): Current UTC unix timestamp, default the current time
+    """
+    published = poller_state['published']
+    updated = False
+    for report in reports:
+        report_id = str(report['id'])
+        if published.get(report_id) != report:
+            published[report_id] = report
+            updated = True
+    if not updated:
+        return
+    bound = (now or time.time()) - LIVE_LOOKBACK
+    for report_id in [report_id for report_id, report in published.items() if event_timestamp(report) < bound]:
+        del published[report_id]
+    snapshot.publish({'events': list(published.values())})
+
+
+def sync_live_updates(snapshot, now=None):
+    """
+    Apply the lease holder's latest live updates snapshot to this process's
+    event store
+
+    Reports of fixtures that started more than LIVE_LOOKBACK seconds ago
+    are skipped, so a snapshot left over from an earlier run cannot roll
+    back fixtures refreshed since.
+
+    Args:
+        snapshot: RedisSnapshot or FileSnapshot to read
+        now (float): Current UTC unix timestamp, default the current time
+
+    Returns:
+        list: Stored versions of the events that changed
+    """
+    document = snapshot.read()
+    if not document:
+        return []
+    bound = (now or time.time()) - LIVE_LOOKBACK
+    reports = [report for report in document.get('events', []) if event_timestamp(report) >= bound]
+    # Kept so this process publishes them too if it takes the lease over
+    poller_state['published'] = {str(report['id']): report for report in reports}
+    return apply_live_updates(reports)
+
+
+def poller_lease():
+    """The lease deciding which process polls, per the settings above"""
+    return shared_lease(LIVE_POLLER_REDIS_URL, LIVE_POLLER_LEASE_KEY, LIVE_POLLER_LEASE_TTL, LIVE_POLLER_LOCK_FILE)
+
+
+def live_updates_snapshot():
+    """The snapshot carrying the holder's live updates to the other processes"""
+    return shared_snapshot(LIVE_POLLER_REDIS_URL, LIVE_UPDATES_KEY, LIVE_UPDATES_FILE)
+
+
+def run_live_poller(socketio):
+    """
+    Poll due fixtures forever while holding the poller lease, pushing
+    changes to every Socket.IO client
+
+    Processes without the lease apply the holder's live updates snapshot to
+    their own event store every tick, so their REST responses are as fresh
+    as the holder's, and check the lease, so one of them takes over within
+    a few seconds if the holder dies.
+    """
+    lease = poller_lease()
+    snapshot = live_updates_snapshot()
+    leading = False
+    while True:
+        if lease.acquire():
+            if not leading:
+                logger.info("Live poller polling in process %s", os.getpid())
+                # Start from a clean schedule: the previous holder's is gone
+                poller_state['next_poll'] = {}
+                leading = True
+            try:
+                poll_once(socketio.emit, publish=lambda reports: publish_live_updates(reports, snapshot))
+            except Exception:
+                logger.exception("Live poller iteration failed")
+        else:
+            if leading:
+                logger.warning("Live poller lease lost by process %s", os.getpid())
+                leading = False
+            try:
+                changed = sync_live_updates(snapshot)
+                # With a message queue the holder's emits already reach
+                # every client; without one they reach only its own
+                if changed and not SOCKETIO_MESSAGE_QUEUE:
+                    socketio.emit(EVENTS_UPDATED, {'events': changed})
+            except Exception:
+                logger.exception("Live updates sync failed")
+        socketio.sleep(LIVE_POLLER_TICK)
+
+
+def start_live_poller(socketio):
+    """
+    Start the live poller as a Socket.IO background task, once per process
+
+    Every process runs the task, but only the one holding the poller lease
+    polls providers, so fixtures are fetched once per deployment; the
+    others apply what it publishes.
+
+    Args:
+        socketio (SocketIO): Server used to run the task and emit updates
+
+    Returns:
+        bool: True if a poller was started
+    """
+    if not LIVE_POLLER_ENABLED:
+        return False
+    with poller_lock:
+        if poller_state['pid'] == os.getpid():
+            return False
+        poller_state['pid'] = os.getpid()
+        poller_state['next_poll'] = {}
+    socketio.start_background_task(run_live_poller, socketio)
+    return True
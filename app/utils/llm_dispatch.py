@@ -0,0 +1,316 @@
+import os
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dotenv import load_dotenv
+import requests
+from .logging_config import get_logger
+from .metrics import histogram
+
+# Load environment variables
+load_dotenv()
+
+logger = get_logger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets kept per provider
+LATENCY_BUCKETS = [0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0]
+
+# How many recent latencies are kept to estimate the hedge delay (p95)
+LATENCY_WINDOW = 200
+
+# Minimum samples before the observed p95 is trusted over the default delay
+MIN_HEDGE_SAMPLES = 20
+
+# Dispatch settings
+LLM_PROVIDER_ORDER = [name.strip() for name in os.getenv('LLM_PROVIDER_ORDER', 'openai,openrouter').split(',') if name.strip()]
+LLM_HEDGE_ENABLED = os.getenv('LLM_HEDGE_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+LLM_HEDGE_DEFAULT_DELAY = float(os.getenv('LLM_HEDGE_DEFAULT_DELAY', '3.0'))
+LLM_TOTAL_TIMEOUT = float(os.getenv('LLM_TOTAL_TIMEOUT', '20.0'))
+LLM_DISPATCH_WORKERS = int(os.getenv('LLM_DISPATCH_WORKERS', '8'))
+
+# Provider definitions - every provider speaks the OpenAI chat completions
+# protocol, so pointing the *_API_BASE variables at a local mock works too
+LLM_PROVIDERS = {
+    'openai': {
+        'name': 'openai',
+        'api_key': os.getenv('OPENAI_API_KEY', ''),
+        'api_base': os.getenv('OPENAI_API_BASE', 'https://api.openai.com/v1'),
+        'model': os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo'),
+        'timeout': float(os.getenv('OPENAI_TIMEOUT', '10.0')),
+        'extra_headers': {},
+        'extra_body': {'max_tokens': 150, 'temperature': 0.7}
+    },
+    'openrouter': {
+        'name': 'openrouter',
+        'api_key': os.getenv('OPENROUTER_API_KEY', ''),
+        'api_base': os.getenv('OPENROUTER_API_BASE', 'https://openrouter.ai/api/v1'),
+        'model': os.getenv('OPENROUTER_MODEL', 'deepseek/deepseek-r1:free'),
+        'timeout': float(os.getenv('OPENROUTER_TIMEOUT', '15.0')),
+        'extra_headers': {
+            "HTTP-Referer": "https://www.plantai.com",
+            "X-Title": "Plant AI"
+        },
+        'extra_body': {}
+    }
+}
+
+# Providers that failed the startup probe are skipped by dispatch_chat
+disabled_providers = set()
+
+# Latency histogram per provider, exported at /metrics
+llm_request_duration = histogram(
+    'llm_request_duration_seconds',
+    'Chat completion latency by LLM provider and outcome',
+    ('provider', 'outcome'),
+    buckets=LATENCY_BUCKETS
+)
+
+# Recent successful latencies per provider, used for the hedge delay
+recent_latency = {}
+recent_latency_lock = threading.Lock()
+
+# Shared pool for provider calls - losing hedged requests that already
+# started finish in the background, bounded by the provider timeout, and
+# their results are discarded
+dispatch_executor = ThreadPoolExecutor(max_workers=LLM_DISPATCH_WORKERS,
+                                       thread_name_prefix='llm-dispatch')
+
+
+def _new_executor_after_fork():
+    # Pool threads started in a preloading master are not copied into forked
+    # workers, so each worker gets a fresh pool
+    global dispatch_executor
+    dispatch_executor = ThreadPoolExecutor(max_workers=LLM_DISPATCH_WORKERS,
+                                           thread_name_prefix='llm-dispatch')
+
+
+os.register_at_fork(after_in_child=_new_executor_after_fork)
+
+
+class LLMProviderError(Exception):
+    """Raised when a single provider call fails or returns no usable content"""
+
+
+class LLMDispatchError(Exception):
+    """Raised when no provider produced a response before the deadline"""
+
+
+def get_active_providers():
+    """
+    Providers that have an API key and have not been disabled, in dispatch order
+
+    Returns:
+        list: Provider definition dictionaries
+    """
+    return [
+        LLM_PROVIDERS[name] for name in LLM_PROVIDER_ORDER
+        if name in LLM_PROVIDERS
+        and LLM_PROVIDERS[name]['api_key']
+        and name not in disabled_providers
+    ]
+
+
+def record_latency(provider_name, seconds, outcome):
+    """Add one call to the latency histogram of a provider"""
+    llm_request_duration.observe(seconds, provider=provider_name, outcome=outcome)
+    if outcome == 'success':
+        with recent_latency_lock:
+            recent = recent_latency.get(provider_name)
+            if recent is None:
+                recent = deque(maxlen=LATENCY_WINDOW)
+                recent_latency[provider_name] = recent
+            recent.append(seconds)
+
+
+def get_hedge_delay(provider_name):
+    """
+    Seconds to wait on a provider before hedging to the next one
+
+    Uses the p95 of recent successful calls once enough samples exist,
+    otherwise LLM_HEDGE_DEFAULT_DELAY.
+    """
+    with recent_latency_lock:
+        recent = sorted(recent_latency.get(provider_name, ()))
+    if len(recent) < MIN_HEDGE_SAMPLES:
+        return LLM_HEDGE_DEFAULT_DELAY
+    return recent[min(len(recent) - 1, int(len(recent) * 0.95))]
+
+
+def call_provider(provider, messages, timeout=None, cancelled=None):
+    """
+    Send a chat completion request to one provider
+
+    Args:
+        provider (dict): Provider definition from LLM_PROVIDERS
+        messages (list): Chat messages in OpenAI format
+        timeout (float): Override for the provider's own timeout
+        cancelled (threading.Event): Set when the answer is no longer
+            wanted (another provider won or the deadline passed); the call
+            is then recorded as 'cancelled' whatever its outcome
+
+    Returns:
+        str: The response text
+
+    Raises:
+        LLMProviderError: On timeout, transport error, non-200 status, empty
+            content or cancellation
+    """
+    headers = {
+        "Authorization": f"Bearer {provider['api_key']}",
+        "Content-Type": "application/json"
+    }
+    headers.update(provider['extra_headers'])
+
+    data = {
+        "model": provider['model'],
+        "messages": messages
+    }
+    data.update(provider['extra_body'])
+
+    started_at = time.perf_counter()
+    try:
+        response = requests.post(
+            f"{provider['api_base']}/chat/completions",
+            headers=headers,
+            json=data,
+            timeout=timeout or provider['timeout']
+        )
+    except requests.exceptions.RequestException as e:
+        if cancelled is not None and cancelled.is_set():
+            outcome = 'cancelled'
+        elif isinstance(e, requests.exceptions.Timeout):
+            outcome = 'timeout'
+        else:
+            outcome = 'error'
+        record_latency(provider['name'], time.perf_counter() - started_at, outcome)
+        if outcome == 'timeout':
+            raise LLMProviderError(f"{provider['name']} timed out: {e}")
+        raise LLMProviderError(f"{provider['name']} request failed: {e}")
+
+    elapsed = time.perf_counter() - started_at
+
+    if cancelled is not None and cancelled.is_set():
+        record_latency(provider['name'], elapsed, 'cancelled')
+        raise LLMProviderError(f"{provider['name']} answered after the request was cancelled")
+
+    if response.status_code != 200:
+        record_latency(provider['name'], elapsed, 'error')
+        raise LLMProviderError(f"{provider['name']} returned status {response.status_code}")
+
+    try:
+        content = response.json()['choices'][0]['message']['content']
+    except (ValueError, KeyError, IndexError, TypeError):
+        content = None
+
+    if not content or not content.strip():
+        record_latency(provider['name'], elapsed, 'error')
+        raise LLMProviderError(f"{provider['name']} returned no content")
+
+    record_latency(provider['name'], elapsed, 'success')
+    return content.strip()
+
+
+def dispatch_chat(messages, hedge=None, total_timeout=None):
+    """
+    Get a chat completion from the configured providers
+
+    The first active provider is called with its own timeout. If it fails,
+    the next provider is tried. With hedging enabled, the next provider is
+    also started once the first has been running longer than its p95
+    latency, and whichever answers first wins. The losers are cancelled:
+    calls still queued never start, and calls in flight are left to finish
+    and recorded as 'cancelled' instead of by their outcome.
+
+    Args:
+        messages (list): Chat messages in OpenAI format
+        hedge (bool): Override LLM_HEDGE_ENABLED
+        total_timeout (float): Override LLM_TOTAL_TIMEOUT
+
+    Returns:
+        tuple: (response text, provider name)
+
+    Raises:
+        LLMDispatchError: If no provider answered before the deadline
+    """
+    if hedge is None:
+        hedge = LLM_HEDGE_ENABLED
+    deadline = time.monotonic() + (total_timeout or LLM_TOTAL_TIMEOUT)
+
+    remaining = get_active_providers()
+    if not remaining:
+        raise LLMDispatchError("No LLM providers configured")
+
+    pending = {}
+    errors = []
+    cancelled = threading.Event()
+
+    def launch_next():
+        provider = remaining.pop(0)
+        budget = max(0.1, min(provider['timeout'], deadline - time.monotonic()))
+        future = dispatch_executor.submit(call_provider, provider, messages, budget, cancelled)
+        pending[future] = provider
+
+    try:
+        return _await_first_answer(pending, remaining, launch_next, errors, deadline, hedge)
+    finally:
+        cancelled.set()
+        for future in pending:
+            future.cancel()
+
+
+def _await_first_answer(pending, remaining, launch_next, errors, deadline, hedge):
+    """The wait loop of dispatch_chat; returns (text, provider name) or raises LLMDispatchError"""
+    launch_next()
+    while pending:
+        time_left = deadline - time.monotonic()
+        if time_left <= 0:
+            break
+
+        wait_for = time_left
+        hedge_provider = None
+        if hedge and remaining and len(pending) == 1:
+            hedge_provider = next(iter(pending.values()))
+            wait_for = min(time_left, get_hedge_delay(hedge_provider['name']))
+
+        done, _ = wait(list(pending), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+        if not done:
+            if hedge_provider is not None:
+                logger.info("Hedging LLM request: %s slower than %.2fs", hedge_provider['name'], wait_for)
+                launch_next()
+            continue
+
+        for future in done:
+            provider = pending.pop(future)
+            try:
+                return future.result(), provider['name']
+            except LLMProviderError as e:
+                errors.append(str(e))
+
+        # Fall back to the next provider once nothing else is in flight
+        if not pending and remaining:
+            launch_next()
+
+    if pending:
+        errors.append(f"deadline exceeded waiting for {', '.join(p['name'] for p in pending.values())}")
+    raise LLMDispatchError('; '.join(errors) or "No provider responded")
+
+
+def probe_providers():
+    """
+    Send a short request to every configured provider and disable the ones that fail
+
+    Returns:
+        list: Names of the providers that answered
+    """
+    available = []
+    for provider in get_active_providers():
+        try:
+            call_provider(provider, [{"role": "user", "content": "Hello"}])
+            logger.info("%s API connection successful", provider['name'])
+            available.append(provider['name'])
+        except LLMProviderError as e:
+            logger.warning("Disabling LLM provider: %s", e)
+            disabled_providers.add(provider['name'])
+    return available
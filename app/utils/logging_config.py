@@ -0,0 +1,139 @@
+import os
+import json
+import random
+import atexit
+import logging
+import logging.handlers
+import queue
+from datetime import datetime, timezone
+
+# Logging settings
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text').lower()  # 'text' or 'json'
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+
+# Root logger name shared by every module of the app
+LOGGER_NAME = 'sports_tracker'
+
+# Attributes every LogRecord has - anything else came in through extra=
+_RESERVED_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+# Listener draining the log queue, started once by setup_logging
+_queue_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including extra= fields"""
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage()
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep a random fraction of records that set a sample_rate
+
+    Noisy call sites pass extra={'sample_rate': 0.01} to emit about one
+    record in a hundred; records without it always pass.
+    """
+
+    def filter(self, record):
+        rate = getattr(record, 'sample_rate', None)
+        if rate is None or rate >= 1:
+            return True
+        return random.random() < rate
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full"""
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def setup_logging(level=None):
+    """
+    Configure the app logger once: records are queued by the calling thread
+    and written to stderr by a background listener
+
+    Args:
+        level (str): Override LOG_LEVEL
+
+    Returns:
+        logging.Logger: The app root logger
+    """
+    global _queue_listener
+
+    logger = logging.getLogger(LOGGER_NAME)
+    if level is not None:
+        logger.setLevel(level)
+
+    if _queue_listener is not None:
+        return logger
+
+    if level is None:
+        logger.setLevel(LOG_LEVEL)
+
+    stream_handler = logging.StreamHandler()
+    if LOG_FORMAT == 'json':
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter())
+
+    logger.addHandler(queue_handler)
+    logger.propagate = False
+
+    _queue_listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
+
+    return logger
+
+
+def _stop_listener_before_fork():
+    # fork() copies only the calling thread; drain the queue and stop the
+    # listener so the child (e.g. a gunicorn --preload worker) can start its own
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+
+def _start_listener_after_fork():
+    if _queue_listener is not None:
+        _queue_listener.start()
+
+
+os.register_at_fork(before=_stop_listener_before_fork,
+                    after_in_parent=_start_listener_after_fork,
+                    after_in_child=_start_listener_after_fork)
+
+
+def get_logger(name):
+    """
+    Get a logger under the app root logger, configuring logging on first use
+
+    Args:
+        name (str): Usually __name__ of the calling module
+
+    Returns:
+        logging.Logger: The child logger
+    """
+    setup_logging()
+    return logging.getLogger(f"{LOGGER_NAME}.{name.split('.')[-1]}")
@@ -0,0 +1,256 @@
+import time
+import threading
+from bisect import bisect_left
+from functools import wraps
+from flask import Response, request
+from .tracing import span
+
+# Default latency buckets (seconds) for request and provider histograms
+DEFAULT_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+
+# All metrics in registration order, rendered by render_metrics
+metrics_registry = {}
+metrics_registry_lock = threading.Lock()
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _format_labels(label_names, label_values, extra=None):
+    pairs = list(zip(label_names, label_values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    escaped = []
+    for name, value in pairs:
+        value = str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+        escaped.append(f'{name}="{value}"')
+    return '{' + ','.join(escaped) + '}'
+
+
+class Metric:
+    """Base class holding one value per label combination"""
+
+    metric_type = 'untyped'
+
+    def __init__(self, name, documentation, label_names=()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def samples(self):
+        """Yield (suffix, label values, extra label, value) for the exposition output"""
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield '', key, None, value
+
+    @property
+    def exposed_name(self):
+        """Name the metric is exported under, in its HELP and TYPE lines and its samples"""
+        return self.name
+
+    def render(self):
+        name = self.exposed_name
+        lines = [
+            f"# HELP {name} {self.documentation}",
+            f"# TYPE {name} {self.metric_type}"
+        ]
+        for suffix, key, extra, value in self.samples():
+            lines.append(f"{name}{suffix}{_format_labels(self.label_names, key, extra)} {_format_value(value)}")
+        return '\n'.join(lines)
+
+
+class Counter(Metric):
+    """Monotonically increasing count, exported as <name>_total"""
+
+    metric_type = 'counter'
+
+    @property
+    def exposed_name(self):
+        # The text format needs the metadata lines to name the samples
+        # exactly, so the _total suffix goes on both
+        return f"{self.name}_total"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    """Value that can go up and down"""
+
+    metric_type = 'gauge'
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """Bucketed distribution of observed values, rendered cumulatively"""
+
+    metric_type = 'histogram'
+
+    def __init__(self, name, documentation, label_names=(), buckets=None):
+        super().__init__(name, documentation, label_names)
+        self.buckets = sorted(buckets or DEFAULT_BUCKETS)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = {'counts': [0] * (len(self.buckets) + 1), 'sum': 0.0, 'count': 0}
+                self._values[key] = state
+            state['counts'][bisect_left(self.buckets, value)] += 1
+            state['sum'] += value
+            state['count'] += 1
+
+    def samples(self):
+        with self._lock:
+            items = [(key, list(state['counts']), state['sum'], state['count']) for key, state in self._values.items()]
+        for key, counts, total, count in items:
+            running = 0
+            for bound, bucket_count in zip(self.buckets + [float('inf')], counts):
+                running += bucket_count
+                yield '_bucket', key, ('le', _format_value(float(bound))), running
+            yield '_sum', key, None, round(total, 6)
+            yield '_count', key, None, count
+
+
+def _register(metric):
+    with metrics_registry_lock:
+        existing = metrics_registry.get(metric.name)
+        if existing is not None:
+            return existing
+        metrics_registry[metric.name] = metric
+        return metric
+
+
+def counter(name, documentation, label_names=()):
+    """Get or create a registered Counter"""
+    return _register(Counter(name, documentation, label_names))
+
+
+def gauge(name, documentation, label_names=()):
+    """Get or create a registered Gauge"""
+    return _register(Gauge(name, documentation, label_names))
+
+
+def histogram(name, documentation, label_names=(), buckets=None):
+    """Get or create a registered Histogram"""
+    return _register(Histogram(name, documentation, label_names, buckets))
+
+
+def render_metrics():
+    """
+    Render every registered metric in the Prometheus text exposition format
+
+    Returns:
+        str: The exposition body
+    """
+    with metrics_registry_lock:
+        metrics = list(metrics_registry.values())
+    return '\n'.join(metric.render() for metric in metrics) + '\n'
+
+
+# Metrics shared by several modules
+provider_request_duration = histogram(
+    'sports_provider_request_duration_seconds',
+    'Time spent fetching events from an upstream sports data provider',
+    ('provider', 'outcome')
+)
+sports_cache_requests = counter(
+    'sports_cache_requests',
+    'Lookups of the sports data cache by result',
+    ('sport', 'result')
+)
+sports_fallback = counter(
+    'sports_fallback',
+    'Times generated fallback data was served instead of provider data',
+    ('generator',)
+)
+http_request_duration = histogram(
+    'http_request_duration_seconds',
+    'Flask request latency by route',
+    ('method', 'route', 'status')
+)
+socketio_connections = gauge(
+    'socketio_connections',
+    'Currently connected Socket.IO clients'
+)
+
+
+def observe_provider(provider):
+    """
+    Decorator timing a provider fetch function into provider_request_duration
+    and a provider.<name> tracing span
+
+    The outcome label is 'empty' when the function returns no events and
+    'error' when it raises.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started_at = time.perf_counter()
+            outcome = 'error'
+            try:
+                with span(f"provider.{provider}"):
+                    result = func(*args, **kwargs)
+                outcome = 'success' if result else 'empty'
+                return result
+            finally:
+                provider_request_duration.observe(time.perf_counter() - started_at,
+                                                  provider=provider, outcome=outcome)
+        return wrapper
+    return decorator
+
+
+def register_metrics(app):
+    """
+    Time every request of a Flask app and expose the registry at /metrics
+
+    Args:
+        app (Flask): The application to instrument
+    """
+    @app.before_request
+    def _start_request_timer():
+        request.environ['metrics.started_at'] = time.perf_counter()
+
+    @app.after_request
+    def _observe_request(response):
+        started_at = request.environ.get('metrics.started_at')
+        if started_at is not None:
+            route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+            http_request_duration.observe(time.perf_counter() - started_at,
+                                          method=request.method, route=route,
+                                          status=response.status_code)
+        return response
+
+    @app.route('/metrics', methods=['GET'])
+    def metrics_endpoint():
+        return Response(render_metrics(), mimetype='text/plain; version=0.0.4')
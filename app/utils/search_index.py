@@ -0,0 +1,181 @@
+import re
+import threading
+from bisect import bisect_left
+from datetime import datetime
+from .event_store import event_sort_key
+
+# Event fields whose words are searchable
+INDEXED_FIELDS = ('home_team', 'away_team', 'location', 'venue', 'competition', 'sport', 'stadium')
+
+# Page size limits for search_events
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Inverted index over every event seen on refresh
+search_index = {
+    'postings': {},    # token -> set of event ids
+    'doc_tokens': {},  # event id -> frozenset of tokens
+    'events': {},      # event id -> event
+    'keys': {},        # event id -> (start timestamp, event id), the event store's order
+    'vocabulary': [],  # sorted tokens, for prefix matching
+    'vocabulary_dirty': False
+}
+search_index_lock = threading.RLock()
+
+
+def tokenize(text):
+    """Split text into lowercase alphanumeric tokens"""
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+def event_tokens(event):
+    """
+    Collect the searchable tokens of an event: team, venue and competition
+    words plus the date as YYYY-MM-DD, its parts, month and weekday names
+
+    Args:
+        event (dict): Event dictionary
+
+    Returns:
+        frozenset: Tokens for the event
+    """
+    tokens = set()
+    for field in INDEXED_FIELDS:
+        value = event.get(field)
+        if isinstance(value, str):
+            tokens.update(tokenize(value))
+
+    date_str = event.get('date', '')
+    if date_str:
+        try:
+            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            tokens.add(dt.strftime('%Y-%m-%d'))
+            tokens.update((dt.strftime('%Y'), dt.strftime('%m'), dt.strftime('%d'),
+                           dt.strftime('%B').lower(), dt.strftime('%b').lower(),
+                           dt.strftime('%A').lower(), dt.strftime('%a').lower()))
+        except ValueError:
+            pass
+    return frozenset(tokens)
+
+
+def _remove_postings(event_id, tokens):
+    postings = search_index['postings']
+    for token in tokens:
+        ids = postings.get(token)
+        if ids is None:
+            continue
+        ids.discard(event_id)
+        if not ids:
+            del postings[token]
+            search_index['vocabulary_dirty'] = True
+
+
+def update_index(events):
+    """
+    Add or refresh events in the index
+
+    Only events whose searchable tokens changed touch the postings lists,
+    so a refresh that returns mostly the same fixtures is cheap.
+
+    Args:
+        events (list): Event dictionaries with an 'id'
+    """
+    with search_index_lock:
+        postings = search_index['postings']
+        doc_tokens = search_index['doc_tokens']
+        for event in events:
+            event_id = event.get('id')
+            if not event_id:
+                continue
+            event_id = str(event_id)
+            search_index['events'][event_id] = event
+            search_index['keys'][event_id] = event_sort_key(event)
+
+            tokens = event_tokens(event)
+            old_tokens = doc_tokens.get(event_id)
+            if old_tokens == tokens:
+                continue
+            if old_tokens:
+                _remove_postings(event_id, old_tokens - tokens)
+                added = tokens - old_tokens
+            else:
+                added = tokens
+            for token in added:
+                if token not in postings:
+                    postings[token] = set()
+                    search_index['vocabulary_dirty'] = True
+                postings[token].add(event_id)
+            doc_tokens[event_id] = tokens
+
+
+def remove_from_index(event_ids):
+    """Drop events from the index"""
+    with search_index_lock:
+        for event_id in event_ids:
+            event_id = str(event_id)
+            tokens = search_index['doc_tokens'].pop(event_id, None)
+            search_index['events'].pop(event_id, None)
+            search_index['keys'].pop(event_id, None)
+            if tokens:
+                _remove_postings(event_id, tokens)
+
+
+def _prefix_matches(prefix):
+    if search_index['vocabulary_dirty']:
+        search_index['vocabulary'] = sorted(search_index['postings'])
+        search_index['vocabulary_dirty'] = False
+    vocabulary = search_index['vocabulary']
+    matches = set()
+    position = bisect_left(vocabulary, prefix)
+    while position < len(vocabulary) and vocabulary[position].startswith(prefix):
+        matches.update(search_index['postings'][vocabulary[position]])
+        position += 1
+    return matches
+
+
+def search_events(query, page=1, per_page=DEFAULT_PAGE_SIZE):
+    """
+    Find events matching every word of the query
+
+    The last word is matched as a prefix so results update while typing.
+    Results are ordered by start time, using the keys computed when the
+    events were indexed.
+
+    Args:
+        query (str): Search text, e.g. 'arsenal london' or '2025-04-13'
+        page (int): 1-based page number
+        per_page (int): Results per page, capped at MAX_PAGE_SIZE
+
+    Returns:
+        dict: query, total, page, per_page and the results for the page
+    """
+    page = max(1, page)
+    per_page = max(1, min(per_page, MAX_PAGE_SIZE))
+    # Keep full dates like 2025-04-13 as single tokens
+    words = re.findall(r'\d{4}-\d{2}-\d{2}|[a-z0-9]+', (query or '').lower())
+
+    result = {'query': query, 'total': 0, 'page': page, 'per_page': per_page, 'results': []}
+    if not words:
+        return result
+
+    with search_index_lock:
+        postings = search_index['postings']
+        matched = None
+        for position, word in enumerate(words):
+            if position == len(words) - 1:
+                ids = _prefix_matches(word)
+            else:
+                ids = postings.get(word, set())
+            matched = set(ids) if matched is None else matched & ids
+            if not matched:
+                return result
+
+        keys = search_index['keys']
+        events = [search_index['events'][key[1]] for key in sorted(keys[event_id] for event_id in matched)]
+
+    start = (page - 1) * per_page
+    result['total'] = len(events)
+    result['results'] = events[start:start + per_page]
+    return result
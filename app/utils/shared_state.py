@@ -0,0 +1,162 @@
+import os
+import json
+import secrets
+from .logging_config import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: the development server runs a single process
+    fcntl = None
+
+logger = get_logger(__name__)
+
+# State shared by the processes of a deployment: a lease decides which
+# process does a job (polling, ingesting), and a snapshot carries what it
+# produced to the others. With Redis both are keys shared by every
+# instance; without it they are files shared by the workers of one host.
+
+
+class RedisLease:
+    """Lease on a Redis key: SET NX with an expiry, renewed while held"""
+
+    # Extend the expiry only if the key still holds our token
+    RENEW_SCRIPT = ("if redis.call('get', KEYS[1]) == ARGV[1] then "
+                    "return redis.call('pexpire', KEYS[1], ARGV[2]) else return 0 end")
+
+    def __init__(self, url, key, ttl, client=None):
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.key = key
+        self.ttl_ms = int(ttl * 1000)
+        self.token = f"{os.getpid()}:{secrets.token_hex(8)}"
+        self.held = False
+
+    def acquire(self):
+        """Take or renew the lease; True while this process holds it"""
+        try:
+            if self.held:
+                self.held = bool(self.client.eval(self.RENEW_SCRIPT, 1, self.key, self.token, self.ttl_ms))
+            else:
+                self.held = bool(self.client.set(self.key, self.token, nx=True, px=self.ttl_ms))
+        except Exception as e:
+            # Without Redis nobody can be sure to be alone, so nobody holds it
+            logger.warning("Lease %s unavailable: %s", self.key, e)
+            self.held = False
+        return self.held
+
+
+class FileLease:
+    """Lease on an exclusive lock of a file, held until the process exits"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+
+    def acquire(self):
+        """Take the lock if it is free; True while this process holds it"""
+        if self.file is not None:
+            return True
+        if fcntl is None:
+            self.file = True
+            return True
+        lock_file = open(self.path, 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self.file = lock_file
+        return True
+
+
+class RedisSnapshot:
+    """
+    JSON document in a Redis key, with a version key so readers fetch the
+    document only when it changed
+    """
+
+    def __init__(self, url, key, client=None):
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.key = key
+        self.version_key = f"{key}:version"
+        self.seen = None
+
+    def publish(self, document):
+        """Replace the document"""
+        try:
+            pipeline = self.client.pipeline()
+            pipeline.set(self.key, json.dumps(document))
+            pipeline.incr(self.version_key)
+            pipeline.execute()
+        except Exception as e:
+            logger.warning("Could not publish %s: %s", self.key, e)
+
+    def read(self):
+        """The document if it changed since the last read, else None"""
+        try:
+            version = self.client.get(self.version_key)
+            if version is None or version == self.seen:
+                return None
+            raw = self.client.get(self.key)
+        except Exception as e:
+            logger.warning("Could not read %s: %s", self.key, e)
+            return None
+        self.seen = version
+        return json.loads(raw) if raw else None
+
+
+class FileSnapshot:
+    """
+    JSON document in a file, replaced atomically so readers never see half
+    of it, and read only when its modification time or size changed
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.seen = None
+
+    def publish(self, document):
+        """Replace the document"""
+        temporary_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, 'w', encoding='utf-8') as snapshot_file:
+                json.dump(document, snapshot_file)
+            os.replace(temporary_path, self.path)
+        except OSError as e:
+            logger.warning("Could not publish %s: %s", self.path, e)
+
+    def read(self):
+        """The document if it changed since the last read, else None"""
+        try:
+            stat = os.stat(self.path)
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            if signature == self.seen:
+                return None
+            with open(self.path, encoding='utf-8') as snapshot_file:
+                document = json.load(snapshot_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read %s: %s", self.path, e)
+            return None
+        self.seen = signature
+        return document
+
+
+def shared_lease(redis_url, key, ttl, lock_file):
+    """A RedisLease on key when redis_url is set, else a FileLease on lock_file"""
+    if redis_url:
+        return RedisLease(redis_url, key, ttl)
+    return FileLease(lock_file)
+
+
+def shared_snapshot(redis_url, key, path):
+    """A RedisSnapshot in key when redis_url is set, else a FileSnapshot at path"""
+    if redis_url:
+        return RedisSnapshot(redis_url, key)
+    return FileSnapshot(path)
@@ -0,0 +1,31 @@
+import os
+
+# Socket.IO settings. SOCKETIO_ASYNC_MODE is set to 'gevent' by
+# gunicorn.conf.py when it runs gevent workers; 'threading' suits the
+# development server and sync/gthread workers.
+SOCKETIO_ASYNC_MODE = os.getenv('SOCKETIO_ASYNC_MODE', 'threading')
+# Redis (or other kombu) URL shared by every worker and instance, so an
+# emit from one process reaches clients connected to any of them
+SOCKETIO_MESSAGE_QUEUE = os.getenv('SOCKETIO_MESSAGE_QUEUE') or os.getenv('REDIS_URL') or None
+SOCKETIO_CORS_ORIGINS = os.getenv('SOCKETIO_CORS_ORIGINS', '*')
+SOCKETIO_PING_INTERVAL = int(os.getenv('SOCKETIO_PING_INTERVAL', '25'))  # seconds
+SOCKETIO_PING_TIMEOUT = int(os.getenv('SOCKETIO_PING_TIMEOUT', '20'))    # seconds
+
+
+def socketio_options():
+    """
+    Keyword arguments for SocketIO() built from the settings above
+
+    Returns:
+        dict: async_mode, message_queue, cors_allowed_origins, ping_interval and ping_timeout
+    """
+    origins = SOCKETIO_CORS_ORIGINS
+    if origins != '*':
+        origins = [origin.strip() for origin in origins.split(',') if origin.strip()]
+    return {
+        'async_mode': SOCKETIO_ASYNC_MODE,
+        'message_queue': SOCKETIO_MESSAGE_QUEUE,
+        'cors_allowed_origins': origins,
+        'ping_interval': SOCKETIO_PING_INTERVAL,
+        'ping_timeout': SOCKETIO_PING_TIMEOUT
+    }
@@ -4,16 +4,79 @@ from dotenv import load_dotenv
 import json
 from datetime import datetime, timedelta, timezone
 import random
+import time
+import tempfile
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 import pytz
+from .logging_config import get_logger
+from .metrics import observe_provider, sports_cache_requests, sports_fallback
+from .tracing import span, traced
+from .search_index import update_index, remove_from_index
+from .timezones import format_local
+from .event_store import (upsert_events, remove_events, events_in_range, get_event, store_version,
+                          upcoming_since, event_timestamp, UNDATED_TIMESTAMP)
+from .batch_fetch import RateLimiter, fetch_concurrently
+from .demo_data import get_demo_data, get_demo_engine
+from .fixture_merge import apply_reports, withdraw_reports, fixture_reports, fixture_registry, fixture_registry_lock
+from .shared_state import shared_lease, shared_snapshot
 
 # Load environment variables
 load_dotenv()
 
+logger = get_logger(__name__)
+
 # Constants
 SPORTS_API_KEY = os.getenv('SPORTS_API_KEY', '')
 FOOTBALL_API_KEY = os.getenv('FOOTBALL_API_KEY', '')
 CRICKET_API_KEY = os.getenv('CRICKET_API_KEY', '')
-API_PROVIDER = os.getenv('API_PROVIDER', 'balldontlie').lower()  # Default to balldontlie if not specified
+API_PROVIDER = os.getenv('API_PROVIDER', 'balldontlie').lower()  # Default to balldontlie if not specified; 'demo' for synthetic data
+
+# TheSportsDB settings
+THESPORTSDB_API_BASE = os.getenv('THESPORTSDB_API_BASE', 'https://www.thesportsdb.com/api/v1/json')
+LEAGUE_CATALOG_PATH = os.getenv('LEAGUE_CATALOG_PATH',
+                                os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'leagues.json'))
+THESPORTSDB_CONCURRENCY = int(os.getenv('THESPORTSDB_CONCURRENCY', '4'))
+THESPORTSDB_RATE_LIMIT = float(os.getenv('THESPORTSDB_RATE_LIMIT', '2'))  # requests per second
+THESPORTSDB_LEAGUE_TTL = int(os.getenv('THESPORTSDB_LEAGUE_TTL', '3600'))  # seconds
+
+# Provider base URLs, overridable to point at local mock servers
+API_FOOTBALL_API_BASE = os.getenv('API_FOOTBALL_API_BASE', 'https://api-football-v1.p.rapidapi.com/v3')
+CRICAPI_API_BASE = os.getenv('CRICAPI_API_BASE', 'https://api.cricapi.com/v1')
+
+# BallDontLie settings
+BALLDONTLIE_API_BASE = os.getenv('BALLDONTLIE_API_BASE', 'https://api.balldontlie.io/v1')
+BALLDONTLIE_API_KEY = os.getenv('BALLDONTLIE_API_KEY', SPORTS_API_KEY)
+BALLDONTLIE_CONCURRENCY = int(os.getenv('BALLDONTLIE_CONCURRENCY', '3'))
+BALLDONTLIE_RATE_LIMIT = float(os.getenv('BALLDONTLIE_RATE_LIMIT', '1'))  # requests per second
+BALLDONTLIE_PAGE_SIZE = 100
+# The games from BALLDONTLIE_DAYS_BACK days ago to BALLDONTLIE_DAYS_AHEAD days
+# ahead are refreshed every BALLDONTLIE_REFRESH_INTERVAL seconds; the rest of
+# the season is swept for schedule changes every BALLDONTLIE_SWEEP_INTERVAL
+BALLDONTLIE_DAYS_BACK = int(os.getenv('BALLDONTLIE_DAYS_BACK', '1'))
+BALLDONTLIE_DAYS_AHEAD = int(os.getenv('BALLDONTLIE_DAYS_AHEAD', '7'))
+BALLDONTLIE_REFRESH_INTERVAL = int(os.getenv('BALLDONTLIE_REFRESH_INTERVAL', '900'))
+BALLDONTLIE_SWEEP_INTERVAL = int(os.getenv('BALLDONTLIE_SWEEP_INTERVAL', str(24 * 3600)))
+# Only one process per deployment ingests: the holder of a lease on a Redis
+# key (with REDIS_URL) or on a lock file shared by the workers of one host.
+# It publishes the stored games after each run, and the other processes
+# apply them every BALLDONTLIE_SYNC_INTERVAL seconds. The lease expires
+# BALLDONTLIE_LEASE_TTL seconds after its holder stops renewing it, so it
+# must outlast the longest run.
+BALLDONTLIE_REDIS_URL = os.getenv('REDIS_URL') or None
+BALLDONTLIE_LEASE_KEY = os.getenv('BALLDONTLIE_LEASE_KEY', 'sports-tracker:balldontlie-ingest')
+BALLDONTLIE_LEASE_TTL = float(os.getenv('BALLDONTLIE_LEASE_TTL', '600'))
+BALLDONTLIE_LOCK_FILE = os.getenv('BALLDONTLIE_LOCK_FILE',
+                                  os.path.join(tempfile.gettempdir(), 'sports-tracker-balldontlie-ingest.lock'))
+BALLDONTLIE_GAMES_KEY = os.getenv('BALLDONTLIE_GAMES_KEY', 'sports-tracker:balldontlie-games')
+BALLDONTLIE_GAMES_FILE = os.getenv('BALLDONTLIE_GAMES_FILE',
+                                   os.path.join(tempfile.gettempdir(), 'sports-tracker-balldontlie-games.json'))
+BALLDONTLIE_SYNC_INTERVAL = float(os.getenv('BALLDONTLIE_SYNC_INTERVAL', '10'))
+
+# Events that started longer ago than this (seconds) are dropped from the
+# event store at each refresh, so it does not keep every fixture ever fetched
+EVENT_RETENTION = int(os.getenv('EVENT_RETENTION', str(3 * 24 * 3600)))
 
 # Define IST timezone
 IST = pytz.timezone('Asia/Kolkata')
@@ -32,7 +95,7 @@ def adjust_date_to_current(fixture_date, reference_date=None):
     if reference_date is None:
         reference_date = get_current_datetime(IST)
     
-    print(f"Adjusting date: {fixture_date} with reference {reference_date}")
+    logger.debug("Adjusting date: %s with reference %s", fixture_date, reference_date)
     
     # Get the current date
     current_date = reference_date.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -48,22 +111,70 @@ def adjust_date_to_current(fixture_date, reference_date=None):
     # Preserve the original time
     result = new_date.replace(hour=fixture_date.hour, minute=fixture_date.minute)
     
-    print(f"Adjusted date: {result}")
+    logger.debug("Adjusted date: %s", result)
     return result
 
-# Print debug info
-print(f"Using Sports API Key: {SPORTS_API_KEY}")
-print(f"Using Football API Key: {FOOTBALL_API_KEY}")
-print(f"Using Cricket API Key: {CRICKET_API_KEY}")
-print(f"Using API Provider: {API_PROVIDER}")
+# Log configuration (never the key values themselves)
+logger.info("Sports API Key: %s", 'Set' if SPORTS_API_KEY else 'Not set')
+logger.info("Football API Key: %s", 'Set' if FOOTBALL_API_KEY else 'Not set')
+logger.info("Cricket API Key: %s", 'Set' if CRICKET_API_KEY else 'Not set')
+logger.info("Using API Provider: %s", API_PROVIDER)
 
 # Cache for sports data to avoid frequent API calls
 sports_data_cache = {
     'last_updated': None,
-    'data': {}
+    'data': {},      # sport type -> events in date order (see sports_view)
+    'versions': {}   # sport type -> event store version its events were read at
 }
 
+# Ids of the events each source returned on its last refresh, so the ones
+# it stops returning can be withdrawn from the store. A source is what one
+# branch of load_sports_data fetches ('cricket', 'thesportsdb:all', ...),
+# fallback fixtures included. Events fed in outside a refresh belong to no
+# source and only leave the store when they are evicted.
+source_event_ids = {}
+
+# get_sports_data results inside an event_snapshot() block (sport type ->
+# events, and the lock guarding them), so every lookup made for one batch
+# sees the same events and each view is filtered once per batch rather than
+# once per lookup
+sports_data_snapshot = ContextVar('sports_data_snapshot', default=None)
+
+@contextmanager
+def event_snapshot():
+    """
+    Serve every get_sports_data call in the block from one snapshot
+
+    The snapshot follows the context into threads started with
+    fetch_concurrently, which copies it.
+    """
+    token = sports_data_snapshot.set({'events': {}, 'lock': threading.Lock()})
+    try:
+        yield
+    finally:
+        sports_data_snapshot.reset(token)
+
 def get_sports_data(sport_type='all'):
+    """
+    Upcoming events of a sport type, from the snapshot if one is active
+
+    Args:
+        sport_type (str): Type of sport (all, football, basketball, cricket, etc.)
+
+    Returns:
+        list: List of sports events sorted by date
+    """
+    snapshot = sports_data_snapshot.get()
+    if snapshot is None:
+        return load_sports_data(sport_type)
+    # Held while loading, so concurrent queries of a batch load each sport once
+    with snapshot['lock']:
+        events = snapshot['events'].get(sport_type)
+        if events is None:
+            events = snapshot['events'][sport_type] = load_sports_data(sport_type)
+    return events
+
+def load_sports_data(sport_type='all'):
     """
     Fetch sports events data from the API
     
@@ -73,48 +184,45 @@ def get_sports_data(sport_type='all'):
     Returns:
         list: List of sports events sorted by date
     """
-    print(f"Fetching sports data for: {sport_type}")
+    logger.debug("Fetching sports data for: %s", sport_type)
     
     # Check if we have cached data and it's less than 1 hour old
     current_time = get_current_datetime()
-    if (sports_data_cache['last_updated'] and 
-        (current_time - sports_data_cache['last_updated']).seconds < 3600 and
-        sport_type in sports_data_cache['data']):
-        print(f"Returning cached data for {sport_type}")
-        return filter_upcoming_events(sports_data_cache['data'][sport_type])
+    with span('cache', sport=sport_type):
+        fresh = (sports_data_cache['last_updated'] and
+                 (current_time - sports_data_cache['last_updated']).seconds < 3600 and
+                 sport_type in sports_data_cache['data'])
+
+    if fresh:
+        logger.debug("Returning cached data for %s", sport_type)
+        sports_cache_requests.inc(sport=sport_type, result='hit')
+        return filter_upcoming_events(sports_view(sport_type))
     
-    # For specific sport types, use the appropriate API
-    if sport_type.lower() == 'football':
-        events = generate_football_data()
+    sports_cache_requests.inc(sport=sport_type, result='miss')
+
+    # For specific sport types, use the appropriate API; each source's
+    # events replace what it returned on its last refresh
+    if API_PROVIDER == 'demo':
+        # Seeded synthetic data for load tests - no network at all
+        refreshed = {f'demo:{sport_type}': get_demo_data(sport_type)}
+    elif sport_type.lower() == 'football':
+        refreshed = {'football': generate_football_data()}
     elif sport_type.lower() == 'basketball':
-        events = get_balldontlie_data(sport_type)
+        refreshed = {'basketball': get_balldontlie_data(sport_type)}
     elif sport_type.lower() == 'cricket':
-        events = get_cricket_data(sport_type)
+        refreshed = {'cricket': get_cricket_data(sport_type)}
     elif sport_type.lower() == 'all':
         # For 'all', try to get data from multiple sources
-        events = []
-        print("Fetching data from all configured APIs")
-        
-        # Get basketball data
-        basketball_events = get_balldontlie_data('basketball')
-        if basketball_events:
-            events.extend(basketball_events)
-            
-        # Add football data
-        football_events = generate_football_data()
-        if football_events:
-            events.extend(football_events)
-        
-        # Add cricket data
-        cricket_events = get_cricket_data('cricket')
-        if cricket_events:
-            events.extend(cricket_events)
+        logger.debug("Fetching data from all configured APIs")
+        refreshed = {
+            'basketball': get_balldontlie_data('basketball'),
+            'football': generate_football_data(),
+            'cricket': get_cricket_data('cricket')
+        }
                 
         # If API_PROVIDER is thesportsdb and we have an API key, get data from there too
         if API_PROVIDER == 'thesportsdb' and SPORTS_API_KEY:
-            thesportsdb_events = get_thesportsdb_data('all')
-            if thesportsdb_events:
-                events.extend(thesportsdb_events)
+            refreshed['thesportsdb:all'] = get_thesportsdb_data('all')
     else:
         # For other sport types, fall back to the configured API provider
         try:
@@ -126,32 +234,62 @@ def get_sports_data(sport_type='all'):
                 events = get_balldontlie_data(sport_type)
             else:
                 # Return empty list if provider not supported
-                print(f"API provider not supported: {API_PROVIDER}")
+                logger.warning("API provider not supported: %s", API_PROVIDER)
                 return []
+            refreshed = {f'{API_PROVIDER}:{sport_type}': events}
         except Exception as e:
-            print(f"Error fetching sports data from provider {API_PROVIDER}: {str(e)}")
-            events = []
+            # Keep serving what the provider returned last time
+            logger.warning("Error fetching sports data from provider %s: %s", API_PROVIDER, e)
+            refreshed = {}
     
-    # Sort events by date in IST
-    sorted_events = sort_events_by_date(events)
-    
-    # Cache the sorted events
+    # Apply the refresh as keyed upserts: only new or changed events are
+    # re-keyed, annotated and re-indexed
+    with span('index'):
+        for source, events in refreshed.items():
+            refresh_source(source, events)
+        evict_past_events()
     sports_data_cache['last_updated'] = current_time
-    sports_data_cache['data'][sport_type] = sorted_events
-    
+
     # Filter to only upcoming events from current date
-    filtered_events = filter_upcoming_events(sorted_events)
+    filtered_events = filter_upcoming_events(sports_view(sport_type))
     
-    print(f"Found {len(filtered_events)} events for {sport_type}")
+    logger.debug("Found %s events for %s", len(filtered_events), sport_type)
     return filtered_events
 
+def sports_view(sport_type):
+    """
+    Upcoming events of a sport type in date order, from upcoming_since() on
+
+    The view is read off the event store's maintained order, so it is never
+    sorted, and only when the store has changed since it was last read.
+    Reports of the same fixture are already merged in the store (see
+    store_events), so the view, paging, search and export all see one
+    event per fixture.
+
+    Args:
+        sport_type (str): Type of sport (all, football, basketball, cricket, etc.)
+
+    Returns:
+        list: Stored events
+    """
+    version = store_version()
+    events = sports_data_cache['data'].get(sport_type)
+    if events is None or sports_data_cache['versions'].get(sport_type) != version:
+        with span('view', sport=sport_type):
+            sport = None if sport_type == 'all' else sport_type.lower()
+            events = events_in_range(sport, start_timestamp=upcoming_since())
+        sports_data_cache['data'][sport_type] = events
+        sports_data_cache['versions'][sport_type] = version
+    return events
+
+@traced('filter')
 def filter_upcoming_events(events):
     """
     Filter events to only include upcoming events, limited to 5 per sport type
     """
     # Get current date in IST
     now = get_current_datetime(IST)
-    print(f"Current date for filtering: {now}")
+    logger.debug("Current date for filtering: %s", now)
     
     # Group events by sport type
     sport_events = {}
@@ -170,139 +308,281 @@ def filter_upcoming_events(events):
         # Take only the first 5 events (they're already sorted by date)
         limited_events.extend(sport_list[:5])
     
-    print(f"Filtered events: {len(limited_events)}")
+    logger.debug("Filtered events: %s", len(limited_events))
     return limited_events
 
-def sort_events_by_date(events):
+def add_timestamp(event):
     """
-    Sort events by date and time in Indian Standard Time (IST)
+    Add the canonical start time (UTC unix timestamp) and the IST display date to an event
+
+    Other zones are rendered from the timestamp per request (see timezones.localize_events).
     """
-    # Define function to extract datetime from event for sorting
-    def get_event_datetime(event):
-        try:
-            # Parse the date string to datetime object
-            date_str = event.get('date', '')
-            if not date_str:
-                # If no date available, put it at the end
-                return datetime.max.replace(tzinfo=timezone.utc)
-            
-            # Parse the ISO format date
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            
-            # Remove year conversion - allow 2025 dates to remain as 2025
-            # if dt.year == 2025:
-            #     dt = dt.replace(year=2024)
-                
-            # If it doesn't have timezone info, assume UTC
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-                
-            # Convert to IST for sorting
-            ist_dt = dt.astimezone(IST)
-            return ist_dt
-        except Exception as e:
-            print(f"Error parsing date for sorting: {e}")
-            # If there's an error, put it at the end
-            return datetime.max.replace(tzinfo=timezone.utc)
-    
-    # Sort events by date
-    sorted_events = sorted(events, key=get_event_datetime)
-    
-    # Add IST formatted date for display
-    for event in sorted_events:
-        try:
-            date_str = event.get('date', '')
-            if date_str:
-                dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                
-                # Remove year conversion - allow 2025 dates to remain as 2025
-                # if dt.year == 2025:
-                #     dt = dt.replace(year=2024)
-                #     # Update the original date field too
-                #     event['date'] = dt.strftime('%Y-%m-%dT%H:%M:%S%z')
-                
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                ist_dt = dt.astimezone(IST)
-                event['ist_date'] = ist_dt.strftime('%Y-%m-%d %H:%M IST')
-        except Exception as e:
-            print(f"Error adding IST date: {e}")
-            event['ist_date'] = 'Date not available'
-    
-    return sorted_events
+    timestamp = event_timestamp(event)
+    if timestamp != UNDATED_TIMESTAMP:
+        event['timestamp'] = int(timestamp)
+        event['ist_date'] = format_local(timestamp, 'Asia/Kolkata')
+    elif event.get('date'):
+        event['ist_date'] = 'Date not available'
+
+def _write_fixtures(fixtures, removed):
+    """Upsert merged fixtures and drop removed ones, in the event store and the search index"""
+    changed = upsert_events(fixtures, prepare=add_timestamp)
+    if removed:
+        remove_events(removed)
+        remove_from_index(removed)
+    if changed:
+        update_index([get_event(event_id) for event_id in changed])
+    return changed
+
+def store_events(events):
+    """
+    Add provider reports to their fixtures and upsert the fixtures they
+    change into the event store and the search index
+
+    The store holds one event per fixture: reports of the same fixture from
+    different providers are merged as they arrive (see
+    fixture_merge.apply_reports), and the merged event takes the id of the
+    report that ranks first. A fixture whose id changes that way is removed
+    under its old id.
+
+    Args:
+        events (list): Reports from any provider, each with an 'id'
+
+    Returns:
+        list: Ids of the fixtures that were new or changed
+    """
+    with fixture_registry_lock:
+        return _write_fixtures(*apply_reports(events))
+
+def withdraw_events(event_ids):
+    """
+    Withdraw provider reports; fixtures left without reports are dropped
+    from the event store and the search index, the others are merged again
+    from the reports that remain
+
+    Args:
+        event_ids (iterable): Ids of the reports to withdraw; unknown ids are skipped
+
+    Returns:
+        list: Ids of the fixtures that changed
+    """
+    with fixture_registry_lock:
+        return _write_fixtures(*withdraw_reports(event_ids))
+
+def refresh_source(source, events):
+    """
+    Store the events a source returned and withdraw the ones it returned on
+    its last refresh but no longer does
+
+    Withdrawn events that another source still returns are kept, so two
+    sources fetching the same provider do not drop each other's events.
+
+    Args:
+        source (str): Name of the source, e.g. 'cricket'
+        events (list): Everything the source returned, fallback fixtures included
+
+    Returns:
+        list: Ids of the withdrawn events
+    """
+    event_ids = {str(event['id']) for event in events if event.get('id')}
+    previous = source_event_ids.get(source, set())
+    source_event_ids[source] = event_ids
+    store_events(events)
+
+    stale = [event_id for event_id in previous - event_ids
+             if not any(event_id in ids for ids in source_event_ids.values())]
+    if stale:
+        withdraw_events(stale)
+        logger.debug("Withdrew %s events %s no longer returns", len(stale), source)
+    return stale
+
+def evict_past_events(now=None):
+    """
+    Drop events that started more than EVENT_RETENTION seconds ago from the
+    event store and the search index
+
+    Args:
+        now (float): Current UTC unix timestamp, default the current time
+
+    Returns:
+        list: Ids of the evicted events
+    """
+    bound = (now or time.time()) - EVENT_RETENTION
+    evicted = [str(event['id']) for event in events_in_range(end_timestamp=bound)]
+    if evicted:
+        withdraw_events([report['id'] for fixture_id in evicted for report in fixture_reports(fixture_id)])
+        logger.debug("Evicted %s events that started before %s", len(evicted), bound)
+    return evicted
+
+def apply_live_updates(events):
+    """
+    Store refreshed events from the live poller
+
+    Cached views that include them are read again from the store on their
+    next use.
+
+    Returns:
+        list: Stored versions of the events that changed
+    """
+    changed = store_events(events)
+    return [get_event(event_id) for event_id in changed]
+
+def feed_events(events):
+    """
+    Store events that arrive outside a refresh: pushed by a partner or
+    scraper, or ingested in the background
+
+    They join the views of their sport and of 'all' like any stored event.
+
+    Returns:
+        list: Stored versions of the events that were new or changed
+    """
+    changed = store_events(events)
+    return [get_event(event_id) for event_id in changed]
+
+def load_league_catalog(path=None):
+    """
+    Load the TheSportsDB league catalog
+
+    The catalog maps each sport to a list of leagues, e.g.
+    {"football": [{"id": "4328", "name": "Premier League"}, ...]}.
+
+    Args:
+        path (str): JSON file to read, defaults to LEAGUE_CATALOG_PATH
+
+    Returns:
+        dict: sport -> list of {'id', 'name'} dictionaries
+    """
+    path = path or LEAGUE_CATALOG_PATH
+    try:
+        with open(path, encoding='utf-8') as catalog_file:
+            catalog = json.load(catalog_file)
+    except (OSError, ValueError) as e:
+        logger.warning("Could not load league catalog %s: %s", path, e)
+        return {}
+
+    leagues_by_sport = {}
+    for sport, leagues in catalog.items():
+        leagues_by_sport[sport.lower()] = [
+            {'id': str(league['id']), 'name': league.get('name', '')}
+            for league in leagues if league.get('id')
+        ]
+    return leagues_by_sport
+
+# TheSportsDB league catalog, loaded once at import
+LEAGUE_CATALOG = load_league_catalog()
+
+# Shared limiter so concurrent league fetches stay under the API quota
+thesportsdb_rate_limiter = RateLimiter(THESPORTSDB_RATE_LIMIT)
+
+# Per-league cache of formatted events
+thesportsdb_league_cache = {}
+thesportsdb_league_cache_lock = threading.Lock()
 
 def get_thesportsdb_data(sport_type):
     """
-    Fetch data from TheSportsDB API
+    Fetch data from TheSportsDB API for every catalog league of a sport
+
+    Leagues are fetched concurrently (bounded by THESPORTSDB_CONCURRENCY and
+    THESPORTSDB_RATE_LIMIT) and cached per league for THESPORTSDB_LEAGUE_TTL
+    seconds, so a refresh only hits the API for leagues that expired. Only
+    successful fetches are cached; a league that fails keeps its last good
+    events and is fetched again on the next refresh.
     """
-    SPORTS_API_BASE_URL = "https://www.thesportsdb.com/api/v1/json"
-    
-    # Map sport_type to TheSportsDB league IDs
-    league_ids = {
-        'football': '4391',     # NFL
-        'basketball': '4387',   # NBA
-        'cricket': '4546',      # IPL
-    }
-    
+    sport_type = sport_type.lower()
+    if sport_type == 'all':
+        leagues = [(sport, league) for sport, sport_leagues in LEAGUE_CATALOG.items() for league in sport_leagues]
+    else:
+        leagues = [(sport_type, league) for league in LEAGUE_CATALOG.get(sport_type, [])]
+
+    if not leagues:
+        logger.debug("No TheSportsDB leagues configured for %s", sport_type)
+        return []
+
+    now = time.monotonic()
     events = []
-    
-    if sport_type.lower() == 'all':
-        # Fetch data for all supported sports
-        print("Fetching data for all sports from TheSportsDB")
-        for sport, league_id in league_ids.items():
-            print(f"Fetching {sport} events with league ID: {league_id}")
-            sport_events = fetch_thesportsdb_events(SPORTS_API_BASE_URL, league_id, sport)
-            events.extend(sport_events)
-    elif sport_type.lower() in league_ids:
-        # Fetch data for specific sport
-        league_id = league_ids[sport_type.lower()]
-        print(f"Fetching {sport_type} events with league ID: {league_id}")
-        events = fetch_thesportsdb_events(SPORTS_API_BASE_URL, league_id, sport_type.lower())
-    
+    to_fetch = []
+    with thesportsdb_league_cache_lock:
+        for sport, league in leagues:
+            cached = thesportsdb_league_cache.get(league['id'])
+            if cached and now - cached['fetched_at'] < THESPORTSDB_LEAGUE_TTL:
+                events.extend(cached['events'])
+            else:
+                to_fetch.append((sport, league))
+
+    logger.debug("TheSportsDB: %s leagues cached, %s to fetch", len(leagues) - len(to_fetch), len(to_fetch))
+
+    def fetch_league(item):
+        sport, league = item
+        return fetch_thesportsdb_events(THESPORTSDB_API_BASE, league['id'], sport, league['name'])
+
+    results = fetch_concurrently(fetch_league, to_fetch,
+                                 max_workers=THESPORTSDB_CONCURRENCY,
+                                 rate_limiter=thesportsdb_rate_limiter)
+
+    fetched_at = time.monotonic()
+    for (sport, league), result in zip(to_fetch, results):
+        with thesportsdb_league_cache_lock:
+            if isinstance(result, Exception):
+                cached = thesportsdb_league_cache.get(league['id'])
+                logger.warning("Error fetching TheSportsDB league %s, %s: %s", league['id'],
+                               'serving the last good events' if cached else 'no events to serve', result)
+                if cached:
+                    events.extend(cached['events'])
+                continue
+            thesportsdb_league_cache[league['id']] = {'fetched_at': fetched_at, 'events': result}
+        events.extend(result)
+
     return events
 
-def fetch_thesportsdb_events(base_url, league_id, sport_type):
-    """Fetch events from TheSportsDB API"""
+@observe_provider('thesportsdb')
+def fetch_thesportsdb_events(base_url, league_id, sport_type, competition=''):
+    """
+    Fetch the next events of one league from TheSportsDB API
+
+    Returns:
+        list: Formatted events, empty if the league has none scheduled
+
+    Raises:
+        requests.RequestException: If the request fails or is answered with an error status
+        ValueError: If the response is not JSON
+    """
     url = f"{base_url}/{SPORTS_API_KEY}/eventsnextleague.php?id={league_id}"
-    print(f"Making API request to: {url}")
+    logger.debug("Making TheSportsDB request for league %s", league_id)
     
-    try:
-        response = requests.get(url)
-        print(f"API response status code: {response.status_code}")
-        
-        if response.status_code == 200:
-            data = response.json()
-            print(f"API response data keys: {data.keys()}")
-            
-            events = data.get('events', [])
-            if events is None:
-                print("API returned None for events")
-                return []
-                
-            print(f"Found {len(events)} events from API")
-            
-            # Format the events to match our application structure
-            formatted_events = []
-            for event in events:
-                formatted_event = {
-                    'id': event.get('idEvent', ''),
-                    'home_team': event.get('strHomeTeam', 'Unknown'),
-                    'away_team': event.get('strAwayTeam', 'Unknown'),
-                    'date': event.get('strTimestamp', ''),
-                    'location': event.get('strVenue', 'Unknown venue'),
-                    'status': 'Scheduled',  # Default status for upcoming events
-                    'sport': sport_type
-                }
-                formatted_events.append(formatted_event)
-            
-            return formatted_events
-        else:
-            print(f"API request failed with status code: {response.status_code}")
-            return []
-    except Exception as e:
-        print(f"Error in fetch_thesportsdb_events: {str(e)}")
+    response = requests.get(url, timeout=10)
+    logger.debug("API response status code: %s", response.status_code)
+    response.raise_for_status()
+
+    data = response.json()
+    logger.debug("API response data keys: %s", data.keys())
+    
+    events = data.get('events', [])
+    if events is None:
+        logger.debug("API returned None for events")
         return []
+        
+    logger.debug("Found %s events from API", len(events))
+    
+    # Format the events to match our application structure
+    formatted_events = []
+    for event in events:
+        formatted_event = {
+            'id': event.get('idEvent', ''),
+            'home_team': event.get('strHomeTeam', 'Unknown'),
+            'away_team': event.get('strAwayTeam', 'Unknown'),
+            'date': event.get('strTimestamp', ''),
+            'location': event.get('strVenue', 'Unknown venue'),
+            'status': 'Scheduled',  # Default status for upcoming events
+            'sport': sport_type,
+            'competition': competition or event.get('strLeague', ''),
+            'provider': 'thesportsdb'
+        }
+        formatted_events.append(formatted_event)
+    
+    return formatted_events
 
+@observe_provider('api-football')
 def get_api_football_data(sport_type):
     """
     Fetch data from API-Football
@@ -312,16 +592,15 @@ def get_api_football_data(sport_type):
         return []
         
     if not FOOTBALL_API_KEY:
-        print("No Football API key provided")
+        logger.debug("No Football API key provided")
         return []
     
     try:
-        print("=================== FOOTBALL API DEBUG ===================")
-        print(f"API Key: {FOOTBALL_API_KEY[:5]}...{FOOTBALL_API_KEY[-5:]}")
-        print("Fetching football data from API-Football")
+        logger.debug("=================== FOOTBALL API DEBUG ===================")
+        logger.debug("Fetching football data from API-Football")
         
         # API-Football endpoint for upcoming fixtures
-        url = "https://api-football-v1.p.rapidapi.com/v3/fixtures"
+        url = f"{API_FOOTBALL_API_BASE}/fixtures"
         
         # Get fixtures for next 7 days
         today = get_current_datetime()
@@ -345,81 +624,82 @@ def get_api_football_data(sport_type):
             "X-RapidAPI-Host": "api-football-v1.p.rapidapi.com"
         }
         
-        print(f"Making API request to: {url}")
-        print(f"With dates {from_date} to {to_date}")
-        print(f"League IDs: {querystring['league']}")
-        print(f"Full request params: {querystring}")
-        print(f"Headers: X-RapidAPI-Host: {headers['X-RapidAPI-Host']}")
+        logger.debug("Making API request to: %s", url)
+        logger.debug("With dates %s to %s", from_date, to_date)
+        logger.debug("League IDs: %s", querystring['league'])
+        logger.debug("Full request params: %s", querystring)
+        logger.debug("Headers: X-RapidAPI-Host: %s", headers['X-RapidAPI-Host'])
         
-        response = requests.get(url, headers=headers, params=querystring)
+        response = requests.get(url, headers=headers, params=querystring, timeout=10)
         
-        print(f"API response status code: {response.status_code}")
+        logger.debug("API response status code: %s", response.status_code)
         
         if response.status_code == 200:
             data = response.json()
-            print(f"API response keys: {data.keys() if data else 'No data'}")
+            logger.debug("API response keys: %s", data.keys() if data else 'No data')
             
             fixtures = data.get('response', [])
-            print(f"Found {len(fixtures)} football fixtures")
+            logger.debug("Found %s football fixtures", len(fixtures))
             
             if not fixtures:
-                print("API returned empty fixtures array")
+                logger.debug("API returned empty fixtures array")
                 # Try an alternative endpoint to get at least some data
                 return try_football_teams_endpoint()
             
             # Format fixtures to match our application format
-            formatted_events = []
-            for fixture in fixtures:
-                # Extract relevant data
-                fixture_data = fixture.get('fixture', {})
-                teams = fixture.get('teams', {})
+            formatted_events = [format_api_football_fixture(fixture) for fixture in fixtures]
                 
-                formatted_event = {
-                    'id': str(fixture_data.get('id', '')),
-                    'home_team': teams.get('home', {}).get('name', 'Unknown'),
-                    'away_team': teams.get('away', {}).get('name', 'Unknown'),
-                    'date': fixture_data.get('date', ''),
-                    'location': fixture_data.get('venue', {}).get('name', 'Unknown Stadium'),
-                    'status': fixture_data.get('status', {}).get('long', 'Scheduled'),
-                    'sport': 'football'
-                }
-                
-                # Add score if available
-                goals = fixture.get('goals', {})
-                if goals.get('home') is not None and goals.get('away') is not None:
-                    formatted_event['score'] = f"{goals.get('home')}-{goals.get('away')}"
-                
-                formatted_events.append(formatted_event)
-                
-            print(f"Returning {len(formatted_events)} formatted football events")
-            print("=================== END FOOTBALL API DEBUG ===================")
+            logger.debug("Returning %s formatted football events", len(formatted_events))
+            logger.debug("=================== END FOOTBALL API DEBUG ===================")
             return formatted_events
         else:
-            print(f"API-Football request failed with status code: {response.status_code}")
+            logger.warning("API-Football request failed with status code: %s", response.status_code)
             if response.status_code == 429:
-                print("Rate limit exceeded for API-Football")
+                logger.warning("Rate limit exceeded for API-Football")
             elif response.status_code == 401:
-                print("Unauthorized - API key may be invalid")
+                logger.warning("Unauthorized - API key may be invalid")
                 # Try to decode response for more info
                 try:
                     error_data = response.json()
-                    print(f"Error response: {error_data}")
+                    logger.warning("Error response: %s", error_data)
                 except:
-                    print(f"Raw response: {response.text[:200]}")
+                    logger.warning("Raw response: %s", response.text[:200])
             
             # Try alternate endpoint to get some data
             return try_football_teams_endpoint()
             
     except Exception as e:
-        print(f"Error fetching football data: {str(e)}")
+        logger.warning("Error fetching football data: %s", e)
         return try_football_teams_endpoint()
 
+def format_api_football_fixture(fixture):
+    """Convert an API-Football fixture to an event"""
+    fixture_data = fixture.get('fixture', {})
+    teams = fixture.get('teams', {})
+
+    formatted_event = {
+        'id': str(fixture_data.get('id', '')),
+        'home_team': teams.get('home', {}).get('name', 'Unknown'),
+        'away_team': teams.get('away', {}).get('name', 'Unknown'),
+        'date': fixture_data.get('date', ''),
+        'location': fixture_data.get('venue', {}).get('name', 'Unknown Stadium'),
+        'status': fixture_data.get('status', {}).get('long', 'Scheduled'),
+        'sport': 'football',
+        'provider': 'api-football'
+    }
+
+    # Add score if available
+    goals = fixture.get('goals', {})
+    if goals.get('home') is not None and goals.get('away') is not None:
+        formatted_event['score'] = f"{goals.get('home')}-{goals.get('away')}"
+    return formatted_event
+
 def try_football_teams_endpoint():
     """Try to get at least team data from the football API if fixtures fail"""
-    print("Trying alternative football teams endpoint")
+    logger.debug("Trying alternative football teams endpoint")
     try:
         # API-Football endpoint for teams
-        url = "https://api-football-v1.p.rapidapi.com/v3/teams"
+        url = f"{API_FOOTBALL_API_BASE}/teams"
         
         # Headers including API key
         headers = {
@@ -430,7 +710,7 @@ def try_football_teams_endpoint():
         # Premier League
         querystring = {"league": "39", "season": "2023"}
         
-        response = requests.get(url, headers=headers, params=querystring)
+        response = requests.get(url, headers=headers, params=querystring, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -439,7 +719,7 @@ def try_football_teams_endpoint():
             if not teams:
                 return []
                 
-            print(f"Creating sample fixtures from {len(teams)} football teams")
+            logger.debug("Creating sample fixtures from %s football teams", len(teams))
             
             # Create sample fixtures from teams
             formatted_events = []
@@ -479,134 +759,465 @@ def try_football_teams_endpoint():
                 
                 formatted_events.append(event)
                 
-            print(f"Returning {len(formatted_events)} sample football fixtures")
+            logger.debug("Returning %s sample football fixtures", len(formatted_events))
             return formatted_events
         else:
-            print(f"Football teams API request failed: {response.status_code}")
+            logger.warning("Football teams API request failed: %s", response.status_code)
             return []
     except Exception as e:
-        print(f"Error fetching football teams: {str(e)}")
+        logger.warning("Error fetching football teams: %s", e)
         return []
 
-def get_balldontlie_data(sport_type):
+# Shared limiter so concurrent season windows stay under the API quota
+balldontlie_rate_limiter = RateLimiter(BALLDONTLIE_RATE_LIMIT)
+
+# The background ingest: the process running it (gunicorn forks workers
+# from a preloaded master), when its runs finished (or, in processes
+# without the lease, the runs of the games they applied) and whether a
+# basketball lookup may start it
+balldontlie_ingest_state = {
+    'pid': None,
+    'autostart': True,     # off in the preloaded master, whose workers start their own
+    'last_run': None,      # monotonic time the last run around now finished
+    'last_sweep': None,    # monotonic time the last sweep of the season started
+    'last_ingested': None  # when games were last fetched
+}
+balldontlie_ingest_lock = threading.Lock()
+
+def balldontlie_season(today=None):
+    """NBA season (by starting year) that today falls in; seasons start in October"""
+    today = today or datetime.now(timezone.utc).date()
+    return today.year if today.month >= 10 else today.year - 1
+
+def season_windows(start_date, end_date):
     """
-    Fetch NBA data from BallDontLie API
+    Split [start_date, end_date] into calendar-month windows
+
+    Returns:
+        list: (first day, last day) date tuples
+    """
+    windows = []
+    window_start = start_date
+    while window_start <= end_date:
+        next_month = (window_start.replace(day=1) + timedelta(days=32)).replace(day=1)
+        window_end = min(next_month - timedelta(days=1), end_date)
+        windows.append((window_start, window_end))
+        window_start = next_month
+    return windows
+
+def format_balldontlie_game(game):
+    """Convert a BallDontLie game to an event, or None if it has no id or date"""
+    game_date_str = game.get('datetime') or game.get('date')
+    if not game.get('id') or not game_date_str:
+        return None
+    try:
+        game_date = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if game_date.tzinfo is None:
+        game_date = game_date.replace(tzinfo=timezone.utc)
+
+    home_team = game.get('home_team') or {}
+    away_team = game.get('visitor_team') or {}
+    status = game.get('status') or ''
+    if status == 'Final':
+        event_status = 'COMPLETED'
+    elif game.get('period'):
+        event_status = 'LIVE'
+    else:
+        event_status = 'Scheduled'
+
+    event = {
+        'id': f"basketball-{game.get('id')}",
+        'date': game_date.astimezone(timezone.utc).isoformat(),
+        'home_team': home_team.get('full_name', 'Unknown Team'),
+        'away_team': away_team.get('full_name', 'Unknown Team'),
+        'competition': 'NBA',
+        'venue': f"{home_team.get('city', '')} Arena",
+        'status': event_status,
+        'sport': 'basketball',
+        'provider': 'balldontlie'
+    }
+    if event_status != 'Scheduled':
+        event['home_score'] = game.get('home_team_score')
+        event['away_score'] = game.get('visitor_team_score')
+        event['scores'] = f"{game.get('home_team_score')} - {game.get('visitor_team_score')}"
+    return event
+
+@observe_provider('balldontlie')
+def fetch_balldontlie_window(season, start_date, end_date):
     """
+    Fetch every page of games in one date window, feeding each page into
+    the event store as it arrives
+
+    Returns:
+        list: Events for the window
+    """
+    url = f"{BALLDONTLIE_API_BASE}/games"
+    headers = {'Authorization': BALLDONTLIE_API_KEY} if BALLDONTLIE_API_KEY else {}
+    params = {
+        'seasons[]': season,
+        'start_date': start_date.isoformat(),
+        'end_date': end_date.isoformat(),
+        'per_page': BALLDONTLIE_PAGE_SIZE
+    }
+
     events = []
-    
-    # First try to get real NBA games data
-    print("Fetching NBA teams from Balldontlie API")
-    current_year = datetime.now().year
-    
-    # First try the current year
-    url = f"https://www.balldontlie.io/api/v1/games?seasons[]={current_year}"
-    response = requests.get(url)
-    
-    if response.status_code == 200:
-        try:
-            games_data = response.json()
-            if games_data.get('data') and len(games_data['data']) > 0:
-                # Process games data
-                for game in games_data['data'][:10]:  # Limit to 10 games
-                    game_date_str = game.get('date')
-                    if game_date_str:
-                        game_date = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
-                        # Adjust game date to be relative to today
-                        ist_game_date = adjust_date_to_current(game_date)
-                        
-                        event = {
-                            'id': f"basketball-{game.get('id')}",
-                            'date': ist_game_date.astimezone(timezone.utc).isoformat(),
-                            'home_team': game.get('home_team', {}).get('full_name', 'Unknown Team'),
-                            'away_team': game.get('visitor_team', {}).get('full_name', 'Unknown Team'),
-                            'competition': 'NBA',
-                            'venue': f"{game.get('home_team', {}).get('city', '')} Arena",
-                            'status': 'Scheduled',
-                            'sport': 'basketball',
-                            'scores': f"{game.get('home_team_score')} - {game.get('visitor_team_score')}" if game.get('home_team_score') is not None else None
-                        }
-                        events.append(event)
-                
-                print(f"Found {len(events)} real NBA games for {current_year}")
-                return events
-        except Exception as e:
-            print(f"Error processing Balldontlie API response: {e}")
-    
-    # Try previous year if current year failed
-    if len(events) == 0:
-        previous_year = current_year - 1
-        url = f"https://www.balldontlie.io/api/v1/games?seasons[]={previous_year}"
-        
+    cursor = None
+    while True:
+        if cursor is not None:
+            params['cursor'] = cursor
+        balldontlie_rate_limiter.wait()
+        response = requests.get(url, params=params, headers=headers, timeout=10)
+        response.raise_for_status()
+        payload = response.json()
+
+        page = [event for event in map(format_balldontlie_game, payload.get('data') or []) if event]
+        feed_events(page)
+        events.extend(page)
+
+        cursor = (payload.get('meta') or {}).get('next_cursor')
+        if not cursor:
+            return events
+
+def ingest_balldontlie_games(sweep=False, today=None):
+    """
+    Ingest the games around today, or with sweep the rest of the season
+    after them, into the event store
+
+    The dates are fetched as calendar-month windows on a bounded pool.
+
+    Args:
+        sweep (bool): Fetch from the end of the window around today to the
+            end of the season instead
+        today (date): Current UTC date, default today
+
+    Returns:
+        int: Number of games fetched, or 0 if every window failed
+    """
+    today = today or datetime.now(timezone.utc).date()
+    window_end = today + timedelta(days=BALLDONTLIE_DAYS_AHEAD)
+    if sweep:
+        start_date = window_end + timedelta(days=1)
+        end_date = datetime(balldontlie_season(window_end) + 1, 6, 30).date()
+    else:
+        start_date = today - timedelta(days=BALLDONTLIE_DAYS_BACK)
+        end_date = window_end
+
+    # Calendar months never span two seasons
+    windows = season_windows(start_date, end_date)
+    logger.debug("BallDontLie: ingesting games from %s to %s in %s windows", start_date, end_date, len(windows))
+    results = fetch_concurrently(lambda window: fetch_balldontlie_window(balldontlie_season(window[0]), *window),
+                                 windows, max_workers=BALLDONTLIE_CONCURRENCY)
+
+    fetched = 0
+    fetched_ids = set()
+    failed = False
+    for (window_start, _), result in zip(windows, results):
+        if isinstance(result, Exception):
+            logger.warning("Error fetching BallDontLie games from %s: %s", window_start, result)
+            failed = True
+            continue
+        fetched += len(result)
+        fetched_ids.update(event['id'] for event in result)
+
+    if not failed:
+        # Games stored for these dates that the API no longer lists were
+        # cancelled or moved out of them
+        start_timestamp = datetime.combine(start_date, datetime.min.time(), timezone.utc).timestamp()
+        end_timestamp = datetime.combine(end_date + timedelta(days=1), datetime.min.time(), timezone.utc).timestamp()
+        stale = [report['id'] for event in events_in_range('basketball', start_timestamp, end_timestamp)
+                 for report in fixture_reports(event['id'])
+                 if report.get('provider') == 'balldontlie' and report['id'] not in fetched_ids]
+        if stale:
+            withdraw_events(stale)
+            logger.debug("BallDontLie: withdrew %s games no longer listed", len(stale))
+    if fetched:
+        balldontlie_ingest_state['last_ingested'] = datetime.now(timezone.utc)
+    logger.debug("BallDontLie: fetched %s games", fetched)
+    return fetched
+
+def publish_balldontlie_games(snapshot):
+    """
+    Publish every stored BallDontLie game for the processes that do not ingest
+
+    Args:
+        snapshot: RedisSnapshot or FileSnapshot to write
+    """
+    with fixture_registry_lock:
+        games = [report for report in fixture_registry['reports'].values() if report.get('provider') == 'balldontlie']
+    now = time.monotonic()
+    last_sweep = balldontlie_ingest_state['last_sweep']
+    snapshot.publish({
+        'games': games,
+        'ingested_at': time.time(),
+        'swept_at': time.time() - (now - last_sweep) if last_sweep is not None else None
+    })
+
+def sync_balldontlie_games(snapshot):
+    """
+    Make this process's BallDontLie games those the ingesting process last
+    published: its games are stored and any other stored game is withdrawn
+
+    Args:
+        snapshot: RedisSnapshot or FileSnapshot to read
+
+    Returns:
+        list: Stored versions of the events that were new or changed, or an
+        empty list if nothing was published since the last call
+    """
+    document = snapshot.read()
+    if not document:
+        return []
+    games = document.get('games', [])
+    game_ids = {str(game['id']) for game in games}
+    with fixture_registry_lock:
+        stale = [report_id for report_id, report in fixture_registry['reports'].items()
+                 if report.get('provider') == 'balldontlie' and report_id not in game_ids]
+    if stale:
+        withdraw_events(stale)
+    changed = feed_events(games)
+
+    # Carry the holder's schedule over, in case this process takes over
+    now = time.monotonic()
+    balldontlie_ingest_state['last_run'] = now - max(0.0, time.time() - document['ingested_at'])
+    if document.get('swept_at') is not None:
+        balldontlie_ingest_state['last_sweep'] = now - max(0.0, time.time() - document['swept_at'])
+    logger.debug("BallDontLie: applied %s published games (%s changed, %s withdrawn)",
+                 len(games), len(changed), len(stale))
+    return changed
+
+def balldontlie_ingest_tick(lease, snapshot):
+    """
+    One step of the ingest loop
+
+    The lease holder ingests the games around now when its last run is
+    BALLDONTLIE_REFRESH_INTERVAL seconds old, then the rest of the season
+    when the last sweep is BALLDONTLIE_SWEEP_INTERVAL seconds old, and
+    publishes the stored games; any other process applies them.
+
+    Args:
+        lease: RedisLease or FileLease deciding which process ingests
+        snapshot: RedisSnapshot or FileSnapshot carrying the games
+
+    Returns:
+        bool: True if this process ingested
+    """
+    if not lease.acquire():
         try:
-            response = requests.get(url)
-            if response.status_code == 200:
-                games_data = response.json()
-                if games_data.get('data') and len(games_data['data']) > 0:
-                    print(f"Found games from previous season ({previous_year})")
-                    # Process games data
-                    for game in games_data['data'][:10]:  # Limit to 10 games
-                        game_date_str = game.get('date')
-                        if game_date_str:
-                            game_date = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
-                            # Adjust game date to be relative to today
-                            ist_game_date = adjust_date_to_current(game_date)
-                            
-                            event = {
-                                'id': f"basketball-{game.get('id')}",
-                                'date': ist_game_date.astimezone(timezone.utc).isoformat(),
-                                'home_team': game.get('home_team', {}).get('full_name', 'Unknown Team'),
-                                'away_team': game.get('visitor_team', {}).get('full_name', 'Unknown Team'),
-                                'competition': 'NBA',
-                                'venue': f"{game.get('home_team', {}).get('city', '')} Arena",
-                                'status': 'Scheduled',
-                                'sport': 'basketball',
-                                'scores': f"{game.get('home_team_score')} - {game.get('visitor_team_score')}" if game.get('home_team_score') is not None else None
-                            }
-                            events.append(event)
-                    print(f"Found {len(events)} real NBA games for {previous_year}")
-                    return events
-        except Exception as e:
-            print(f"Error processing Balldontlie API for previous year: {e}")
-    
-    # If no real games found, try to get teams and create sample games
-    print(f"Failed to get games, status code: {response.status_code}")
-    teams_url = "https://www.balldontlie.io/api/v1/teams"
-    response = requests.get(teams_url)
-    
-    if response.status_code == 200:
+            sync_balldontlie_games(snapshot)
+        except Exception:
+            logger.exception("BallDontLie games sync failed")
+        return False
+
+    last_run = balldontlie_ingest_state['last_run']
+    if last_run is not None and time.monotonic() - last_run < BALLDONTLIE_REFRESH_INTERVAL:
+        return False
+    try:
+        ingest_balldontlie_games()
+    except Exception:
+        logger.exception("BallDontLie ingest failed")
+    balldontlie_ingest_state['last_run'] = time.monotonic()
+
+    last_sweep = balldontlie_ingest_state['last_sweep']
+    if last_sweep is None or time.monotonic() - last_sweep >= BALLDONTLIE_SWEEP_INTERVAL:
+        balldontlie_ingest_state['last_sweep'] = time.monotonic()
         try:
-            teams_data = response.json()
-            if teams_data.get('data'):
-                teams = teams_data['data']
-                events = create_sample_games_from_teams(teams)
-                return events
-        except Exception as e:
-            print(f"Error processing teams data: {e}")
-    
+            ingest_balldontlie_games(sweep=True)
+        except Exception:
+            logger.exception("BallDontLie season sweep failed")
+    publish_balldontlie_games(snapshot)
+    return True
+
+def run_balldontlie_ingest():
+    """
+    Run the ingest loop forever, one balldontlie_ingest_tick every
+    BALLDONTLIE_SYNC_INTERVAL seconds
+    """
+    lease = shared_lease(BALLDONTLIE_REDIS_URL, BALLDONTLIE_LEASE_KEY, BALLDONTLIE_LEASE_TTL, BALLDONTLIE_LOCK_FILE)
+    snapshot = shared_snapshot(BALLDONTLIE_REDIS_URL, BALLDONTLIE_GAMES_KEY, BALLDONTLIE_GAMES_FILE)
+    while True:
+        balldontlie_ingest_tick(lease, snapshot)
+        time.sleep(BALLDONTLIE_SYNC_INTERVAL)
+
+def start_balldontlie_ingest():
+    """
+    Start the BallDontLie ingest loop in a background thread, once per process
+
+    Every process runs the loop, but only the one holding the ingest lease
+    calls the API; the others apply the games it publishes.
+
+    Returns:
+        bool: True if the ingest was started
+    """
+    if API_PROVIDER == 'demo':
+        return False
+    with balldontlie_ingest_lock:
+        if balldontlie_ingest_state['pid'] == os.getpid():
+            return False
+        balldontlie_ingest_state.update(pid=os.getpid(), last_run=None, last_sweep=None)
+    threading.Thread(target=run_balldontlie_ingest, name='balldontlie-ingest', daemon=True).start()
+    return True
+
+def get_balldontlie_data(sport_type):
+    """
+    Fetch NBA data from BallDontLie API
+
+    Games are ingested into the event store in the background (see
+    run_balldontlie_ingest), which the first lookup starts, and reach the
+    views from there, so while any ingested game is upcoming this returns
+    nothing. Fixtures are made up only once an ingest run found no games;
+    the refresh that stores them withdraws them again when games arrive.
+    """
+    if balldontlie_ingest_state['autostart']:
+        start_balldontlie_ingest()
+
+    events = events_in_range('basketball', start_timestamp=upcoming_since())
+    if any(event.get('provider') == 'balldontlie' for event in events):
+        logger.debug("Upcoming NBA games are in the event store")
+        return []
+    if balldontlie_ingest_state['last_run'] is None:
+        # The games join the views as they are ingested
+        logger.debug("BallDontLie ingest has not finished a run yet")
+        return []
+
+    # No games stored (off-season or API unavailable) - build fixtures from real teams
+    logger.debug("No stored NBA games, fetching teams from Balldontlie API")
+    headers = {'Authorization': BALLDONTLIE_API_KEY} if BALLDONTLIE_API_KEY else {}
+    try:
+        response = requests.get(f"{BALLDONTLIE_API_BASE}/teams", headers=headers, timeout=10)
+        if response.status_code == 200:
+            teams = response.json().get('data')
+            if teams:
+                return create_sample_games_from_teams(teams)
+        else:
+            logger.warning("Balldontlie teams request failed: %s", response.status_code)
+    except Exception as e:
+        logger.warning("Error fetching Balldontlie teams: %s", e)
+
     # If all else fails, generate sample games
-    print("Generating basketball fixtures as fallback")
+    logger.debug("Generating basketball fixtures as fallback")
     events = generate_sample_games()
     return events
 
+@observe_provider('balldontlie')
+def refresh_balldontlie_games(events):
+    """
+    Current state of BallDontLie games, for the live poller
+
+    Args:
+        events (list): Stored events of the games to refresh
+
+    Returns:
+        list: Refreshed events
+    """
+    game_ids = [str(event['id']).rsplit('-', 1)[-1] for event in events]
+    headers = {'Authorization': BALLDONTLIE_API_KEY} if BALLDONTLIE_API_KEY else {}
+    refreshed = []
+    for start in range(0, len(game_ids), BALLDONTLIE_PAGE_SIZE):
+        balldontlie_rate_limiter.wait()
+        response = requests.get(f"{BALLDONTLIE_API_BASE}/games",
+                                params={'game_ids[]': game_ids[start:start + BALLDONTLIE_PAGE_SIZE],
+                                        'per_page': BALLDONTLIE_PAGE_SIZE},
+                                headers=headers, timeout=10)
+        response.raise_for_status()
+        refreshed.extend(event for event in map(format_balldontlie_game, response.json().get('data') or []) if event)
+    return refreshed
+
+@observe_provider('api-football')
+def refresh_api_football_fixtures(events):
+    """
+    Current state of API-Football fixtures, for the live poller
+
+    Args:
+        events (list): Stored events of the fixtures to refresh
+
+    Returns:
+        list: Refreshed events
+    """
+    fixture_ids = [str(event['id']) for event in events]
+    headers = {
+        "X-RapidAPI-Key": FOOTBALL_API_KEY,
+        "X-RapidAPI-Host": "api-football-v1.p.rapidapi.com"
+    }
+    refreshed = []
+    # The fixtures endpoint takes up to 20 ids per request
+    for start in range(0, len(fixture_ids), 20):
+        response = requests.get(f"{API_FOOTBALL_API_BASE}/fixtures",
+                                params={'ids': '-'.join(fixture_ids[start:start + 20])},
+                                headers=headers, timeout=10)
+        response.raise_for_status()
+        refreshed.extend(format_api_football_fixture(fixture) for fixture in response.json().get('response', []))
+    return refreshed
+
+def refresh_demo_events(events):
+    """Current state of demo fixtures, for the live poller"""
+    return get_demo_engine().events_by_id([event['id'] for event in events])
+
+# Provider of an event ('provider' field) -> function returning the current
+# state of a batch of its events; the live poller only polls these providers
+live_refreshers = {
+    'balldontlie': refresh_balldontlie_games,
+    'api-football': refresh_api_football_fixtures,
+    'demo': refresh_demo_events
+}
+
+# Fallback datasets, built at most once per day (IST) by fallback_snapshot
+fallback_snapshots = {}  # (generator, key) -> (IST date, tuple of events)
+fallback_snapshots_lock = threading.Lock()
+
+def fallback_snapshot(name, build, key=None):
+    """
+    Today's events of a fallback generator, building them on the first call of the day
+
+    The snapshot is never handed out directly; callers get fresh copies of
+    its events so they can annotate them freely.
+
+    Args:
+        name (str): Generator name
+        build (callable): Called with the current IST datetime, returns the events
+        key (hashable): Extra cache key for generators that depend on their input
+
+    Returns:
+        list: Copies of the snapshot events
+    """
+    now_ist = get_current_datetime(IST)
+    cache_key = (name, key)
+    with fallback_snapshots_lock:
+        cached = fallback_snapshots.get(cache_key)
+    if cached is None or cached[0] != now_ist.date():
+        cached = (now_ist.date(), tuple(build(now_ist)))
+        with fallback_snapshots_lock:
+            fallback_snapshots[cache_key] = cached
+        logger.debug("Built %s fallback snapshot with %s events", name, len(cached[1]))
+    return [dict(event) for event in cached[1]]
+
+def relative_day_text(event_date, today):
+    """'Today', 'Tomorrow' or 'In N days' for a date relative to today"""
+    days_from_now = (event_date - today).days
+    if days_from_now == 0:
+        return "Today"
+    if days_from_now == 1:
+        return "Tomorrow"
+    return f"In {days_from_now} days"
+
 def create_sample_games_from_teams(teams):
     """Create sample games using real NBA teams"""
-    print("Creating sample games from real NBA teams")
-    
-    # Pre-defined matchups for fixed fixtures
-    matchups = []
-    for i in range(min(10, len(teams) // 2)):
-        matchups.append((i*2, i*2+1))
-    
-    # Current time in IST
-    now_ist = get_current_datetime()
+    sports_fallback.inc(generator='create_sample_games_from_teams')
+    teams = teams[:20]
+    key = tuple((team.get('full_name'), team.get('city')) for team in teams)
+    return fallback_snapshot('nba_teams', lambda now_ist: _build_games_from_teams(teams, now_ist), key)
+
+def _build_games_from_teams(teams, now_ist):
+    logger.debug("Creating sample games from real NBA teams")
     today = now_ist.replace(hour=0, minute=0, second=0, microsecond=0)
     
     formatted_events = []
     
     # Create 10 fixed fixtures with staggered times
-    for i, (home_idx, away_idx) in enumerate(matchups):
-        home_team = teams[home_idx]
-        away_team = teams[away_idx]
+    for i in range(min(10, len(teams) // 2)):
+        home_team = teams[i * 2]
+        away_team = teams[i * 2 + 1]
         
         # Create match date (staggered over next 10 days with different times)
         days_offset = i % 5  # Spread across 5 days
@@ -626,118 +1237,102 @@ def create_sample_games_from_teams(teams):
             'date': game_date_utc.strftime('%Y-%m-%dT%H:%M:%SZ'),
             'location': f"{home_team.get('city', '')} Arena",
             'status': 'Upcoming',
-            'sport': 'basketball',
-            'ist_date': game_date_ist.strftime('%Y-%m-%d %H:%M IST')
+            'sport': 'basketball'
         }
         formatted_events.append(formatted_event)
     
     return formatted_events
 
+# NBA team name -> city
+NBA_TEAM_CITIES = {
+    "Boston Celtics": "Boston",
+    "Brooklyn Nets": "Brooklyn",
+    "New York Knicks": "New York",
+    "Philadelphia 76ers": "Philadelphia",
+    "Toronto Raptors": "Toronto",
+    "Chicago Bulls": "Chicago",
+    "Cleveland Cavaliers": "Cleveland",
+    "Detroit Pistons": "Detroit",
+    "Indiana Pacers": "Indiana",
+    "Milwaukee Bucks": "Milwaukee",
+    "Atlanta Hawks": "Atlanta",
+    "Charlotte Hornets": "Charlotte",
+    "Miami Heat": "Miami",
+    "Orlando Magic": "Orlando",
+    "Washington Wizards": "Washington",
+    "Denver Nuggets": "Denver",
+    "Minnesota Timberwolves": "Minnesota",
+    "Oklahoma City Thunder": "Oklahoma City",
+    "Portland Trail Blazers": "Portland",
+    "Utah Jazz": "Utah"
+}
+
+# Actual NBA fixtures for April 2024, times in US Eastern
+NBA_FIXTURES = [
+    {"day": 7, "month": 4, "year": 2024, "hour": 19, "minute": 0, "home": "Boston Celtics", "away": "Portland Trail Blazers"},
+    {"day": 7, "month": 4, "year": 2024, "hour": 20, "minute": 30, "home": "New York Knicks", "away": "Chicago Bulls"},
+    {"day": 8, "month": 4, "year": 2024, "hour": 19, "minute": 0, "home": "Cleveland Cavaliers", "away": "Memphis Grizzlies"},
+    {"day": 9, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Milwaukee Bucks", "away": "Boston Celtics"},
+    {"day": 9, "month": 4, "year": 2024, "hour": 20, "minute": 0, "home": "Orlando Magic", "away": "Houston Rockets"},
+    {"day": 10, "month": 4, "year": 2024, "hour": 19, "minute": 0, "home": "Atlanta Hawks", "away": "Charlotte Hornets"},
+    {"day": 10, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Brooklyn Nets", "away": "Toronto Raptors"},
+    {"day": 11, "month": 4, "year": 2024, "hour": 19, "minute": 0, "home": "Philadelphia 76ers", "away": "Orlando Magic"},
+    {"day": 12, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Washington Wizards", "away": "Chicago Bulls"},
+    {"day": 12, "month": 4, "year": 2024, "hour": 20, "minute": 0, "home": "Indiana Pacers", "away": "Cleveland Cavaliers"},
+]
+
+# Eastern timezone (NBA times are typically in ET)
+ET = pytz.timezone('US/Eastern')
+
 def generate_sample_games():
     """Generate completely hardcoded sample games when all else fails"""
-    
-    # List of NBA teams
-    nba_teams = [
-        {"full_name": "Boston Celtics", "city": "Boston"},
-        {"full_name": "Brooklyn Nets", "city": "Brooklyn"},
-        {"full_name": "New York Knicks", "city": "New York"},
-        {"full_name": "Philadelphia 76ers", "city": "Philadelphia"},
-        {"full_name": "Toronto Raptors", "city": "Toronto"},
-        {"full_name": "Chicago Bulls", "city": "Chicago"},
-        {"full_name": "Cleveland Cavaliers", "city": "Cleveland"},
-        {"full_name": "Detroit Pistons", "city": "Detroit"},
-        {"full_name": "Indiana Pacers", "city": "Indiana"},
-        {"full_name": "Milwaukee Bucks", "city": "Milwaukee"},
-        {"full_name": "Atlanta Hawks", "city": "Atlanta"},
-        {"full_name": "Charlotte Hornets", "city": "Charlotte"},
-        {"full_name": "Miami Heat", "city": "Miami"},
-        {"full_name": "Orlando Magic", "city": "Orlando"},
-        {"full_name": "Washington Wizards", "city": "Washington"},
-        {"full_name": "Denver Nuggets", "city": "Denver"},
-        {"full_name": "Minnesota Timberwolves", "city": "Minnesota"},
-        {"full_name": "Oklahoma City Thunder", "city": "Oklahoma City"},
-        {"full_name": "Portland Trail Blazers", "city": "Portland"},
-        {"full_name": "Utah Jazz", "city": "Utah"}
-    ]
-    
-    # Actual NBA fixtures for April 2024
-    nba_fixtures = [
-        {"day": 7, "month": 4, "year": 2024, "hour": 19, "minute": 0, "home": "Boston Celtics", "away": "Portland Trail Blazers"},
-        {"day": 7, "month": 4, "year": 2024, "hour": 20, "minute": 30, "home": "New York Knicks", "away": "Chicago Bulls"},
-        {"day": 8, "month": 4, "year": 2024, "hour": 19, "minute": 0, "home": "Cleveland Cavaliers", "away": "Memphis Grizzlies"},
-        {"day": 9, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Milwaukee Bucks", "away": "Boston Celtics"},
-        {"day": 9, "month": 4, "year": 2024, "hour": 20, "minute": 0, "home": "Orlando Magic", "away": "Houston Rockets"},
-        {"day": 10, "month": 4, "year": 2024, "hour": 19, "minute": 0, "home": "Atlanta Hawks", "away": "Charlotte Hornets"},
-        {"day": 10, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Brooklyn Nets", "away": "Toronto Raptors"},
-        {"day": 11, "month": 4, "year": 2024, "hour": 19, "minute": 0, "home": "Philadelphia 76ers", "away": "Orlando Magic"},
-        {"day": 12, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Washington Wizards", "away": "Chicago Bulls"},
-        {"day": 12, "month": 4, "year": 2024, "hour": 20, "minute": 0, "home": "Indiana Pacers", "away": "Cleveland Cavaliers"},
-    ]
-    
-    # Eastern timezone (NBA times are typically in ET)
-    ET = pytz.timezone('US/Eastern')
-    
-    # Get the current date in IST for reference
-    reference_now = get_current_datetime(IST)
-    
+    sports_fallback.inc(generator='generate_sample_games')
+    return fallback_snapshot('basketball', _build_sample_games)
+
+def _build_sample_games(reference_now):
     events = []
     
     # Create matches with realistic fixture dates
-    for i, fixture in enumerate(nba_fixtures):
-        # Get team names
-        home_team_name = fixture.get("home")
-        away_team_name = fixture.get("away")
-        
-        # Find team details or create placeholder
-        home_team = next((team for team in nba_teams if team["full_name"] == home_team_name), {"full_name": home_team_name, "city": "Unknown"})
-        away_team = next((team for team in nba_teams if team["full_name"] == away_team_name), {"full_name": away_team_name, "city": "Unknown"})
+    for i, fixture in enumerate(NBA_FIXTURES):
+        home_team_name = fixture["home"]
+        away_team_name = fixture["away"]
         
         # Create datetime object in ET (Eastern Time) based on 2024 schedule
-        game_date_et_original = datetime(
+        game_date_et_original = ET.localize(datetime(
             year=fixture["year"], 
             month=fixture["month"], 
             day=fixture["day"],
             hour=fixture["hour"], 
             minute=fixture["minute"]
-        )
-        game_date_et_original = ET.localize(game_date_et_original)
+        ))
         
         # Adjust date to be relative to current date while preserving time of day
         game_date_et = adjust_date_to_current(game_date_et_original, reference_now)
         
-        # Convert ET time to IST for display
+        # IST date for the relative day label
         game_date_ist = game_date_et.astimezone(IST)
         
         # Convert ET time to UTC for storage
         game_date_utc = game_date_et.astimezone(timezone.utc)
         
-        # Calculate days from now for display
-        days_from_now = (game_date_ist.date() - get_current_datetime(IST).date()).days
-        if days_from_now == 0:
-            days_text = "Today"
-        elif days_from_now == 1:
-            days_text = "Tomorrow"
-        else:
-            days_text = f"In {days_from_now} days"
-        
         event = {
             'id': f"basketball-{i}",
-            'home_team': home_team['full_name'],
-            'away_team': away_team['full_name'],
+            'home_team': home_team_name,
+            'away_team': away_team_name,
             'date': game_date_utc.strftime('%Y-%m-%dT%H:%M:%SZ'),
-            'location': f"{home_team['city']} Arena",
+            'location': f"{NBA_TEAM_CITIES.get(home_team_name, 'Unknown')} Arena",
             'status': 'Upcoming',
             'sport': 'basketball',
             'competition': 'NBA',
-            'ist_date': game_date_ist.strftime('%Y-%m-%d %H:%M IST'),
-            'relative_time': days_text
+            'relative_time': relative_day_text(game_date_ist.date(), reference_now.date())
         }
         
         events.append(event)
     
-    print(f"Generated {len(events)} basketball fixtures")
+    logger.debug("Generated %s basketball fixtures", len(events))
     return events
 
+@observe_provider('cricapi')
 def get_cricket_data(sport_type):
     """
     Fetch cricket matches data from CricAPI
@@ -746,12 +1341,12 @@ def get_cricket_data(sport_type):
     """
     # Clear cache for cricket data
     if 'cricket' in sports_data_cache['data']:
-        print("Clearing cricket data cache to update IPL year")
+        logger.debug("Clearing cricket data cache to update IPL year")
         del sports_data_cache['data']['cricket']
     
     # Clear 'all' cache too since it contains cricket data
     if 'all' in sports_data_cache['data']:
-        print("Clearing all sports cache to update IPL year")
+        logger.debug("Clearing all sports cache to update IPL year")
         del sports_data_cache['data']['all']
     
     # Only fetch cricket data if requested
@@ -759,16 +1354,15 @@ def get_cricket_data(sport_type):
         return []
         
     if not CRICKET_API_KEY:
-        print("No Cricket API key provided")
+        logger.debug("No Cricket API key provided")
         return generate_cricket_data()
     
     try:
-        print("=================== CRICKET API DEBUG ===================")
-        print(f"API Key: {CRICKET_API_KEY[:5]}...{CRICKET_API_KEY[-5:]}")
-        print("Fetching cricket matches from CricAPI")
+        logger.debug("=================== CRICKET API DEBUG ===================")
+        logger.debug("Fetching cricket matches from CricAPI")
         
         # CricAPI endpoint for upcoming matches
-        url = "https://api.cricapi.com/v1/matches"
+        url = f"{CRICAPI_API_BASE}/matches"
         
         # Query parameters
         params = {
@@ -776,25 +1370,25 @@ def get_cricket_data(sport_type):
             "offset": 0
         }
         
-        print(f"Making API request to: {url}")
+        logger.debug("Making API request to: %s", url)
         
-        response = requests.get(url, params=params)
+        response = requests.get(url, params=params, timeout=10)
         
-        print(f"API response status code: {response.status_code}")
+        logger.debug("API response status code: %s", response.status_code)
         
         if response.status_code == 200:
             data = response.json()
-            print(f"API response keys: {data.keys() if data else 'No data'}")
+            logger.debug("API response keys: %s", data.keys() if data else 'No data')
             
             if data.get('status') != 'success':
-                print(f"API error: {data.get('message', 'Unknown error')}")
+                logger.warning("API error: %s", data.get('message', 'Unknown error'))
                 return generate_cricket_data()
             
             matches = data.get('data', [])
-            print(f"Found {len(matches)} cricket matches")
+            logger.debug("Found %s cricket matches", len(matches))
             
             if not matches:
-                print("API returned empty matches array")
+                logger.debug("API returned empty matches array")
                 return generate_cricket_data()
             
             # Format matches to match our application format
@@ -807,10 +1401,12 @@ def get_cricket_data(sport_type):
                         'id': str(match.get('id', '')),
                         'home_team': match.get('teams', [])[0] if len(match.get('teams', [])) > 0 else 'Unknown',
                         'away_team': match.get('teams', [])[1] if len(match.get('teams', [])) > 1 else 'Unknown',
-                        'date': match.get('date', ''),
+                        # dateTimeGMT has the start time; date may be the day only
+                        'date': match.get('dateTimeGMT') or match.get('date', ''),
                         'location': match.get('venue', 'Unknown Stadium'),
                         'status': 'Scheduled',
-                        'sport': 'cricket'
+                        'sport': 'cricket',
+                        'provider': 'cricapi'
                     }
                     
                     # Add match type information
@@ -818,87 +1414,62 @@ def get_cricket_data(sport_type):
                     
                     formatted_events.append(formatted_event)
                 
-            print(f"Returning {len(formatted_events)} formatted cricket matches")
-            print("=================== END CRICKET API DEBUG ===================")
+            logger.debug("Returning %s formatted cricket matches", len(formatted_events))
+            logger.debug("=================== END CRICKET API DEBUG ===================")
             return formatted_events
         else:
-            print(f"Cricket API request failed with status code: {response.status_code}")
+            logger.warning("Cricket API request failed with status code: %s", response.status_code)
             if response.status_code == 429:
-                print("Rate limit exceeded for Cricket API")
+                logger.warning("Rate limit exceeded for Cricket API")
             elif response.status_code == 401:
-                print("Unauthorized - API key may be invalid")
+                logger.warning("Unauthorized - API key may be invalid")
                 # Try to decode response for more info
                 try:
                     error_data = response.json()
-                    print(f"Error response: {error_data}")
+                    logger.warning("Error response: %s", error_data)
                 except:
-                    print(f"Raw response: {response.text[:200]}")
+                    logger.warning("Raw response: %s", response.text[:200])
             
             # Fall back to generated data
             return generate_cricket_data()
             
     except Exception as e:
-        print(f"Error fetching cricket data: {str(e)}")
+        logger.warning("Error fetching cricket data: %s", e)
         return generate_cricket_data()
 
+# Actual IPL 2024 fixtures for April, times in IST
+IPL_FIXTURES = [
+    {"day": 7, "month": 4, "year": 2024, "hour": 15, "minute": 30, "home": "Royal Challengers Bangalore", "away": "Rajasthan Royals", "venue": "M. Chinnaswamy Stadium, Bangalore"},
+    {"day": 7, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Gujarat Titans", "away": "Lucknow Super Giants", "venue": "Narendra Modi Stadium, Ahmedabad"},
+    {"day": 8, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Mumbai Indians", "away": "Chennai Super Kings", "venue": "Wankhede Stadium, Mumbai"},
+    {"day": 9, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Delhi Capitals", "away": "Kolkata Knight Riders", "venue": "Arun Jaitley Stadium, Delhi"},
+    {"day": 10, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Punjab Kings", "away": "Sunrisers Hyderabad", "venue": "Punjab Cricket Association Stadium, Mohali"},
+    {"day": 11, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Rajasthan Royals", "away": "Gujarat Titans", "venue": "Sawai Mansingh Stadium, Jaipur"},
+    {"day": 12, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Mumbai Indians", "away": "Royal Challengers Bangalore", "venue": "Wankhede Stadium, Mumbai"},
+    {"day": 13, "month": 4, "year": 2024, "hour": 15, "minute": 30, "home": "Chennai Super Kings", "away": "Sunrisers Hyderabad", "venue": "MA Chidambaram Stadium, Chennai"},
+    {"day": 13, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Lucknow Super Giants", "away": "Kolkata Knight Riders", "venue": "Ekana Cricket Stadium, Lucknow"},
+    {"day": 14, "month": 4, "year": 2024, "hour": 15, "minute": 30, "home": "Delhi Capitals", "away": "Mumbai Indians", "venue": "Arun Jaitley Stadium, Delhi"}
+]
+
 def generate_cricket_data():
     """Generate reliable cricket data directly without external API calls"""
-    print("Generating cricket fixtures directly")
-    
-    # IPL Teams for 2024
-    ipl_teams = [
-        {"name": "Mumbai Indians", "city": "Mumbai"},
-        {"name": "Chennai Super Kings", "city": "Chennai"},
-        {"name": "Royal Challengers Bangalore", "city": "Bangalore"},
-        {"name": "Rajasthan Royals", "city": "Jaipur"},
-        {"name": "Kolkata Knight Riders", "city": "Kolkata"},
-        {"name": "Delhi Capitals", "city": "Delhi"},
-        {"name": "Punjab Kings", "city": "Mohali"},
-        {"name": "Sunrisers Hyderabad", "city": "Hyderabad"},
-        {"name": "Gujarat Titans", "city": "Ahmedabad"},
-        {"name": "Lucknow Super Giants", "city": "Lucknow"}
-    ]
-    
-    # Actual IPL 2024 fixtures for April
-    ipl_fixtures = [
-        {"day": 7, "month": 4, "year": 2024, "hour": 15, "minute": 30, "home": "Royal Challengers Bangalore", "away": "Rajasthan Royals", "venue": "M. Chinnaswamy Stadium, Bangalore"},
-        {"day": 7, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Gujarat Titans", "away": "Lucknow Super Giants", "venue": "Narendra Modi Stadium, Ahmedabad"},
-        {"day": 8, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Mumbai Indians", "away": "Chennai Super Kings", "venue": "Wankhede Stadium, Mumbai"},
-        {"day": 9, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Delhi Capitals", "away": "Kolkata Knight Riders", "venue": "Arun Jaitley Stadium, Delhi"},
-        {"day": 10, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Punjab Kings", "away": "Sunrisers Hyderabad", "venue": "Punjab Cricket Association Stadium, Mohali"},
-        {"day": 11, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Rajasthan Royals", "away": "Gujarat Titans", "venue": "Sawai Mansingh Stadium, Jaipur"},
-        {"day": 12, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Mumbai Indians", "away": "Royal Challengers Bangalore", "venue": "Wankhede Stadium, Mumbai"},
-        {"day": 13, "month": 4, "year": 2024, "hour": 15, "minute": 30, "home": "Chennai Super Kings", "away": "Sunrisers Hyderabad", "venue": "MA Chidambaram Stadium, Chennai"},
-        {"day": 13, "month": 4, "year": 2024, "hour": 19, "minute": 30, "home": "Lucknow Super Giants", "away": "Kolkata Knight Riders", "venue": "Ekana Cricket Stadium, Lucknow"},
-        {"day": 14, "month": 4, "year": 2024, "hour": 15, "minute": 30, "home": "Delhi Capitals", "away": "Mumbai Indians", "venue": "Arun Jaitley Stadium, Delhi"}
-    ]
-    
-    # Indian timezone (IST) - Already defined globally as IST
-    # Get the current date in IST for reference
-    reference_now = get_current_datetime(IST)
-    
+    sports_fallback.inc(generator='generate_cricket_data')
+    return fallback_snapshot('cricket', _build_cricket_data)
+
+def _build_cricket_data(reference_now):
+    logger.debug("Generating cricket fixtures directly")
     events = []
     
     # Create matches with realistic fixture dates
-    for i, fixture in enumerate(ipl_fixtures):
-        # Get team names
-        home_team_name = fixture.get("home")
-        away_team_name = fixture.get("away")
-        venue = fixture.get("venue")
-        
-        # Find team details or create placeholder
-        home_team = next((team for team in ipl_teams if team["name"] == home_team_name), {"name": home_team_name, "city": "Unknown"})
-        away_team = next((team for team in ipl_teams if team["name"] == away_team_name), {"name": away_team_name, "city": "Unknown"})
-        
+    for i, fixture in enumerate(IPL_FIXTURES):
         # Create datetime object directly in IST based on 2024 schedule
-        game_date_ist_original = datetime(
+        game_date_ist_original = IST.localize(datetime(
             year=fixture["year"], 
             month=fixture["month"], 
             day=fixture["day"],
             hour=fixture["hour"], 
             minute=fixture["minute"]
-        )
-        game_date_ist_original = IST.localize(game_date_ist_original)
+        ))
         
         # Adjust date to be relative to current date while preserving time of day
         game_date_ist = adjust_date_to_current(game_date_ist_original, reference_now)
@@ -906,127 +1477,117 @@ def generate_cricket_data():
         # Convert IST to UTC for storage
         game_date_utc = game_date_ist.astimezone(timezone.utc)
         
-        # Calculate days from now for display
-        days_from_now = (game_date_ist.date() - get_current_datetime(IST).date()).days
-        if days_from_now == 0:
-            days_text = "Today"
-        elif days_from_now == 1:
-            days_text = "Tomorrow"
-        else:
-            days_text = f"In {days_from_now} days"
-        
         event = {
             'id': f"cricket-{i}",
-            'home_team': home_team['name'],
-            'away_team': away_team['name'],
+            'home_team': fixture["home"],
+            'away_team': fixture["away"],
             'date': game_date_utc.strftime('%Y-%m-%dT%H:%M:%SZ'),
-            'location': venue,
+            'location': fixture["venue"],
             'status': 'Scheduled',
             'sport': 'cricket',
             'competition': 'IPL 2025',
-            'ist_date': game_date_ist.strftime('%Y-%m-%d %H:%M IST'),
             'format': 'T20',
-            'relative_time': days_text
+            'relative_time': relative_day_text(game_date_ist.date(), reference_now.date())
         }
         
         events.append(event)
     
-    print(f"Generated {len(events)} cricket fixtures")
+    logger.debug("Generated %s cricket fixtures", len(events))
     return events
 
+# Premier League teams with their cities
+PREMIER_LEAGUE_TEAMS = [
+    {"name": "Arsenal", "city": "London"},
+    {"name": "Manchester United", "city": "Manchester"},
+    {"name": "Liverpool", "city": "Liverpool"},
+    {"name": "Chelsea", "city": "London"},
+    {"name": "Manchester City", "city": "Manchester"},
+    {"name": "Tottenham Hotspur", "city": "London"},
+    {"name": "Leicester City", "city": "Leicester"},
+    {"name": "Everton", "city": "Liverpool"},
+    {"name": "West Ham United", "city": "London"},
+    {"name": "Aston Villa", "city": "Birmingham"},
+    {"name": "Newcastle United", "city": "Newcastle"},
+    {"name": "Wolverhampton", "city": "Wolverhampton"},
+    {"name": "Brighton", "city": "Brighton"},
+    {"name": "Southampton", "city": "Southampton"},
+    {"name": "Brentford", "city": "London"},
+    {"name": "Crystal Palace", "city": "London"},
+    {"name": "Fulham", "city": "London"},
+    {"name": "Nottingham Forest", "city": "Nottingham"},
+    {"name": "Bournemouth", "city": "Bournemouth"},
+    {"name": "Luton Town", "city": "Luton"}
+]
+
+# Specific matchups for fixtures (more realistic than random), as team indexes
+FOOTBALL_MATCHUPS = [
+    (10, 5),  # Newcastle vs Tottenham
+    (19, 1),  # Luton vs Manchester United
+    (6, 0),   # Leicester vs Arsenal
+    (2, 3),   # Liverpool vs Chelsea
+    (4, 9),   # Manchester City vs Aston Villa
+    (17, 18), # Nottingham Forest vs Bournemouth
+    (12, 15), # Brighton vs Crystal Palace
+    (7, 13),  # Everton vs Southampton
+    (14, 16), # Brentford vs Fulham
+    (8, 11)   # West Ham vs Wolverhampton
+]
+
+# Kickoff slots in UK time
+FOOTBALL_FIXTURE_TIMES = [
+    {'day': 'Saturday', 'time': '12:30'},  # Saturday early kickoff
+    {'day': 'Saturday', 'time': '15:00'},  # Saturday afternoon kickoff
+    {'day': 'Saturday', 'time': '17:30'},  # Saturday evening kickoff
+    {'day': 'Sunday', 'time': '14:00'},    # Sunday afternoon kickoff
+    {'day': 'Sunday', 'time': '16:30'},    # Sunday evening kickoff
+    {'day': 'Monday', 'time': '20:00'},    # Monday night football
+    {'day': 'Tuesday', 'time': '19:45'},   # Midweek evening kickoff
+    {'day': 'Wednesday', 'time': '19:45'}  # Midweek evening kickoff
+]
+
+UK = pytz.timezone('Europe/London')
+
 def generate_football_data():
     """
     Generate reliable football data without relying on external API calls
     """
-    # Premier League teams with their cities
-    teams = [
-        {"name": "Arsenal", "city": "London"},
-        {"name": "Manchester United", "city": "Manchester"},
-        {"name": "Liverpool", "city": "Liverpool"},
-        {"name": "Chelsea", "city": "London"},
-        {"name": "Manchester City", "city": "Manchester"},
-        {"name": "Tottenham Hotspur", "city": "London"},
-        {"name": "Leicester City", "city": "Leicester"},
-        {"name": "Everton", "city": "Liverpool"},
-        {"name": "West Ham United", "city": "London"},
-        {"name": "Aston Villa", "city": "Birmingham"},
-        {"name": "Newcastle United", "city": "Newcastle"},
-        {"name": "Wolverhampton", "city": "Wolverhampton"},
-        {"name": "Brighton", "city": "Brighton"},
-        {"name": "Southampton", "city": "Southampton"},
-        {"name": "Brentford", "city": "London"},
-        {"name": "Crystal Palace", "city": "London"},
-        {"name": "Fulham", "city": "London"},
-        {"name": "Nottingham Forest", "city": "Nottingham"},
-        {"name": "Bournemouth", "city": "Bournemouth"},
-        {"name": "Luton Town", "city": "Luton"}
-    ]
-    
-    # Specific matchups for fixtures (more realistic than random)
-    matchups = [
-        (10, 5),  # Newcastle vs Tottenham
-        (19, 1),  # Luton vs Manchester United
-        (6, 0),   # Leicester vs Arsenal
-        (2, 3),   # Liverpool vs Chelsea
-        (4, 9),   # Manchester City vs Aston Villa
-        (17, 18), # Nottingham Forest vs Bournemouth
-        (12, 15), # Brighton vs Crystal Palace
-        (7, 13),  # Everton vs Southampton
-        (14, 16), # Brentford vs Fulham
-        (8, 11)   # West Ham vs Wolverhampton
-    ]
-    
-    # Generate fixtures for the next 14 days
+    sports_fallback.inc(generator='generate_football_data')
+    return fallback_snapshot('football', _build_football_data)
+
+def _build_football_data(reference_now):
     events = []
     
-    # Fixture times in BST (British Summer Time / UTC+1)
-    fixture_times = [
-        {'day': 'Saturday', 'time': '12:30'},  # Saturday early kickoff
-        {'day': 'Saturday', 'time': '15:00'},  # Saturday afternoon kickoff
-        {'day': 'Saturday', 'time': '17:30'},  # Saturday evening kickoff
-        {'day': 'Sunday', 'time': '14:00'},    # Sunday afternoon kickoff
-        {'day': 'Sunday', 'time': '16:30'},    # Sunday evening kickoff
-        {'day': 'Monday', 'time': '20:00'},    # Monday night football
-        {'day': 'Tuesday', 'time': '19:45'},   # Midweek evening kickoff
-        {'day': 'Wednesday', 'time': '19:45'}  # Midweek evening kickoff
-    ]
-    
     # Use the predefined matchups
-    for i, (home_idx, away_idx) in enumerate(matchups):
-        if i >= len(fixture_times):
-            i = i % len(fixture_times)
+    for i, (home_idx, away_idx) in enumerate(FOOTBALL_MATCHUPS):
+        # Wrap around the kickoff slots, but keep i for a unique event id
+        slot = i % len(FOOTBALL_FIXTURE_TIMES)
         
-        fixture_time = fixture_times[i]
+        fixture_time = FOOTBALL_FIXTURE_TIMES[slot]
         
         # Calculate the match day (use weekend fixtures for first matches)
-        if i < 5:
+        if slot < 5:
             # Weekend fixtures
-            match_datetime_str = f"2024-04-{13 + (i//3)} {fixture_time['time']}:00"
+            match_datetime_str = f"2024-04-{13 + (slot//3)} {fixture_time['time']}:00"
         else:
             # Midweek fixtures
-            match_datetime_str = f"2024-04-{15 + (i-5)} {fixture_time['time']}:00"
+            match_datetime_str = f"2024-04-{15 + (slot-5)} {fixture_time['time']}:00"
         
-        # Parse the date string
-        match_datetime = datetime.strptime(match_datetime_str, "%Y-%m-%d %H:%M:%S")
-        
-        # Set timezone to BST (UTC+1)
-        bst = pytz.timezone('Europe/London')
-        match_datetime = bst.localize(match_datetime)
+        # Parse the date string in UK time
+        match_datetime = UK.localize(datetime.strptime(match_datetime_str, "%Y-%m-%d %H:%M:%S"))
         
         # Adjust to be relative to current time
-        ist_match_datetime = adjust_date_to_current(match_datetime)
+        ist_match_datetime = adjust_date_to_current(match_datetime, reference_now)
         
         # Convert to UTC for storage
         utc_match_datetime = ist_match_datetime.astimezone(timezone.utc)
         
-        home_team = teams[home_idx]
-        away_team = teams[away_idx]
+        home_team = PREMIER_LEAGUE_TEAMS[home_idx]
+        away_team = PREMIER_LEAGUE_TEAMS[away_idx]
         
         # Create event dictionary
         event = {
             'id': f"football-{i}",
             'date': utc_match_datetime.isoformat(),
-            'ist_date': ist_match_datetime.strftime('%Y-%m-%d %H:%M %Z'),
             'home_team': home_team['name'],
             'away_team': away_team['name'],
             'venue': f"{home_team['city']} Stadium",
@@ -1039,9 +1600,10 @@ def generate_football_data():
         
         events.append(event)
     
-    print(f"Generated {len(events)} football fixtures")
+    logger.debug("Generated %s football fixtures", len(events))
     return events
 
+@observe_provider('football-data')
 def get_football_data():
     try:
         response = requests.get(FOOTBALL_API_URL, headers=FOOTBALL_API_HEADERS)
@@ -1053,25 +1615,9 @@ def get_football_data():
                 events = []
                 for match in data['response']:
                     
-                    # Format date in UTC
+                    # Kickoff in UTC; display dates are added by store_events
                     match_date = match.get('fixture', {}).get('date', '')
-                    match_date_utc = None
-                    
-                    try:
-                        if match_date:
-                            match_date_utc = datetime.strptime(match_date, '%Y-%m-%dT%H:%M:%SZ')
-                    except ValueError:
-                        try:
-                            # Try another format if the first one fails
-                            match_date_utc = datetime.strptime(match_date, '%Y-%m-%dT%H:%M:%S%z')
-                        except ValueError:
-                            # Use current date if parsing fails
-                            match_date_utc = get_current_datetime()
-                    
-                    # Convert to IST for display
-                    match_date_ist = match_date_utc.replace(tzinfo=timezone.utc).astimezone(IST)
-                    ist_date_str = match_date_ist.strftime('%Y-%m-%d %H:%M IST')
-                    
+
                     event = {
                         'id': str(match.get('fixture', {}).get('id', '')),
                         'home_team': match.get('teams', {}).get('home', {}).get('name', 'Unknown'),
@@ -1079,8 +1625,7 @@ def get_football_data():
                         'date': match_date,
                         'location': match.get('fixture', {}).get('venue', {}).get('name', 'Unknown'),
                         'status': match.get('fixture', {}).get('status', {}).get('long', 'Scheduled'),
-                        'sport': 'football',
-                        'ist_date': ist_date_str
+                        'sport': 'football'
                     }
                     
                     # Add score if available
@@ -1089,16 +1634,16 @@ def get_football_data():
                         event['away_score'] = match.get('goals', {}).get('away')
                     
                     events.append(event)
-                print(f"Found {len(events)} football events from API")
+                logger.debug("Found %s football events from API", len(events))
                 return events
             else:
-                print("No football matches found in API response")
+                logger.debug("No football matches found in API response")
                 return generate_football_data()
         else:
-            print(f"Failed to fetch football data: {response.status_code}")
+            logger.warning("Failed to fetch football data: %s", response.status_code)
             return generate_football_data()
     except Exception as e:
-        print(f"Error fetching football data: {str(e)}")
+        logger.warning("Error fetching football data: %s", e)
         return generate_football_data()
 
 # Define FOOTBALL_API_URL and FOOTBALL_API_HEADERS
@@ -0,0 +1,98 @@
+import os
+import json
+import mimetypes
+from flask import current_app, request, send_from_directory, url_for
+from werkzeug.security import safe_join
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Built assets are named by their content hash, so a URL's content never
+# changes and browsers may keep it for a year without revalidating
+ASSET_MAX_AGE = int(os.getenv('ASSET_MAX_AGE', str(365 * 24 * 3600)))
+IMMUTABLE_CACHE_CONTROL = f'public, max-age={ASSET_MAX_AGE}, immutable'
+
+DIST_FOLDER = 'dist'
+MANIFEST_NAME = 'manifest.json'
+
+# Precompressed variants written by build_assets.py, best first
+PRECOMPRESSED_ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+# Logical name -> hashed file under static/dist, read once at startup
+asset_manifest = {}
+
+
+def load_asset_manifest(static_folder):
+    """
+    Read the manifest written by build_assets.py
+
+    Args:
+        static_folder (str): The app's static folder
+
+    Returns:
+        dict: Logical name -> hashed file name, empty if assets are not built
+    """
+    path = os.path.join(static_folder, DIST_FOLDER, MANIFEST_NAME)
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        logger.info("No built assets at %s; serving the unbundled files", path)
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("Could not read asset manifest %s: %s", path, e)
+        return {}
+    asset_manifest.clear()
+    asset_manifest.update(manifest)
+    return asset_manifest
+
+
+def asset_url(name):
+    """
+    URL of a built asset, for templates
+
+    Args:
+        name (str): Logical name, e.g. 'app.css'
+
+    Returns:
+        str: URL of the content-hashed file, or None if assets are not built
+    """
+    target = asset_manifest.get(name)
+    if target is None:
+        return None
+    return url_for('serve_built_asset', filename=target)
+
+
+def serve_built_asset(filename):
+    """Serve a built asset, precompressed if the client accepts it, cached for good"""
+    directory = os.path.join(current_app.static_folder, DIST_FOLDER)
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+    encoding = None
+    for candidate, suffix in PRECOMPRESSED_ENCODINGS:
+        variant = safe_join(directory, filename + suffix)
+        if request.accept_encodings[candidate] and variant and os.path.isfile(variant):
+            encoding = candidate
+            filename += suffix
+            break
+
+    response = send_from_directory(directory, filename, mimetype=mimetype, max_age=ASSET_MAX_AGE)
+    if encoding is not None:
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def register_static_assets(app):
+    """
+    Serve the assets built by build_assets.py and expose asset_url() to templates
+
+    Args:
+        app (Flask): The application
+    """
+    load_asset_manifest(app.static_folder)
+    # More specific than the /static/<path> rule, so it takes precedence
+    app.add_url_rule(f'{app.static_url_path}/{DIST_FOLDER}/<path:filename>',
+                     'serve_built_asset', serve_built_asset)
+    app.add_template_global(asset_url)
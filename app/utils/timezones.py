@@ -0,0 +1,122 @@
+import threading
+from bisect import bisect_right
+from datetime import datetime, timedelta
+import pytz
+
+# How local times are written into events, followed by the zone abbreviation
+LOCAL_DATE_FORMAT = '%Y-%m-%d %H:%M'
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Offset tables per zone name: (transition timestamps, UTC offsets in seconds,
+# abbreviations). Built once from pytz's transition data, so converting an
+# event is a bisect over the table instead of an astimezone() call.
+timezone_tables = {}
+timezone_tables_lock = threading.Lock()
+
+
+class InvalidTimezoneError(ValueError):
+    """Raised when a timezone name is not in the tz database"""
+
+
+def _build_table(zone):
+    """Transition table of a pytz zone"""
+    transition_times = getattr(zone, '_utc_transition_times', None)
+    if not transition_times:
+        # Fixed-offset zones (UTC, Etc/GMT+5, ...) have a single entry
+        offset = zone.utcoffset(datetime(2000, 1, 1))
+        return [float('-inf')], [int(offset.total_seconds())], [zone.tzname(datetime(2000, 1, 1))]
+
+    starts, offsets, names = [], [], []
+    for moment, (offset, _dst, name) in zip(transition_times, zone._transition_info):
+        # The first transition is datetime.min: "since the beginning of time"
+        starts.append(float('-inf') if moment == datetime.min else (moment - _EPOCH).total_seconds())
+        offsets.append(int(offset.total_seconds()))
+        names.append(name)
+    return starts, offsets, names
+
+
+def get_timezone_table(name):
+    """
+    Offset table of a timezone, built on first use
+
+    Args:
+        name (str): tz database name, e.g. 'Europe/London'
+
+    Returns:
+        tuple: (transition timestamps, offsets in seconds, abbreviations)
+
+    Raises:
+        InvalidTimezoneError: If the name is unknown
+    """
+    table = timezone_tables.get(name)
+    if table is not None:
+        return table
+    try:
+        zone = pytz.timezone(name)
+    except (pytz.UnknownTimeZoneError, AttributeError, ValueError):
+        raise InvalidTimezoneError(f"Unknown timezone: {name}")
+    with timezone_tables_lock:
+        table = timezone_tables.get(name)
+        if table is None:
+            table = timezone_tables[name] = _build_table(zone)
+    return table
+
+
+def utc_offset(timestamp, name):
+    """
+    UTC offset and abbreviation of a zone at a moment
+
+    Args:
+        timestamp (float): UTC unix timestamp
+        name (str): tz database name
+
+    Returns:
+        tuple: (offset in seconds, abbreviation such as 'BST')
+    """
+    starts, offsets, names = get_timezone_table(name)
+    position = bisect_right(starts, timestamp) - 1
+    return offsets[position], names[position]
+
+
+def format_local(timestamp, name, date_format=LOCAL_DATE_FORMAT):
+    """
+    Render a timestamp as local time in a zone, e.g. '2025-04-13 19:30 IST'
+
+    Args:
+        timestamp (float): UTC unix timestamp
+        name (str): tz database name
+        date_format (str): strftime format of the date and time part
+
+    Returns:
+        str: Local date and time followed by the zone abbreviation
+    """
+    offset, abbreviation = utc_offset(timestamp, name)
+    local = _EPOCH + timedelta(seconds=timestamp + offset)
+    return f"{local.strftime(date_format)} {abbreviation}"
+
+
+def localize_events(events, name):
+    """
+    Copies of events with their start time rendered in a zone
+
+    Events are cached once, in canonical form (the UTC 'date' and its
+    'timestamp'); the local time is added per request on shallow copies, so
+    every zone is served from the same cached list.
+
+    Args:
+        events (list): Events as returned by get_sports_data
+        name (str): tz database name
+
+    Returns:
+        list: New event dicts with 'local_date' and 'timezone' set
+    """
+    get_timezone_table(name)  # fail before copying anything
+    localized = []
+    for event in events:
+        event = dict(event)
+        timestamp = event.get('timestamp')
+        event['local_date'] = format_local(timestamp, name) if timestamp is not None else 'Date not available'
+        event['timezone'] = name
+        localized.append(event)
+    return localized
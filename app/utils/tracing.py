@@ -0,0 +1,235 @@
+import os
+import json
+import time
+import queue
+import atexit
+import secrets
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from flask import request
+
+# Tracing settings
+TRACING_ENABLED = os.getenv('TRACING_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+TRACE_EXPORT_FILE = os.getenv('TRACE_EXPORT_FILE', '')  # JSON lines, one span per line
+SERVICE_NAME = os.getenv('SERVICE_NAME', 'sports-event-tracker')
+
+# Spans of the trace being recorded and the currently open span
+_current_trace = ContextVar('current_trace', default=None)
+_current_span = ContextVar('current_span', default=None)
+
+# Finished traces waiting for the exporter thread
+_export_queue = queue.Queue(maxsize=int(os.getenv('TRACE_QUEUE_SIZE', '1000')))
+_exporter_thread = None
+_exporter_lock = threading.Lock()
+
+
+def _new_span(name, trace_id, parent_id, attributes):
+    return {
+        'traceId': trace_id,
+        'spanId': secrets.token_hex(8),
+        'parentSpanId': parent_id or '',
+        'name': name,
+        'startTimeUnixNano': time.time_ns(),
+        'endTimeUnixNano': None,
+        'attributes': dict(attributes),
+        'status': 'OK',
+        '_started': time.perf_counter(),
+        '_duration': None
+    }
+
+
+def _finish_span(span, error=None):
+    span['_duration'] = time.perf_counter() - span['_started']
+    span['endTimeUnixNano'] = span['startTimeUnixNano'] + int(span['_duration'] * 1e9)
+    if error is not None:
+        span['status'] = 'ERROR'
+        span['attributes']['error'] = str(error)
+
+
+def start_trace(name, **attributes):
+    """
+    Begin a new trace in the current context with a root span
+
+    Returns:
+        tuple: (root span, context tokens) to pass to end_trace
+    """
+    trace = []
+    root = _new_span(name, secrets.token_hex(16), None, attributes)
+    trace.append(root)
+    tokens = (_current_trace.set(trace), _current_span.set(root))
+    return root, tokens
+
+
+def end_trace(root, tokens, error=None):
+    """
+    Close the root span, export the trace and restore the previous context
+
+    Returns:
+        list: All spans of the finished trace
+    """
+    _finish_span(root, error)
+    trace = _current_trace.get()
+    try:
+        _current_span.reset(tokens[1])
+        _current_trace.reset(tokens[0])
+    except ValueError:
+        # Tokens created in another context (e.g. a different greenlet)
+        _current_span.set(None)
+        _current_trace.set(None)
+    if trace is not None and TRACE_EXPORT_FILE:
+        export_trace(trace)
+    return trace or [root]
+
+
+@contextmanager
+def span(name, **attributes):
+    """
+    Time a block as a child of the current span
+
+    Does nothing (beyond the yield) when no trace is active, so library code
+    can be wrapped unconditionally.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    current = _new_span(name, parent['traceId'], parent['spanId'], attributes)
+    trace.append(current)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except Exception as e:
+        _finish_span(current, e)
+        raise
+    else:
+        _finish_span(current)
+    finally:
+        _current_span.reset(token)
+
+
+def traced(name):
+    """Decorator running the whole function inside span(name)"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def server_timing_header(trace):
+    """
+    Summarize a trace as a Server-Timing header value
+
+    Child spans with the same name are summed, so repeated provider calls
+    show up as one entry.
+
+    Args:
+        trace (list): Spans of a finished trace, root first
+
+    Returns:
+        str: e.g. 'cache;dur=0.1, provider.cricapi;dur=120.4, total;dur=130.2'
+    """
+    totals = {}
+    for item in trace[1:]:
+        if item['_duration'] is None:
+            continue
+        metric = ''.join(c if c.isalnum() or c in '._-' else '_' for c in item['name'])
+        totals[metric] = totals.get(metric, 0.0) + item['_duration']
+    entries = [f"{metric};dur={seconds * 1000:.1f}" for metric, seconds in totals.items()]
+    entries.append(f"total;dur={trace[0]['_duration'] * 1000:.1f}")
+    return ', '.join(entries)
+
+
+def _exporter_loop():
+    while True:
+        trace = _export_queue.get()
+        if trace is None:
+            break
+        lines = []
+        for item in trace:
+            record = {key: value for key, value in item.items() if not key.startswith('_')}
+            record['resource'] = {'service.name': SERVICE_NAME}
+            lines.append(json.dumps(record, default=str))
+        try:
+            with open(TRACE_EXPORT_FILE, 'a', encoding='utf-8') as trace_file:
+                trace_file.write('\n'.join(lines) + '\n')
+        except OSError:
+            pass
+
+
+def _stop_exporter():
+    try:
+        _export_queue.put_nowait(None)
+    except queue.Full:
+        return
+    if _exporter_thread is not None:
+        _exporter_thread.join(timeout=2)
+
+
+def export_trace(trace):
+    """Queue a finished trace for the JSON-lines file exporter; drops it if the queue is full"""
+    global _exporter_thread
+    if _exporter_thread is None:
+        with _exporter_lock:
+            if _exporter_thread is None:
+                _exporter_thread = threading.Thread(target=_exporter_loop, name='trace-exporter', daemon=True)
+                _exporter_thread.start()
+                atexit.register(_stop_exporter)
+    try:
+        _export_queue.put_nowait(trace)
+    except queue.Full:
+        pass
+
+
+def _reset_exporter_after_fork():
+    # The exporter thread does not survive fork(); the child starts its own on first export
+    global _exporter_thread, _exporter_lock
+    _exporter_thread = None
+    _exporter_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_exporter_after_fork)
+
+
+def register_tracing(app):
+    """
+    Trace every request of a Flask app and add a Server-Timing header
+
+    Args:
+        app (Flask): The application to instrument
+    """
+    if not TRACING_ENABLED:
+        return
+
+    @app.before_request
+    def _start_request_trace():
+        root, tokens = start_trace(f"{request.method} {request.path}",
+                                   **{'http.method': request.method, 'http.target': request.path})
+        request.environ['tracing.root'] = (root, tokens)
+
+    @app.after_request
+    def _end_request_trace(response):
+        started = request.environ.pop('tracing.root', None)
+        if started is None:
+            return response
+        root, tokens = started
+        if request.url_rule is not None:
+            root['attributes']['http.route'] = request.url_rule.rule
+        root['attributes']['http.status_code'] = response.status_code
+        trace = end_trace(root, tokens)
+        response.headers['Server-Timing'] = server_timing_header(trace)
+        return response
+
+    @app.teardown_request
+    def _close_unfinished_trace(error=None):
+        # after_request is skipped when a view raises - close the trace here
+        started = request.environ.pop('tracing.root', None)
+        if started is not None:
+            root, tokens = started
+            end_trace(root, tokens, error)
@@ -0,0 +1,90 @@
+"""
+Throughput of /api/sports/events with hot-path logging on and off
+
+Compares the old behaviour (every debug line written synchronously to
+stdout, as the print() calls did) with the default INFO level where the
+debug calls return immediately. Providers are stubbed so no network
+requests are made.
+
+Usage:
+    python benchmarks/bench_events_logging.py [--requests 2000]
+"""
+import os
+import sys
+import time
+import logging
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('LLM_STARTUP_PROBE', 'false')
+
+import requests
+
+
+class _OfflineResponse:
+    status_code = 503
+    text = 'offline'
+
+    def json(self):
+        return {}
+
+
+def _offline(*args, **kwargs):
+    return _OfflineResponse()
+
+
+# Keep the benchmark off the network - every provider falls back to generated data
+requests.get = _offline
+requests.post = _offline
+
+from server import app  # noqa: E402
+from app.utils.logging_config import LOGGER_NAME  # noqa: E402
+
+
+def run(client, sport_type, count):
+    started = time.perf_counter()
+    for _ in range(count):
+        client.get(f'/api/sports/events?type={sport_type}')
+    return count / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--type', default='all')
+    args = parser.parse_args()
+
+    client = app.test_client()
+    app_logger = logging.getLogger(LOGGER_NAME)
+
+    # Warm the cache so both runs measure the cached request path
+    client.get(f'/api/sports/events?type={args.type}')
+
+    # Synchronous stdout at DEBUG - what the print() calls cost
+    sync_handler = logging.StreamHandler(sys.stdout)
+    saved_handlers = app_logger.handlers[:]
+    app_logger.handlers = [sync_handler]
+    app_logger.setLevel(logging.DEBUG)
+    devnull = open(os.devnull, 'w')
+    real_stdout = sys.stdout
+    sys.stdout = devnull
+    sync_handler.setStream(devnull)
+    try:
+        debug_rps = run(client, args.type, args.requests)
+    finally:
+        sys.stdout = real_stdout
+        devnull.close()
+
+    # Default configuration - INFO level, queued handler
+    app_logger.handlers = saved_handlers
+    app_logger.setLevel(logging.INFO)
+    info_rps = run(client, args.type, args.requests)
+
+    print(f"/api/sports/events?type={args.type}, {args.requests} requests")
+    print(f"  DEBUG, synchronous stdout: {debug_rps:8.1f} req/s")
+    print(f"  INFO, queued handler:      {info_rps:8.1f} req/s")
+    print(f"  throughput recovered:      {(info_rps / debug_rps - 1) * 100:8.1f} %")
+
+
+if __name__ == '__main__':
+    main()
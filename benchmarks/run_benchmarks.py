@@ -0,0 +1,285 @@
+"""
+Benchmarks for the sports data and chatbot hot paths
+
+Runs every case at several data sizes with the demo data engine standing
+in for the providers and a canned LLM reply, so results are reproducible
+and no network requests are made. Each case is timed with an
+auto-calibrated loop; the best of several repeats is reported, as timeit
+does, since slower repeats only measure interference from other processes.
+
+Usage:
+    python benchmarks/run_benchmarks.py                      # print results
+    python benchmarks/run_benchmarks.py --save               # write benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --compare            # compare against the baseline
+    python benchmarks/run_benchmarks.py --sizes 100,1000 --filter chat
+"""
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('LLM_STARTUP_PROBE', 'false')
+os.environ.setdefault('LOG_LEVEL', 'ERROR')
+os.environ.setdefault('TRACING_ENABLED', 'false')
+
+import requests
+
+
+def _offline(*args, **kwargs):
+    raise requests.ConnectionError('benchmarks run offline')
+
+
+# Nothing may reach the network - the demo engine and a canned LLM reply stand in
+requests.get = _offline
+requests.post = _offline
+
+from server import app  # noqa: E402
+from app.utils import sports_api, chatbot, demo_data, llm_dispatch  # noqa: E402
+from app.utils.event_store import event_store, ordered_events  # noqa: E402
+from app.utils.fixture_merge import fixture_registry  # noqa: E402
+from app.utils.search_index import search_index  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_SIZES = (100, 1000, 10000)
+
+# Queries covering every chatbot routing tier
+CHAT_QUERIES = [
+    'Show me football events',
+    'When do Boston Hawks play next?',
+    'What basketball games are on today?',
+    'Who will win the cricket match tonight?',
+    'Tell me a joke about the weather',
+    'list upcoming nba games this week'
+]
+
+
+def reset_state():
+    """Empty every cache, the event store, the fixture registry and the search index"""
+    sports_api.sports_data_cache.update(last_updated=None, data={}, versions={})
+    sports_api.source_event_ids.clear()
+    for value in (*event_store.values(), *fixture_registry.values()):
+        value.clear()
+    for key, value in search_index.items():
+        if isinstance(value, (dict, list)):
+            value.clear()
+    search_index['vocabulary_dirty'] = False
+
+
+def use_demo_provider(size):
+    """Serve `size` demo events (split over the three sports) from get_sports_data"""
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    engine = demo_data.DemoDataEngine(seed=7, leagues=3, fixtures_per_league=-(-size // 3), anchor=today)
+    engine.fixtures  # build outside the timed region
+    demo_data.demo_engine = engine
+    sports_api.API_PROVIDER = 'demo'
+    return engine
+
+
+def use_mock_llm():
+    """Answer AI-tier queries with a canned reply instead of calling a provider"""
+    llm_dispatch.disabled_providers.clear()
+    llm_dispatch.LLM_PROVIDERS['openai']['api_key'] = 'benchmark'
+    chatbot.api_initialized = True
+    chatbot.dispatch_chat = lambda messages, **kwargs: ('Canned benchmark reply.', 'mock')
+
+
+def time_case(func, repeat, min_time):
+    """
+    Best seconds per call of func over `repeat` runs
+
+    The loop count is doubled until one repeat takes at least min_time.
+    """
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+
+    timings = [elapsed / number]
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - started) / number)
+    return min(timings), number
+
+
+def build_cases(size, client):
+    """
+    The benchmark cases for one data size
+
+    Returns:
+        list: (name, callable) pairs; each callable runs one iteration
+    """
+    engine = use_demo_provider(size)
+    events = engine.events()[:size]
+
+    def store_events_cold():
+        reset_state()
+        sports_api.store_events(events)
+
+    def get_sports_data_cold():
+        reset_state()
+        sports_api.get_sports_data('all')
+
+    reset_state()
+    sports_api.store_events(events)
+    event_ids = [event['id'] for event in events]
+    stored = ordered_events(event_ids)
+
+    cases = [
+        ('store_events.cold', store_events_cold),
+        ('store_events.unchanged', lambda: sports_api.store_events(events)),
+        ('ordered_events', lambda: ordered_events(event_ids)),
+        ('filter_upcoming_events', lambda: sports_api.filter_upcoming_events(stored)),
+        ('format_events_response', lambda: chatbot.format_events_response(stored, 'all')),
+        ('get_sports_data.cold', get_sports_data_cold),
+    ]
+
+    def warm_get_sports_data():
+        sports_api.get_sports_data('all')
+
+    def http_events():
+        client.get('/api/sports/events?type=all')
+
+    def http_events_page():
+        client.get('/api/sports/events?type=all&limit=20')
+
+    def http_chat():
+        for query in CHAT_QUERIES:
+            client.post('/api/chat', json={'message': query})
+
+    reset_state()
+    sports_api.get_sports_data('all')
+    cases += [
+        ('get_sports_data.warm', warm_get_sports_data),
+        ('http./api/sports/events', http_events),
+        ('http./api/sports/events?limit=20', http_events_page),
+        (f'http./api/chat x{len(CHAT_QUERIES)}', http_chat),
+    ]
+    return cases
+
+
+def size_independent_cases():
+    """Cases whose cost does not depend on the amount of event data"""
+    def detect_topic():
+        for query in CHAT_QUERIES:
+            chatbot.detect_topic(query)
+
+    def extract_intent():
+        for query in CHAT_QUERIES:
+            chatbot.extract_intent(query)
+
+    return [
+        (f'detect_topic x{len(CHAT_QUERIES)}', detect_topic),
+        (f'extract_intent x{len(CHAT_QUERIES)}', extract_intent),
+    ]
+
+
+def run(sizes, repeat, min_time, name_filter):
+    """
+    Run every case
+
+    Returns:
+        dict: case key ('name[size]') -> {'seconds', 'loops'}
+    """
+    results = {}
+    client = app.test_client()
+    use_mock_llm()
+
+    def record(key, func):
+        if name_filter and name_filter not in key:
+            return
+        seconds, loops = time_case(func, repeat, min_time)
+        results[key] = {'seconds': seconds, 'loops': loops}
+        print(f"  {key:<48} {format_seconds(seconds):>12}")
+
+    for name, func in size_independent_cases():
+        record(name, func)
+    for size in sizes:
+        for name, func in build_cases(size, client):
+            record(f"{name}[{size}]", func)
+    return results
+
+
+def format_seconds(seconds):
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.2f} us"
+
+
+def compare(results, baseline, threshold):
+    """
+    Print each case relative to the baseline
+
+    Returns:
+        list: Keys of cases slower than baseline by more than threshold
+    """
+    regressions = []
+    print(f"\n  {'case':<48} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            print(f"  {key:<48} {'-':>12} {format_seconds(result['seconds']):>12}")
+            continue
+        ratio = result['seconds'] / previous['seconds']
+        flag = ''
+        if ratio > threshold:
+            flag = '  REGRESSION'
+            regressions.append(key)
+        print(f"  {key:<48} {format_seconds(previous['seconds']):>12} "
+              f"{format_seconds(result['seconds']):>12} {ratio:6.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='comma-separated event counts (default %(default)s)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help='seconds per repeat')
+    parser.add_argument('--filter', default='', help='only run cases whose name contains this')
+    parser.add_argument('--save', action='store_true', help=f'write results to {os.path.relpath(BASELINE_PATH)}')
+    parser.add_argument('--compare', action='store_true', help='compare against the saved baseline')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='slowdown ratio reported as a regression (default %(default)s)')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+    print(f"Python {platform.python_version()} on {platform.machine()}, sizes {sizes}")
+    results = run(sizes, args.repeat, args.min_time, args.filter)
+
+    if args.compare:
+        with open(args.baseline, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) slower than {args.threshold}x baseline")
+            sys.exit(1)
+
+    if args.save:
+        with open(args.baseline, 'w', encoding='utf-8') as baseline_file:
+            json.dump({
+                'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'sizes': sizes,
+                'results': results
+            }, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write('\n')
+        print(f"\nSaved baseline to {os.path.relpath(args.baseline)}")
+
+
+if __name__ == '__main__':
+    main()
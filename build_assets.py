@@ -0,0 +1,259 @@
+"""
+Build the dashboard's static assets into app/static/dist
+
+The third-party libraries the page used to load from five CDNs are
+downloaded once (into .asset-cache) and bundled with the app's own files:
+
+    app.css = Font Awesome + Google Fonts + AOS styles + css/styles.css
+    app.js  = marked + Socket.IO client + AOS + js/main.js
+
+Fonts referenced by the vendor stylesheets are fetched too and rewritten
+to local URLs, so the page makes no third-party requests at all. Every
+output file is minified, named by a hash of its content and written with
+gzip (and, if the brotli package is installed, brotli) variants next to
+it. dist/manifest.json maps logical names to the hashed files; the app
+reads it at startup (see app/utils/static_assets.py) and serves the
+files with immutable cache headers.
+
+Usage:
+    python build_assets.py              # build, downloading vendor files if not cached
+    python build_assets.py --refresh    # download the vendor files again
+"""
+import os
+import re
+import sys
+import gzip
+import json
+import shutil
+import hashlib
+import argparse
+from urllib.parse import urljoin, urlparse
+
+import requests
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(ROOT, 'app', 'static')
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+CACHE_DIR = os.path.join(ROOT, '.asset-cache')
+MANIFEST_NAME = 'manifest.json'
+
+# Pinned, so a build is reproducible and the hashes only change with the code
+FONT_AWESOME_CSS = 'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css'
+GOOGLE_FONTS_CSS = ('https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700'
+                    '&family=Montserrat:wght@700;800&display=swap')
+AOS_CSS = 'https://unpkg.com/aos@2.3.1/dist/aos.css'
+AOS_JS = 'https://unpkg.com/aos@2.3.1/dist/aos.js'
+MARKED_JS = 'https://cdn.jsdelivr.net/npm/marked@4.3.0/marked.min.js'
+SOCKETIO_JS = 'https://cdnjs.cloudflare.com/ajax/libs/socket.io/4.0.1/socket.io.min.js'
+
+# Bundles in load order: remote URLs and paths relative to app/static
+BUNDLES = {
+    'app.css': [FONT_AWESOME_CSS, GOOGLE_FONTS_CSS, AOS_CSS, 'css/styles.css'],
+    'app.js': [MARKED_JS, SOCKETIO_JS, AOS_JS, 'js/main.js'],
+}
+
+# Google Fonts picks the font format by user agent; a current browser gets woff2
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/124.0 Safari/537.36')
+
+# Files smaller than this are not worth compressing
+MIN_COMPRESS_SIZE = 256
+
+CSS_URL_PATTERN = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+
+
+def is_remote(source):
+    return source.startswith(('http://', 'https://'))
+
+
+def fetch(url, refresh=False):
+    """
+    Contents of a remote file, downloaded once into CACHE_DIR
+
+    Args:
+        url (str): File URL
+        refresh (bool): Download again even if cached
+
+    Returns:
+        bytes: The file contents
+    """
+    name = os.path.basename(urlparse(url).path) or 'index'
+    path = os.path.join(CACHE_DIR, f"{hashlib.sha1(url.encode()).hexdigest()[:12]}-{name}")
+    if not refresh and os.path.exists(path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    print(f"  downloading {url}")
+    response = requests.get(url, headers={'User-Agent': USER_AGENT}, timeout=30)
+    response.raise_for_status()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(response.content)
+    return response.content
+
+
+def read_source(source, refresh=False):
+    """Contents of a bundle source: a URL or a path relative to app/static"""
+    if is_remote(source):
+        return fetch(source, refresh)
+    with open(os.path.join(STATIC_DIR, source), 'rb') as f:
+        return f.read()
+
+
+def hashed_name(name, content):
+    """'app.css' -> 'app.3f2a9c1e04bd.css', by the hash of the content"""
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(content).hexdigest()[:12]}{ext}"
+
+
+def minify_css(css):
+    """
+    Strip comments and insignificant whitespace from a stylesheet
+
+    Deliberately conservative: whitespace is only removed around characters
+    where it can never matter ({ } ; , >), so selectors such as 'a :hover'
+    keep their meaning.
+    """
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = css.replace(';}', '}')
+    return css.strip()
+
+
+def minify_js(js):
+    """
+    Minify a script with rjsmin when it is installed
+
+    Without it only indentation, blank lines and whole-line // comments are
+    removed, which cannot change the meaning of the code.
+    """
+    if rjsmin is not None:
+        return rjsmin.jsmin(js)
+    lines = []
+    for line in js.splitlines():
+        line = line.strip()
+        if line and not line.startswith('//'):
+            lines.append(line)
+    return '\n'.join(lines)
+
+
+def write_output(name, content, written):
+    """
+    Write a file under its hashed name with its compressed variants
+
+    Args:
+        name (str): Logical name, e.g. 'app.css' or 'fonts/fa-solid-900.woff2'
+        content (bytes): File contents
+        written (dict): Logical name -> hashed name, updated in place
+
+    Returns:
+        str: The hashed name, relative to DIST_DIR
+    """
+    target = hashed_name(name, content)
+    path = os.path.join(DIST_DIR, target)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(content)
+
+    # Fonts are compressed already (woff2 is brotli inside)
+    if len(content) >= MIN_COMPRESS_SIZE and not name.endswith(('.woff2', '.woff')):
+        with gzip.GzipFile(path + '.gz', 'wb', compresslevel=9, mtime=0) as f:
+            f.write(content)
+        if brotli is not None:
+            with open(path + '.br', 'wb') as f:
+                f.write(brotli.compress(content, quality=11))
+
+    written[name] = target
+    return target
+
+
+def localize_css_urls(css, source_url, written, refresh=False):
+    """
+    Download the files a vendor stylesheet references and point it at the copies
+
+    Args:
+        css (str): Stylesheet text
+        source_url (str): Where it was downloaded from, to resolve relative URLs
+        written (dict): Logical name -> hashed name, updated in place
+        refresh (bool): Download again even if cached
+
+    Returns:
+        str: The stylesheet with every url() pointing into dist/fonts
+    """
+    def replace(match):
+        reference = match.group(2).strip()
+        if reference.startswith(('data:', '#')):
+            return match.group(0)
+        url = urljoin(source_url, reference)
+        name = 'fonts/' + os.path.basename(urlparse(url).path)
+        # Google Fonts names every subset file differently already; Font
+        # Awesome's are unique within its stylesheet
+        target = written.get(name) or write_output(name, fetch(url, refresh), written)
+        # The bundle sits in DIST_DIR, so the reference is relative to it
+        return f"url({target})"
+
+    return CSS_URL_PATTERN.sub(replace, css)
+
+
+def build_bundle(name, sources, written, refresh=False):
+    """Concatenate and minify a bundle's sources and write it"""
+    parts = []
+    for source in sources:
+        text = read_source(source, refresh).decode('utf-8')
+        if name.endswith('.css'):
+            if is_remote(source):
+                text = localize_css_urls(text, source, written, refresh)
+            parts.append(minify_css(text))
+        else:
+            # Vendor scripts ship minified; the separator stops one file's
+            # last statement from running into the next
+            parts.append(text if is_remote(source) else minify_js(text))
+    separator = '\n' if name.endswith('.css') else ';\n'
+    return write_output(name, separator.join(parts).encode('utf-8'), written)
+
+
+def source_size(sources, refresh=False):
+    return sum(len(read_source(source, refresh)) for source in sources)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bundle, minify and fingerprint the static assets')
+    parser.add_argument('--refresh', action='store_true', help='download vendor files again')
+    args = parser.parse_args()
+
+    if os.path.isdir(DIST_DIR):
+        shutil.rmtree(DIST_DIR)
+    os.makedirs(DIST_DIR)
+
+    written = {}
+    try:
+        for name, sources in BUNDLES.items():
+            target = build_bundle(name, sources, written, args.refresh)
+            path = os.path.join(DIST_DIR, target)
+            compressed = os.path.getsize(path + '.gz')
+            print(f"{name:8} -> {target}: {source_size(sources) / 1024:.1f} KiB sources, "
+                  f"{os.path.getsize(path) / 1024:.1f} KiB minified, {compressed / 1024:.1f} KiB gzipped")
+    except requests.RequestException as e:
+        print(f"Could not download a vendor file: {e}", file=sys.stderr)
+        return 1
+
+    with open(os.path.join(DIST_DIR, MANIFEST_NAME), 'w') as f:
+        json.dump(written, f, indent=2, sort_keys=True)
+    fonts = sum(1 for name in written if name.startswith('fonts/'))
+    print(f"Wrote {len(written) - fonts} bundles and {fonts} fonts to {os.path.relpath(DIST_DIR, ROOT)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
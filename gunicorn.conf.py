@@ -0,0 +1,69 @@
+"""
+Gunicorn settings for production
+
+Defaults to one gevent worker: each Socket.IO client (WebSocket or
+long-polling) is a cheap greenlet instead of a pinned thread, so one
+worker holds thousands of idle connections. Scale out with more
+instances (or GUNICORN_WORKERS) plus REDIS_URL, so emits reach clients
+on every process. Long-polling clients need sticky sessions when there
+is more than one process; the browser client connects over WebSocket
+first to avoid that.
+
+The app is preloaded by default: the master imports every module,
+compiles the chatbot patterns and warms the event snapshot once, then
+forks the workers, which share that memory copy-on-write instead of each
+building their own copy. Set GUNICORN_PRELOAD=false to load the app in
+each worker (needed for code reloading).
+
+Usage:
+    gunicorn -c gunicorn.conf.py server:app
+"""
+import gc
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '10000')}"
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gevent')
+workers = int(os.getenv('GUNICORN_WORKERS', '1'))
+# Concurrent connections per gevent worker - every idle socket counts
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', '5000'))
+threads = int(os.getenv('GUNICORN_THREADS', '1'))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '60'))
+graceful_timeout = 30
+keepalive = 75
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+accesslog = os.getenv('GUNICORN_ACCESS_LOG') or None
+preload_app = os.getenv('GUNICORN_PRELOAD', 'true').lower() in ('1', 'true', 'yes')
+
+if worker_class == 'gevent':
+    # Patch before the app (and its requests/threading imports) is loaded,
+    # which with --preload happens in the master
+    from gevent import monkey
+    monkey.patch_all()
+    os.environ.setdefault('SOCKETIO_ASYNC_MODE', 'gevent')
+
+
+def when_ready(server):
+    """Runs in the master after the app is loaded and before any worker is forked"""
+    if not server.cfg.preload_app:
+        return
+    from app import warm_up, PRELOAD_WARMUP
+    if PRELOAD_WARMUP:
+        warm_up()
+    # Move everything allocated so far out of the collector's reach, so
+    # collections in the workers do not write to (and copy) shared pages
+    gc.freeze()
+
+
+def post_worker_init(worker):
+    """
+    Start the live fixture poller and the BallDontLie ingest in each worker
+    once it has booted
+
+    Only the worker holding the poller lease polls and only the one holding
+    the ingest lease ingests; the others apply what they publish.
+    """
+    from app import socketio
+    from app.utils.live_poller import start_live_poller
+    from app.utils.sports_api import start_balldontlie_ingest
+    start_live_poller(socketio)
+    start_balldontlie_ingest()
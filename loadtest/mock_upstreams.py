@@ -0,0 +1,245 @@
+"""
+Local stand-ins for the upstream APIs the app calls
+
+Each provider gets its own HTTP server on consecutive ports, answering in
+the provider's response format with a configurable latency (plus jitter)
+and error rate. Run it on its own to point a dev server at it, or let
+run_loadtest.py start it.
+
+Usage:
+    python loadtest/mock_upstreams.py --port 9100 --latency 80 --error-rate 0.02
+    python loadtest/mock_upstreams.py --latency openrouter=900,cricapi=300
+"""
+import json
+import time
+import random
+import argparse
+import threading
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Provider name -> (port offset, environment variable the app reads its base URL from, path prefix)
+MOCK_PROVIDERS = {
+    'balldontlie': (0, 'BALLDONTLIE_API_BASE', '/v1'),
+    'cricapi': (1, 'CRICAPI_API_BASE', '/v1'),
+    'api-football': (2, 'API_FOOTBALL_API_BASE', '/v3'),
+    'thesportsdb': (3, 'THESPORTSDB_API_BASE', '/api/v1/json'),
+    'openrouter': (4, 'OPENROUTER_API_BASE', '/api/v1'),
+    'openai': (5, 'OPENAI_API_BASE', '/v1'),
+}
+
+DEFAULT_LATENCY_MS = 50
+DEFAULT_JITTER = 0.3      # latency varies by +/- this fraction
+DEFAULT_ERROR_RATE = 0.0  # fraction of requests answered with 500/429
+
+TEAMS = ['Boston', 'Denver', 'Chicago', 'Miami', 'Dallas', 'Seattle', 'Phoenix', 'Atlanta',
+         'Mumbai', 'Chennai', 'Delhi', 'Kolkata', 'London', 'Madrid', 'Milan', 'Paris']
+
+
+def _game(game_id):
+    """The mock game with this id; ids encode the day and slot, YYYYMMDD * 10 + slot"""
+    day = datetime.strptime(str(game_id // 10), '%Y%m%d')
+    home, away = TEAMS[game_id % 8], TEAMS[(game_id + 3) % 8]
+    return {
+        'id': game_id,
+        'date': day.date().isoformat(),
+        'datetime': day.replace(hour=23, minute=30).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'status': 'Final' if day.date() < datetime.now(timezone.utc).date() else 'Scheduled',
+        'period': 0,
+        'home_team': {'full_name': f"{home} Hawks", 'city': home},
+        'visitor_team': {'full_name': f"{away} Kings", 'city': away},
+        'home_team_score': 101,
+        'visitor_team_score': 99
+    }
+
+
+def _games_page(query, page_size=25):
+    """A page of BallDontLie games, three per day of the requested window (or the requested game_ids)"""
+    if 'game_ids[]' in query:
+        games = [_game(int(game_id)) for game_id in query['game_ids[]']]
+        return {'data': games, 'meta': {'next_cursor': None, 'per_page': len(games)}}
+    start = datetime.fromisoformat(query.get('start_date', [datetime.now(timezone.utc).date().isoformat()])[0])
+    end = datetime.fromisoformat(query.get('end_date', [start.date().isoformat()])[0])
+    cursor = int(query.get('cursor', ['0'])[0])
+    days = (end - start).days + 1
+    games = []
+    for index in range(cursor, min(cursor + page_size, days * 3)):
+        day = start + timedelta(days=index // 3)
+        games.append(_game(int(day.strftime('%Y%m%d')) * 10 + index % 3))
+    next_cursor = cursor + page_size if cursor + page_size < days * 3 else None
+    return {'data': games, 'meta': {'next_cursor': next_cursor, 'per_page': page_size}}
+
+
+def _upcoming(count, step_hours=20):
+    now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    return [(index, now + timedelta(hours=step_hours * (index + 1))) for index in range(count)]
+
+
+def provider_response(provider, path, query):
+    """
+    Response body for a request to a mocked provider
+
+    Returns:
+        dict: JSON body, or None for an unknown path
+    """
+    if provider == 'balldontlie':
+        if path.endswith('/games'):
+            return _games_page(query)
+        if path.endswith('/teams'):
+            return {'data': [{'id': index, 'full_name': f"{city} Hawks", 'city': city} for index, city in enumerate(TEAMS)]}
+    elif provider == 'cricapi' and path.endswith('/matches'):
+        return {'status': 'success', 'data': [
+            {'id': f"cric-{index}", 'teams': [f"{TEAMS[8 + index % 4]} Titans", f"{TEAMS[9 + index % 4]} Royals"],
+             'date': kickoff.strftime('%Y-%m-%dT%H:%M:%S'), 'venue': 'Mock Stadium', 'matchType': 't20'}
+            for index, kickoff in _upcoming(10)
+        ]}
+    elif provider == 'api-football':
+        if path.endswith('/fixtures'):
+            return {'response': [
+                {'fixture': {'id': 9000 + index, 'date': kickoff.isoformat(), 'venue': {'name': 'Mock Park'},
+                             'status': {'long': 'Not Started'}},
+                 'teams': {'home': {'name': f"{TEAMS[12 + index % 4]} FC"}, 'away': {'name': f"{TEAMS[index % 4]} United"}},
+                 'league': {'name': 'Mock League'}}
+                for index, kickoff in _upcoming(10)
+            ]}
+        if path.endswith('/teams'):
+            return {'response': [{'team': {'id': index, 'name': f"{city} FC", 'country': city}}
+                                 for index, city in enumerate(TEAMS)]}
+    elif provider == 'thesportsdb' and path.endswith('/eventsnextleague.php'):
+        league_id = query.get('id', ['0'])[0]
+        return {'events': [
+            {'idEvent': f"{league_id}{index:02d}", 'strHomeTeam': f"{TEAMS[index % 8]} {league_id}",
+             'strAwayTeam': f"{TEAMS[(index + 4) % 8]} {league_id}", 'strTimestamp': kickoff.strftime('%Y-%m-%dT%H:%M:%S'),
+             'strVenue': 'Mock Arena'}
+            for index, kickoff in _upcoming(5)
+        ]}
+    elif provider in ('openrouter', 'openai') and path.endswith('/chat/completions'):
+        return {'choices': [{'message': {'role': 'assistant', 'content': 'Mock answer: the home side looks stronger.'}}]}
+    return None
+
+
+def make_handler(provider, settings, stats):
+    """Request handler class for one mocked provider"""
+
+    class MockHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def _respond(self):
+            latency = settings['latency_ms'] / 1000
+            time.sleep(max(0.0, random.uniform(latency * (1 - settings['jitter']), latency * (1 + settings['jitter']))))
+
+            with stats['lock']:
+                stats['requests'][provider] = stats['requests'].get(provider, 0) + 1
+
+            if random.random() < settings['error_rate']:
+                status, body = random.choice((500, 429)), {'error': 'injected failure'}
+            else:
+                url = urlparse(self.path)
+                body = provider_response(provider, url.path, parse_qs(url.query))
+                status = 200 if body is not None else 404
+                body = body if body is not None else {'error': 'not found'}
+
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            self._respond()
+
+        def do_POST(self):
+            # Drain the body so keep-alive connections stay in sync
+            self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            self._respond()
+
+        def log_message(self, format, *args):
+            pass
+
+    return MockHandler
+
+
+def parse_overrides(value, cast, default):
+    """
+    Parse '80' or 'openrouter=900,cricapi=300' into per-provider values
+
+    Returns:
+        dict: provider -> value, with `default` for providers not named
+    """
+    values = {provider: default for provider in MOCK_PROVIDERS}
+    for part in filter(None, (value or '').split(',')):
+        if '=' in part:
+            provider, setting = part.split('=', 1)
+            if provider not in MOCK_PROVIDERS:
+                raise ValueError(f"Unknown provider {provider!r}, expected one of {', '.join(MOCK_PROVIDERS)}")
+            values[provider] = cast(setting)
+        else:
+            values = {provider: cast(part) for provider in MOCK_PROVIDERS}
+    return values
+
+
+def start_mock_upstreams(port=9100, latency_ms=None, error_rate=None, jitter=DEFAULT_JITTER, host='127.0.0.1'):
+    """
+    Start every mock provider on a background thread
+
+    Args:
+        port (int): Port of the first provider; the others follow
+        latency_ms (dict): provider -> mean latency in milliseconds
+        error_rate (dict): provider -> fraction of failed requests
+        jitter (float): Relative latency variation
+        host (str): Interface to bind
+
+    Returns:
+        tuple: (servers, env, stats) - env maps the app's base URL settings
+        to the mocks, stats counts requests per provider
+    """
+    latency_ms = latency_ms or {}
+    error_rate = error_rate or {}
+    stats = {'requests': {}, 'lock': threading.Lock()}
+    servers = []
+    env = {}
+    for provider, (offset, env_name, prefix) in MOCK_PROVIDERS.items():
+        settings = {
+            'latency_ms': latency_ms.get(provider, DEFAULT_LATENCY_MS),
+            'error_rate': error_rate.get(provider, DEFAULT_ERROR_RATE),
+            'jitter': jitter
+        }
+        server = ThreadingHTTPServer((host, port + offset), make_handler(provider, settings, stats))
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name=f"mock-{provider}", daemon=True).start()
+        servers.append(server)
+        env[env_name] = f"http://{host}:{port + offset}{prefix}"
+    return servers, env, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--port', type=int, default=9100)
+    parser.add_argument('--latency', default=str(DEFAULT_LATENCY_MS),
+                        help="mean latency in ms, e.g. '80' or 'openrouter=900,cricapi=300'")
+    parser.add_argument('--error-rate', default=str(DEFAULT_ERROR_RATE),
+                        help="failure fraction, e.g. '0.02' or 'balldontlie=0.1'")
+    parser.add_argument('--jitter', type=float, default=DEFAULT_JITTER)
+    args = parser.parse_args()
+
+    servers, env, stats = start_mock_upstreams(
+        args.port,
+        parse_overrides(args.latency, float, DEFAULT_LATENCY_MS),
+        parse_overrides(args.error_rate, float, DEFAULT_ERROR_RATE),
+        args.jitter
+    )
+    print("Mock upstreams running; point the app at them with:")
+    for name, value in env.items():
+        print(f"  export {name}={value}")
+    try:
+        while True:
+            time.sleep(60)
+    except KeyboardInterrupt:
+        for server in servers:
+            server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
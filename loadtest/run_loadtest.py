@@ -0,0 +1,300 @@
+"""
+Load test server:app under gunicorn against local mock upstreams
+
+Starts the mock providers (mock_upstreams.py), launches gunicorn with the
+app pointed at them, then drives REST traffic from a pool of closed-loop
+clients and, optionally, a set of Socket.IO clients that connect and stay
+idle. Reports throughput, p50/p95/p99 latency and error rates per
+endpoint, so runs with different worker classes, worker counts or cache
+settings can be compared.
+
+Usage:
+    python loadtest/run_loadtest.py --workers 2 --worker-class gthread --threads 8
+    python loadtest/run_loadtest.py --duration 60 --concurrency 50 --socketio-clients 200
+    python loadtest/run_loadtest.py --latency openrouter=900 --error-rate balldontlie=0.05
+    python loadtest/run_loadtest.py --url http://127.0.0.1:5000   # already running server
+"""
+import os
+import sys
+import json
+import time
+import random
+import signal
+import argparse
+import threading
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import requests
+
+from mock_upstreams import (start_mock_upstreams, parse_overrides,
+                            DEFAULT_LATENCY_MS, DEFAULT_ERROR_RATE)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Request mix: name -> (method, path, JSON body)
+ENDPOINTS = {
+    'events': ('GET', '/api/sports/events?type=all', None),
+    'events_sport': ('GET', '/api/sports/events?type=basketball', None),
+    'events_page': ('GET', '/api/sports/events?type=all&limit=20', None),
+    'search': ('GET', '/api/sports/search?q=boston', None),
+    'chat_fast': ('POST', '/api/chat', {'message': 'Show me basketball games'}),
+    'chat_ai': ('POST', '/api/chat', {'message': 'Who will win the next cricket match?'}),
+}
+DEFAULT_MIX = 'events=4,events_sport=2,events_page=2,search=2,chat_fast=1,chat_ai=1'
+
+# Settings that make every provider path reachable and keep the app off the real APIs
+LOADTEST_ENV = {
+    'SPORTS_API_KEY': 'loadtest',
+    'CRICKET_API_KEY': 'loadtest',
+    'FOOTBALL_API_KEY': 'loadtest',
+    'OPENROUTER_API_KEY': 'loadtest',
+    'OPENAI_API_KEY': '',
+    'LLM_STARTUP_PROBE': 'false',
+    'BALLDONTLIE_RATE_LIMIT': '0',
+    'LOG_LEVEL': 'WARNING',
+}
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies, errors, elapsed):
+    """Request count, throughput, error rate and latency percentiles (ms)"""
+    latencies = sorted(latencies)
+    count = len(latencies) + errors
+    return {
+        'requests': count,
+        'rps': count / elapsed if elapsed else 0.0,
+        'error_rate': errors / count if count else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'max_ms': (latencies[-1] * 1000) if latencies else 0.0
+    }
+
+
+def wait_until_ready(base_url, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(f"{base_url}/api/chat/stats", timeout=2).status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(0.25)
+    return False
+
+
+def start_gunicorn(args, env):
+    """Launch gunicorn serving server:app; returns the process"""
+    # gunicorn.conf.py reads the worker class and preload setting from the
+    # environment before the command line is applied - keep them in step
+    env = dict(env, GUNICORN_WORKER_CLASS=args.worker_class,
+               GUNICORN_PRELOAD='true' if args.preload else 'false')
+    command = [
+        sys.executable, '-m', 'gunicorn', 'server:app',
+        '--config', 'gunicorn.conf.py',
+        '--bind', f"127.0.0.1:{args.port}",
+        '--workers', str(args.workers),
+        '--worker-class', args.worker_class,
+        '--timeout', '120',
+        '--log-level', 'warning'
+    ]
+    if args.threads:
+        command += ['--threads', str(args.threads)]
+    if args.preload:
+        command.append('--preload')
+    print(' '.join(command[2:]))
+    return subprocess.Popen(command, cwd=REPO_ROOT, env=env, start_new_session=True)
+
+
+def rest_client(base_url, mix, stop_at, record, timeout):
+    """Closed-loop client: send the next request as soon as the last one finished"""
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    session = requests.Session()
+    while time.monotonic() < stop_at:
+        name = random.choices(names, weights)[0]
+        method, path, body = ENDPOINTS[name]
+        started = time.perf_counter()
+        try:
+            response = session.request(method, base_url + path, json=body, timeout=timeout)
+            ok = response.status_code < 500
+        except requests.RequestException:
+            ok = False
+        record(name, time.perf_counter() - started, ok)
+
+
+def socketio_clients(base_url, count, hold_until, results):
+    """
+    Connect `count` Socket.IO clients and keep them idle until hold_until
+
+    Needs the python-socketio client (installed with Flask-SocketIO).
+    """
+    try:
+        import socketio
+    except ImportError:
+        results['error'] = 'python-socketio is not installed'
+        return
+
+    clients = []
+    connect_times = []
+    failures = 0
+    for _ in range(count):
+        client = socketio.Client(reconnection=False)
+        started = time.perf_counter()
+        try:
+            client.connect(base_url, wait_timeout=10)
+            connect_times.append(time.perf_counter() - started)
+            clients.append(client)
+        except Exception:
+            failures += 1
+    results['connected'] = len(clients)
+    results['connect_failures'] = failures
+    results['connect'] = summarize(connect_times, failures, 1)
+    results['transports'] = sorted({client.transport() for client in clients})
+
+    while time.monotonic() < hold_until:
+        time.sleep(0.5)
+    results['still_connected'] = sum(1 for client in clients if client.connected)
+    for client in clients:
+        try:
+            client.disconnect()
+        except Exception:
+            pass
+
+
+def print_report(report):
+    print(f"\n{'endpoint':<14} {'requests':>9} {'req/s':>9} {'errors':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, stats in list(report['endpoints'].items()) + [('TOTAL', report['total'])]:
+        print(f"{name:<14} {stats['requests']:>9} {stats['rps']:>9.1f} {stats['error_rate'] * 100:>7.2f}% "
+              f"{stats['p50_ms']:>9.1f} {stats['p95_ms']:>9.1f} {stats['p99_ms']:>9.1f}")
+    if report.get('socketio'):
+        sio = report['socketio']
+        if 'error' in sio:
+            print(f"\nSocket.IO: skipped ({sio['error']})")
+        else:
+            connect = sio['connect']
+            print(f"\nSocket.IO: {sio['connected']} connected via {', '.join(sio['transports']) or '-'}, "
+                  f"{sio['connect_failures']} failed, {sio['still_connected']} still connected at the end; "
+                  f"connect p50 {connect['p50_ms']:.1f} ms, p95 {connect['p95_ms']:.1f} ms, p99 {connect['p99_ms']:.1f} ms")
+    if report.get('upstream_requests'):
+        calls = ', '.join(f"{name} {count}" for name, count in sorted(report['upstream_requests'].items()))
+        print(f"Upstream requests: {calls}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--url', help='target an already running server instead of starting gunicorn')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--worker-class', default='sync')
+    parser.add_argument('--threads', type=int, default=0)
+    parser.add_argument('--preload', action='store_true')
+    parser.add_argument('--mock-port', type=int, default=9100)
+    parser.add_argument('--latency', default=str(DEFAULT_LATENCY_MS),
+                        help="mock upstream latency in ms, e.g. '80' or 'openrouter=900,cricapi=300'")
+    parser.add_argument('--error-rate', default=str(DEFAULT_ERROR_RATE),
+                        help="mock upstream failure fraction, e.g. '0.02' or 'balldontlie=0.1'")
+    parser.add_argument('--env', action='append', default=[], metavar='KEY=VALUE',
+                        help='extra app setting, e.g. --env API_PROVIDER=demo (repeatable)')
+    parser.add_argument('--duration', type=float, default=30, help='seconds of measured load')
+    parser.add_argument('--warmup', type=float, default=5, help='seconds of unmeasured load first')
+    parser.add_argument('--concurrency', type=int, default=20, help='concurrent REST clients')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help='endpoint weights (default %(default)s)')
+    parser.add_argument('--socketio-clients', type=int, default=0, help='idle Socket.IO connections to hold')
+    parser.add_argument('--request-timeout', type=float, default=30)
+    parser.add_argument('--json', help='also write the report to this file')
+    args = parser.parse_args()
+
+    mix = {name: float(weight) for name, weight in (part.split('=') for part in args.mix.split(','))}
+    unknown = set(mix) - set(ENDPOINTS)
+    if unknown:
+        parser.error(f"unknown endpoints in --mix: {', '.join(sorted(unknown))}")
+
+    servers, mock_env, upstream_stats = start_mock_upstreams(
+        args.mock_port,
+        parse_overrides(args.latency, float, DEFAULT_LATENCY_MS),
+        parse_overrides(args.error_rate, float, DEFAULT_ERROR_RATE)
+    )
+
+    process = None
+    base_url = args.url.rstrip('/') if args.url else f"http://127.0.0.1:{args.port}"
+    if not args.url:
+        env = dict(os.environ, **LOADTEST_ENV, **mock_env)
+        env.update(item.split('=', 1) for item in args.env)
+        process = start_gunicorn(args, env)
+
+    try:
+        if not wait_until_ready(base_url, 60):
+            sys.exit(f"Server at {base_url} did not become ready")
+
+        samples = []
+        samples_lock = threading.Lock()
+        measuring = threading.Event()
+
+        def record(name, seconds, ok):
+            if measuring.is_set():
+                with samples_lock:
+                    samples.append((name, seconds, ok))
+
+        started = time.monotonic()
+        stop_at = started + args.warmup + args.duration
+        threads = [threading.Thread(target=rest_client, daemon=True,
+                                    args=(base_url, mix, stop_at, record, args.request_timeout))
+                   for _ in range(args.concurrency)]
+        sio_results = {}
+        if args.socketio_clients:
+            threads.append(threading.Thread(target=socketio_clients, daemon=True,
+                                            args=(base_url, args.socketio_clients, stop_at, sio_results)))
+        for thread in threads:
+            thread.start()
+
+        time.sleep(args.warmup)
+        measuring.set()
+        measure_started = time.monotonic()
+        print(f"Measuring for {args.duration:.0f}s with {args.concurrency} REST clients"
+              + (f" and {args.socketio_clients} Socket.IO clients" if args.socketio_clients else ''))
+        for thread in threads:
+            thread.join(timeout=max(0, stop_at - time.monotonic()) + args.request_timeout + 30)
+        measuring.clear()
+        elapsed = min(time.monotonic(), stop_at) - measure_started
+
+        report = {'settings': vars(args), 'endpoints': {}}
+        with samples_lock:
+            collected = list(samples)
+        for name in mix:
+            latencies = [seconds for sample_name, seconds, ok in collected if sample_name == name and ok]
+            errors = sum(1 for sample_name, _, ok in collected if sample_name == name and not ok)
+            report['endpoints'][name] = summarize(latencies, errors, elapsed)
+        report['total'] = summarize([seconds for _, seconds, ok in collected if ok],
+                                    sum(1 for _, _, ok in collected if not ok), elapsed)
+        report['socketio'] = sio_results
+        with upstream_stats['lock']:
+            report['upstream_requests'] = dict(upstream_stats['requests'])
+
+        print_report(report)
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as report_file:
+                json.dump(report, report_file, indent=2)
+            print(f"Report written to {args.json}")
+    finally:
+        if process is not None:
+            os.killpg(process.pid, signal.SIGTERM)
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                os.killpg(process.pid, signal.SIGKILL)
+        for server in servers:
+            server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
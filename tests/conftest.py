@@ -0,0 +1,78 @@
+import os
+import sys
+
+import pytest
+
+# Run from any directory: the app package lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Never probe an LLM provider while the modules under test are imported
+os.environ.setdefault('LLM_STARTUP_PROBE', 'false')
+
+from app.utils.event_store import event_store  # noqa: E402
+from app.utils.fixture_merge import fixture_registry  # noqa: E402
+
+
+@pytest.fixture
+def empty_store():
+    """An empty event store and fixture registry, emptied again after the test"""
+    for value in (*event_store.values(), *fixture_registry.values()):
+        value.clear()
+    yield event_store
+    for value in (*event_store.values(), *fixture_registry.values()):
+        value.clear()
+
+
+@pytest.fixture
+def sports_state(empty_store, monkeypatch):
+    """
+    Empty sports caches, search index and event store, with every refresh
+    source returning nothing until a test sets it
+    """
+    from app.utils import sports_api
+    from app.utils.search_index import search_index
+
+    def reset():
+        sports_api.sports_data_cache.update(last_updated=None, data={}, versions={})
+        sports_api.source_event_ids.clear()
+        for value in search_index.values():
+            if isinstance(value, (dict, list)):
+                value.clear()
+
+    reset()
+    sources = {'football': [], 'basketball': [], 'cricket': []}
+    monkeypatch.setattr(sports_api, 'API_PROVIDER', 'balldontlie')
+    monkeypatch.setattr(sports_api, 'generate_football_data', lambda: list(sources['football']))
+    monkeypatch.setattr(sports_api, 'get_balldontlie_data', lambda sport_type: list(sources['basketball']))
+    monkeypatch.setattr(sports_api, 'get_cricket_data', lambda sport_type: list(sources['cricket']))
+    yield sources
+    reset()
+
+
+@pytest.fixture(scope='session')
+def app():
+    from app import create_app
+    return create_app()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    """
+    An AI provider answering every prompt with a canned reply; the messages
+    of each call are recorded in the returned list
+    """
+    from app.utils import chatbot
+    calls = []
+
+    def dispatch(messages, **kwargs):
+        calls.append(messages)
+        return f"AI answer {len(calls)}", 'stub'
+
+    monkeypatch.setattr(chatbot, 'api_initialized', True)
+    monkeypatch.setattr(chatbot, 'get_active_providers', lambda: ['stub'])
+    monkeypatch.setattr(chatbot, 'dispatch_chat', dispatch)
+    return calls
@@ -0,0 +1,56 @@
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils import sports_api
+
+
+def iso(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def fixture(event_id, hours_ahead, sport='football', home='Arsenal', away='Chelsea', **fields):
+    return dict({'id': event_id, 'sport': sport, 'home_team': home, 'away_team': away,
+                 'date': iso(time.time() + hours_ahead * 3600)}, **fields)
+
+
+@pytest.fixture
+def season(sports_state):
+    """Eight football fixtures a day apart and three cricket ones, the first football one long over"""
+    sports_state['football'] = [fixture(f'f{day}', day * 24, home=f'Home {day}') for day in range(-1, 7)]
+    sports_state['cricket'] = [fixture(f'c{day}', day * 24 + 6, sport='cricket', home=f'Home {day}')
+                               for day in range(3)]
+    return sports_state
+
+
+def ids(events):
+    return [event['id'] for event in events]
+
+
+def test_pages_start_at_the_upcoming_events(season, client):
+    page = client.get('/api/sports/events?limit=4').get_json()
+    assert ids(page['events']) == ['f0', 'c0', 'f1', 'c1']
+    page = client.get(f"/api/sports/events?limit=4&cursor={page['next_cursor']}").get_json()
+    assert ids(page['events']) == ['f2', 'c2', 'f3', 'f4']
+    page = client.get(f"/api/sports/events?limit=4&cursor={page['next_cursor']}").get_json()
+    assert ids(page['events']) == ['f5', 'f6']
+    assert page['next_cursor'] is None
+
+
+def test_pages_hold_the_plain_listing_in_the_same_order(season, client):
+    plain = client.get('/api/sports/events?type=football').get_json()
+    page = client.get('/api/sports/events?type=football&limit=5').get_json()
+    assert ids(page['events']) == ids(plain) == ['f0', 'f1', 'f2', 'f3', 'f4']
+
+
+def test_since_moves_the_first_page(season, client):
+    page = client.get(f'/api/sports/events?sport=football&limit=2&since={int(time.time()) - 2 * 86400}').get_json()
+    assert ids(page['events']) == ['f-1', 'f0']
+
+
+@pytest.mark.parametrize('query', ['cursor=not-a-cursor', 'limit=5&cursor=!!!', 'limit=5&since=next+week'])
+def test_bad_paging_parameters_are_rejected(season, client, query):
+    response = client.get(f'/api/sports/events?{query}')
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
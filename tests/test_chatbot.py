@@ -0,0 +1,124 @@
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils import chatbot
+
+
+def iso(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def fixture(event_id, hours_ahead, sport, home, away):
+    return {'id': event_id, 'sport': sport, 'home_team': home, 'away_team': away,
+            'date': iso(time.time() + hours_ahead * 3600), 'status': 'Scheduled'}
+
+
+@pytest.fixture
+def schedule(sports_state):
+    sports_state['football'] = [fixture('f1', 24, 'football', 'Arsenal', 'Chelsea'),
+                                fixture('f2', 48, 'football', 'Liverpool', 'Arsenal')]
+    sports_state['cricket'] = [fixture('c1', 30, 'cricket', 'Mumbai Indians', 'Chennai Super Kings')]
+    return sports_state
+
+
+def tier_counts():
+    return {tier: stats['count'] for tier, stats in chatbot.get_query_tier_stats().items()}
+
+
+@pytest.mark.parametrize('query', ['Show me football events', 'list the soccer matches',
+                                   'When is the next cricket match?'])
+def test_sport_schedules_skip_the_llm(schedule, llm, query):
+    before = tier_counts()
+    response = chatbot.process_query(query)
+    assert response.startswith('Here are some upcoming')
+    assert llm == []
+    assert tier_counts()['fast_path'] == before['fast_path'] + 1
+
+
+def test_team_schedules_skip_the_llm(schedule, llm):
+    response = chatbot.process_query('When does Arsenal play next?')
+    assert response.startswith('Here are the upcoming events for arsenal')
+    assert 'vs Chelsea (Home)' in response and 'at Liverpool (Away)' in response
+    assert llm == []
+
+
+@pytest.mark.parametrize('query', [
+    'Who will win the cricket match tonight?',      # open-ended
+    'Show me curling events',                       # unknown sport
+    'When does Real Madrid play next?',             # team not in the events
+    'Tell me a joke about the weather',             # no schedule intent
+])
+def test_everything_else_goes_to_the_llm(schedule, llm, query):
+    before = tier_counts()
+    assert chatbot.process_query(query) == 'AI answer 1'
+    assert len(llm) == 1
+    assert llm[0][-1] == {'role': 'user', 'content': query}
+    assert tier_counts()['ai'] == before['ai'] + 1
+
+
+def test_chat_route_answers_from_the_fast_path(schedule, llm, client):
+    response = client.post('/api/chat', json={'message': 'Show me cricket matches'})
+    assert response.status_code == 200
+    assert 'Chennai Super Kings at Mumbai Indians' in response.get_json()['response']
+    assert llm == []
+    stats = client.get('/api/chat/stats').get_json()
+    assert stats['fast_path']['count'] >= 1
+
+
+@pytest.fixture
+def echo_llm(llm, monkeypatch):
+    """An AI provider answering each prompt with the prompt itself"""
+    def dispatch(messages, **kwargs):
+        llm.append(messages)
+        return f"AI: {messages[-1]['content']}", 'stub'
+
+    monkeypatch.setattr(chatbot, 'dispatch_chat', dispatch)
+    return llm
+
+
+def test_batch_answers_in_query_order(schedule, echo_llm, client):
+    queries = ['Who will win tonight?', 'Show me cricket matches', 'Tell me a joke', 'Show me football events']
+    response = client.post('/api/chat/batch', json={'queries': queries})
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [result['query'] for result in results] == queries
+    assert results[0]['response'] == 'AI: Who will win tonight?'
+    assert 'Chennai Super Kings at Mumbai Indians' in results[1]['response']
+    assert results[2]['response'] == 'AI: Tell me a joke'
+    assert results[3]['response'].startswith('Here are some upcoming')
+    # Only the queries the fast path cannot answer reach the AI tier
+    assert sorted(messages[-1]['content'] for messages in echo_llm) == ['Tell me a joke', 'Who will win tonight?']
+
+
+def test_batch_falls_back_to_rules_when_the_ai_tier_fails(schedule, llm, monkeypatch, client):
+    def dispatch(messages, **kwargs):
+        raise chatbot.LLMDispatchError('every provider failed')
+
+    monkeypatch.setattr(chatbot, 'dispatch_chat', dispatch)
+    before = tier_counts()
+    results = client.post('/api/chat/batch', json={'queries': ['Tell me a joke']}).get_json()['results']
+    assert results[0]['response'] == chatbot.process_with_rules('Tell me a joke')
+    assert tier_counts()['ai_fallback'] == before['ai_fallback'] + 1
+
+
+def test_batch_without_ai_answers_by_rules(schedule, monkeypatch, client):
+    monkeypatch.setattr(chatbot, 'api_initialized', False)
+    queries = ['Tell me a joke', 'Show me cricket matches']
+    results = client.post('/api/chat/batch', json={'queries': queries}).get_json()['results']
+    assert [result['response'] for result in results] == [chatbot.process_with_rules(query) for query in queries]
+
+
+@pytest.mark.parametrize('body', [
+    {},
+    {'queries': []},
+    {'queries': 'Show me cricket matches'},
+    {'queries': ['Show me cricket matches', 3]},
+    {'queries': ['Show me cricket matches'] * (chatbot.CHAT_BATCH_MAX + 1)},
+])
+def test_batch_rejects_bad_bodies(schedule, llm, client, body):
+    response = client.post('/api/chat/batch', json=body)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+    assert llm == []
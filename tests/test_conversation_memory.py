@@ -0,0 +1,134 @@
+import pytest
+
+from app.utils import conversation_memory
+from app.utils.conversation_memory import (get_context, record_turn, forget_session, validate_session_id,
+                                           conversations, conversation_evictions, InvalidSessionError)
+
+NOW = 1_900_000_000.0
+
+
+@pytest.fixture(autouse=True)
+def no_sessions():
+    conversations.clear()
+    yield
+    conversations.clear()
+
+
+def evictions(reason):
+    return conversation_evictions._values.get((reason,), 0)
+
+
+def test_recent_turns_are_kept_verbatim():
+    record_turn('session-1', 'When do Arsenal play?', 'Saturday at 15:00.', now=NOW)
+    context = get_context('session-1', now=NOW)
+    assert context == {
+        'summary': '',
+        'messages': [
+            {'role': 'user', 'content': 'When do Arsenal play?'},
+            {'role': 'assistant', 'content': 'Saturday at 15:00.'}
+        ]
+    }
+
+
+def test_older_turns_roll_over_into_the_summary(monkeypatch):
+    monkeypatch.setattr(conversation_memory, 'CONVERSATION_RECENT_TURNS', 2)
+    monkeypatch.setattr(conversation_memory, 'SUMMARY_QUESTIONS', 2)
+    for number in range(1, 6):
+        record_turn('session-1', f'question {number}', f'answer {number}', now=NOW + number)
+
+    context = get_context('session-1', now=NOW + 10)
+    assert [message['content'] for message in context['messages']] == [
+        'question 4', 'answer 4', 'question 5', 'answer 5'
+    ]
+    # Three exchanges were folded away; only the last SUMMARY_QUESTIONS are quoted
+    assert context['summary'] == 'Earlier in this conversation (3 exchanges) the user asked: "question 2"; "question 3".'
+
+
+def test_subjects_are_listed_most_recent_first_without_repeats():
+    record_turn('session-1', 'q', 'a', subjects=['Arsenal', 'football'], now=NOW)
+    record_turn('session-1', 'q', 'a', subjects=['Chelsea', 'Arsenal'], now=NOW + 1)
+    summary = get_context('session-1', now=NOW + 2)['summary']
+    assert summary == 'Subjects discussed, most recent first: Arsenal, Chelsea, football.'
+
+
+def test_long_messages_are_trimmed():
+    record_turn('session-1', 'q' * 1000, 'a' * 1000, now=NOW)
+    question, answer = get_context('session-1', now=NOW)['messages']
+    assert len(question['content']) == conversation_memory.MAX_QUESTION_CHARS
+    assert len(answer['content']) == conversation_memory.MAX_ANSWER_CHARS
+    assert answer['content'].endswith('…')
+
+
+def test_idle_sessions_expire(monkeypatch):
+    monkeypatch.setattr(conversation_memory, 'CONVERSATION_TTL', 60)
+    before = evictions('ttl')
+    record_turn('idle-session', 'q', 'a', now=NOW)
+    record_turn('busy-session', 'q', 'a', now=NOW + 30)
+
+    assert get_context('idle-session', now=NOW + 59)['messages']
+    assert get_context('idle-session', now=NOW + 61) == {'summary': '', 'messages': []}
+    assert get_context('busy-session', now=NOW + 61)['messages']
+    assert evictions('ttl') == before + 1
+
+
+def test_least_recently_used_session_is_dropped_beyond_the_limit(monkeypatch):
+    monkeypatch.setattr(conversation_memory, 'CONVERSATION_MAX_SESSIONS', 2)
+    before = evictions('size')
+    record_turn('session-a', 'q', 'a', now=NOW)
+    record_turn('session-b', 'q', 'a', now=NOW + 1)
+    record_turn('session-a', 'again', 'a', now=NOW + 2)   # a is now the most recent
+    record_turn('session-c', 'q', 'a', now=NOW + 3)
+
+    assert list(conversations) == ['session-a', 'session-c']
+    assert evictions('size') == before + 1
+
+
+def test_forget_session():
+    record_turn('session-1', 'q', 'a', now=NOW)
+    forget_session('session-1')
+    forget_session('never-seen')
+    assert get_context('session-1', now=NOW)['messages'] == []
+
+
+def test_session_ids():
+    assert len(validate_session_id(None)) >= 16
+    assert validate_session_id('abc-DEF_123') == 'abc-DEF_123'
+    for session_id in ('short', 'has spaces in it', 'x' * 65, 12345678):
+        with pytest.raises(InvalidSessionError):
+            validate_session_id(session_id)
+
+
+def ask(client, message, session_id=None):
+    body = {'message': message}
+    if session_id:
+        body['session_id'] = session_id
+    return client.post('/api/chat', json=body)
+
+
+def test_chat_route_carries_a_session_into_follow_ups(sports_state, llm, client):
+    first = ask(client, 'Who will win the derby?').get_json()
+    assert first['response'] == 'AI answer 1'
+    session_id = first['session_id']
+
+    second = ask(client, 'And the one after?', session_id).get_json()
+    assert second['session_id'] == session_id
+    assert llm[1][1:] == [
+        {'role': 'user', 'content': 'Who will win the derby?'},
+        {'role': 'assistant', 'content': 'AI answer 1'},
+        {'role': 'user', 'content': 'And the one after?'}
+    ]
+
+
+def test_ended_session_starts_over(sports_state, llm, client):
+    session_id = ask(client, 'Who will win the derby?').get_json()['session_id']
+    assert client.delete(f'/api/chat/session/{session_id}').status_code == 204
+    ask(client, 'And the one after?', session_id)
+    assert llm[1][1:] == [{'role': 'user', 'content': 'And the one after?'}]
+
+
+def test_chat_route_rejects_bad_session_ids(sports_state, llm, client):
+    response = ask(client, 'Who will win the derby?', 'short')
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+    assert client.delete('/api/chat/session/not%20valid%21').status_code == 400
+    assert llm == []
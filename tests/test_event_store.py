@@ -0,0 +1,108 @@
+import base64
+
+import pytest
+
+from app.utils.event_store import (upsert_events, remove_events, events_in_range, page_events,
+                                   encode_cursor, decode_cursor, store_version, event_store, event_timestamp,
+                                   InvalidCursorError, UNDATED_TIMESTAMP)
+
+
+def make_event(event_id, date, sport='football', **fields):
+    return dict({'id': event_id, 'sport': sport, 'home_team': 'Home', 'away_team': 'Away', 'date': date}, **fields)
+
+
+@pytest.fixture
+def season(empty_store):
+    """Seven football and three cricket events, stored out of order"""
+    events = [make_event(f'f{day}', f'2030-01-{day:02d}T15:00:00Z') for day in (5, 1, 7, 3, 2, 6, 4)]
+    events += [make_event(f'c{day}', f'2030-01-{day:02d}T09:00:00Z', sport='cricket') for day in (2, 1, 3)]
+    upsert_events(events)
+    return events
+
+
+def all_pages(**kwargs):
+    pages = [page_events(**kwargs)]
+    while pages[-1]['next_cursor']:
+        pages.append(page_events(cursor=pages[-1]['next_cursor'], **kwargs))
+    return pages
+
+
+@pytest.mark.parametrize('key', [
+    (1893510000.0, 'f1'),
+    (0.0, ''),
+    (1893510000.5, 'id with spaces/and:symbols'),
+    (UNDATED_TIMESTAMP, 'undated'),
+])
+def test_cursor_round_trip(key):
+    cursor = encode_cursor(key)
+    assert '=' not in cursor
+    assert decode_cursor(cursor) == key
+
+
+@pytest.mark.parametrize('cursor', [
+    '!!!',
+    base64.urlsafe_b64encode(b'not json').decode(),
+    base64.urlsafe_b64encode(b'[1, 2, 3]').decode(),
+    base64.urlsafe_b64encode(b'["soon", "f1"]').decode(),
+    base64.urlsafe_b64encode(b'\xff\xfe').decode(),
+])
+def test_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+def test_invalid_cursor_is_rejected_by_page_events(season):
+    with pytest.raises(InvalidCursorError):
+        page_events(cursor='not-a-cursor')
+
+
+def test_pages_cover_every_event_once_in_order(season):
+    pages = all_pages(limit=3)
+    ids = [event['id'] for page in pages for event in page['events']]
+    assert [len(page['events']) for page in pages] == [3, 3, 3, 1]
+    assert pages[-1]['next_cursor'] is None
+    assert ids == ['c1', 'f1', 'c2', 'f2', 'c3', 'f3', 'f4', 'f5', 'f6', 'f7']
+
+
+def test_pages_of_one_sport_and_competition(season):
+    upsert_events([make_event('f8', '2030-01-08T15:00:00Z', competition='Cup')])
+    ids = [event['id'] for page in all_pages(limit=2, sport='Football') for event in page['events']]
+    assert ids == ['f1', 'f2', 'f3', 'f4', 'f5', 'f6', 'f7', 'f8']
+    assert page_events(sport='football', competition='cup')['events'][0]['id'] == 'f8'
+
+
+def test_first_page_starts_at_start_timestamp(season):
+    start = event_timestamp({'date': '2030-01-05T09:00:00Z'})
+    page = page_events(limit=2, start_timestamp=start)
+    assert [event['id'] for event in page['events']] == ['f5', 'f6']
+    # Later pages follow the cursor, not the start
+    page = page_events(limit=5, cursor=page['next_cursor'], start_timestamp=start)
+    assert [event['id'] for event in page['events']] == ['f7']
+
+
+def test_cursor_survives_inserts_before_it(season):
+    first = page_events(limit=4)
+    upsert_events([make_event('f0', '2029-12-31T15:00:00Z')])
+    second = page_events(limit=4, cursor=first['next_cursor'])
+    assert [event['id'] for event in second['events']] == ['c3', 'f3', 'f4', 'f5']
+
+
+def test_rescheduled_event_moves_in_the_order(season):
+    version = store_version()
+    upsert_events([make_event('f1', '2030-01-09T15:00:00Z')])
+    assert store_version() != version
+    assert [event['id'] for event in events_in_range('football')][-1] == 'f1'
+    assert len(event_store['order']) == 10
+
+
+def test_unchanged_events_leave_the_version_alone(season):
+    version = store_version()
+    assert upsert_events(season) == []
+    assert store_version() == version
+
+
+def test_removed_events_leave_every_order(season):
+    remove_events(['f1', 'c1', 'unknown'])
+    assert [event['id'] for event in events_in_range()][:2] == ['c2', 'f2']
+    assert 'f1' not in event_store['keys']
+    assert [key[1] for key in event_store['order_by_sport']['cricket']] == ['c2', 'c3']
@@ -0,0 +1,76 @@
+import csv
+import io
+import json
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils import export
+from app.utils.export import CSV_COLUMNS
+
+
+def iso(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def fixture(event_id, hours_ahead, sport='football', home='Arsenal', away='Chelsea', **fields):
+    return dict({'id': event_id, 'sport': sport, 'home_team': home, 'away_team': away,
+                 'date': iso(time.time() + hours_ahead * 3600)}, **fields)
+
+
+@pytest.fixture
+def stored(sports_state):
+    """Football and cricket fixtures listed out of start order"""
+    sports_state['football'] = [fixture('f2', 48, venue='Emirates Stadium'), fixture('f1', 24)]
+    sports_state['cricket'] = [fixture('c1', 36, sport='cricket', home='Mumbai Indians',
+                                       away='Chennai Super Kings')]
+    return sports_state
+
+
+def ndjson_ids(response):
+    return [json.loads(line)['id'] for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_ndjson_holds_every_stored_event_in_start_order(stored, client):
+    response = client.get('/api/sports/export')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    assert response.headers['Content-Disposition'] == 'attachment; filename=events.ndjson'
+    assert ndjson_ids(response) == ['f1', 'c1', 'f2']
+    assert json.loads(response.get_data(as_text=True).splitlines()[2])['venue'] == 'Emirates Stadium'
+
+
+def test_csv_has_a_header_and_one_row_per_event(stored, client):
+    response = client.get('/api/sports/export?format=CSV')
+    assert response.mimetype == 'text/csv'
+    assert response.headers['Content-Disposition'] == 'attachment; filename=events.csv'
+    reader = csv.DictReader(io.StringIO(response.get_data(as_text=True)))
+    assert reader.fieldnames == CSV_COLUMNS
+    rows = list(reader)
+    assert [row['id'] for row in rows] == ['f1', 'c1', 'f2']
+    assert rows[1]['home_team'] == 'Mumbai Indians'
+
+
+def test_sport_and_since_filter_the_export(stored, client):
+    assert ndjson_ids(client.get('/api/sports/export?sport=Cricket')) == ['c1']
+    since = int(time.time() + 30 * 3600)
+    assert ndjson_ids(client.get(f'/api/sports/export?since={since}')) == ['c1', 'f2']
+    assert ndjson_ids(client.get(f'/api/sports/export?sport=football&since={iso(since)}')) == ['f2']
+
+
+@pytest.mark.parametrize('query', ['format=xml', 'since=next+week'])
+def test_bad_parameters_are_rejected(stored, client, query):
+    response = client.get(f'/api/sports/export?{query}')
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+@pytest.mark.parametrize('export_format', ['ndjson', 'csv'])
+def test_body_is_streamed_in_chunks(stored, client, monkeypatch, export_format):
+    monkeypatch.setattr(export, 'EXPORT_FLUSH_EVENTS', 2)
+    response = client.get(f'/api/sports/export?format={export_format}', buffered=False)
+    assert response.is_streamed
+    chunks = list(response.response)
+    assert len(chunks) == 2
+    assert b''.join(chunks).count(b'\n') == 3 + (export_format == 'csv')
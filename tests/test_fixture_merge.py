@@ -0,0 +1,115 @@
+from datetime import datetime, timezone
+
+from app.utils.event_store import event_timestamp
+from app.utils.fixture_merge import (merge_duplicate_fixtures, apply_reports, withdraw_reports, fixture_reports,
+                                     new_registry, FIXTURE_MATCH_WINDOW)
+
+
+def iso(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def timestamp_of(date):
+    return event_timestamp({'date': date})
+
+
+def report(event_id, provider, date, home='Arsenal', away='Chelsea', sport='football', **fields):
+    return dict({'id': event_id, 'provider': provider, 'sport': sport,
+                 'home_team': home, 'away_team': away, 'date': date}, **fields)
+
+
+def test_reports_hours_apart_are_one_fixture():
+    merged = merge_duplicate_fixtures([
+        report('sdb-1', 'thesportsdb', '2030-03-01T05:00:00Z', venue='Emirates Stadium'),
+        report('af-1', 'api-football', '2030-03-01T15:00:00+00:00', home='Arsenal FC', away='Chelsea FC'),
+    ])
+    assert len(merged) == 1
+    fixture = merged[0]
+    # api-football ranks above thesportsdb: its id and kickoff win, and the
+    # venue only thesportsdb knew is kept
+    assert fixture['id'] == 'af-1'
+    assert fixture['date'] == '2030-03-01T15:00:00+00:00'
+    assert fixture['venue'] == 'Emirates Stadium'
+    assert fixture['sources'] == ['api-football', 'thesportsdb']
+
+
+def test_team_names_match_without_accents_suffixes_or_order():
+    merged = merge_duplicate_fixtures([
+        report('a', 'api-football', '2030-03-01T19:00:00Z', home='Atlético de Madrid', away='Real Madrid CF'),
+        report('b', 'thesportsdb', '2030-03-01T20:00:00Z', home='Real Madrid', away='Atletico Madrid'),
+    ])
+    assert [fixture['id'] for fixture in merged] == ['a']
+
+
+def test_kickoffs_straddling_a_bucket_edge_match():
+    edge = 1900000000 // FIXTURE_MATCH_WINDOW * FIXTURE_MATCH_WINDOW
+    merged = merge_duplicate_fixtures([
+        report('before', 'thesportsdb', iso(edge - 60)),
+        report('after', 'api-football', iso(edge + 60)),
+    ])
+    assert [fixture['id'] for fixture in merged] == ['after']
+
+
+def test_kickoffs_further_apart_than_the_window_are_separate_fixtures():
+    merged = merge_duplicate_fixtures([
+        report('first-leg', 'api-football', '2030-03-01T15:00:00Z'),
+        report('second-leg', 'thesportsdb', iso(timestamp_of('2030-03-01T15:00:00Z') + FIXTURE_MATCH_WINDOW + 60)),
+    ])
+    assert [fixture['id'] for fixture in merged] == ['first-leg', 'second-leg']
+
+
+def test_one_provider_is_never_merged_with_itself():
+    merged = merge_duplicate_fixtures([
+        report('game-1', 'balldontlie', '2030-03-01T00:00:00Z', sport='basketball'),
+        report('game-2', 'balldontlie', '2030-03-01T02:00:00Z', sport='basketball'),
+    ])
+    assert [fixture['id'] for fixture in merged] == ['game-1', 'game-2']
+
+
+def test_other_sports_and_undated_reports_are_left_alone():
+    events = [
+        report('football', 'api-football', '2030-03-01T15:00:00Z'),
+        report('cricket', 'cricapi', '2030-03-01T15:00:00Z', sport='cricket'),
+        report('undated-1', 'thesportsdb', ''),
+        report('undated-2', 'api-football', ''),
+    ]
+    merged = merge_duplicate_fixtures(events)
+    assert merged == events
+
+
+
+def test_a_report_joins_the_stored_fixture_of_another_provider():
+    registry = new_registry()
+    apply_reports([report('sdb-1', 'thesportsdb', '2030-03-01T15:00:00Z')], registry)
+    fixtures, removed = apply_reports([report('af-1', 'api-football', '2030-03-01T15:00:00Z')], registry)
+    # The merged fixture takes the better provider's id and replaces the old one
+    assert [fixture['id'] for fixture in fixtures] == ['af-1']
+    assert removed == ['sdb-1']
+    assert [item['id'] for item in fixture_reports('af-1', registry)] == ['sdb-1', 'af-1']
+
+
+def test_unchanged_reports_change_nothing():
+    registry = new_registry()
+    events = [report('sdb-1', 'thesportsdb', '2030-03-01T15:00:00Z')]
+    apply_reports(events, registry)
+    assert apply_reports(events, registry) == ([], [])
+
+
+def test_a_rescheduled_report_leaves_its_fixture():
+    registry = new_registry()
+    apply_reports([report('sdb-1', 'thesportsdb', '2030-03-01T15:00:00Z'),
+                   report('af-1', 'api-football', '2030-03-01T15:00:00Z')], registry)
+    fixtures, removed = apply_reports([report('af-1', 'api-football', '2030-03-08T15:00:00Z')], registry)
+    assert sorted(fixture['id'] for fixture in fixtures) == ['af-1', 'sdb-1']
+    assert 'sources' not in next(fixture for fixture in fixtures if fixture['id'] == 'af-1')
+    assert removed == []
+
+
+def test_withdrawing_the_primary_report_falls_back_to_the_next():
+    registry = new_registry()
+    apply_reports([report('sdb-1', 'thesportsdb', '2030-03-01T15:00:00Z', venue='Emirates Stadium'),
+                   report('af-1', 'api-football', '2030-03-01T15:00:00Z')], registry)
+    fixtures, removed = withdraw_reports(['af-1'], registry)
+    assert fixtures == [report('sdb-1', 'thesportsdb', '2030-03-01T15:00:00Z', venue='Emirates Stadium')]
+    assert removed == ['af-1']
+    assert withdraw_reports(['sdb-1', 'unknown'], registry) == ([], ['sdb-1'])
@@ -0,0 +1,122 @@
+import io
+import json
+
+import pytest
+
+from app.utils.event_store import get_event
+from app.utils.ingest import validate_event, read_ndjson, read_webhook, IngestError, INGEST_TOKENS, MAX_LINE_BYTES
+
+
+def record(**fields):
+    base = {'id': 42, 'sport': ' Football ', 'home_team': ' Arsenal ', 'away_team': 'Chelsea',
+            'date': '2030-03-01T20:30:00+05:30'}
+    base.update(fields)
+    return {key: value for key, value in base.items() if value is not None}
+
+
+def test_valid_record_is_normalized():
+    event = validate_event(record(competition='Premier League', home_score=2, minute=45.5), 'scraper')
+    assert event == {
+        'id': 'scraper:42',
+        'sport': 'football',
+        'home_team': 'Arsenal',
+        'away_team': 'Chelsea',
+        'date': '2030-03-01T15:00:00Z',
+        'provider': 'scraper',
+        'competition': 'Premier League',
+        'home_score': 2,
+        'minute': 45.5
+    }
+
+
+def test_provider_comes_from_the_token_not_the_record():
+    event = validate_event(record(provider='balldontlie'), 'scraper')
+    assert event['provider'] == 'scraper'
+
+
+def test_ids_are_scoped_to_the_source():
+    assert validate_event(record(id='basketball-7'), 'partner')['id'] == 'partner:basketball-7'
+
+
+@pytest.mark.parametrize('value', [['a list'], 'an event', 7, None])
+def test_non_object_records_are_rejected(value):
+    with pytest.raises(IngestError, match='JSON object'):
+        validate_event(value, 'scraper')
+
+
+@pytest.mark.parametrize('field', ['id', 'sport', 'home_team', 'away_team', 'date'])
+def test_missing_required_fields_are_rejected(field):
+    incomplete = record()
+    del incomplete[field]
+    with pytest.raises(IngestError, match=f'missing {field}'):
+        validate_event(incomplete, 'scraper')
+
+
+def test_empty_required_fields_are_reported_together():
+    with pytest.raises(IngestError, match='missing home_team, away_team'):
+        validate_event(record(home_team='', away_team=''), 'scraper')
+
+
+@pytest.mark.parametrize('date', ['next friday', '01/03/2030', '2030-13-01'])
+def test_dates_that_are_not_iso_8601_are_rejected(date):
+    with pytest.raises(IngestError, match='not ISO 8601'):
+        validate_event(record(date=date), 'scraper')
+
+
+@pytest.mark.parametrize('value', ['2', True, [2], {'goals': 2}])
+def test_scores_must_be_numbers(value):
+    with pytest.raises(IngestError, match='home_score must be a finite number'):
+        validate_event(record(home_score=value), 'scraper')
+
+
+@pytest.mark.parametrize('literal', ['NaN', 'Infinity', '-Infinity'])
+def test_scores_must_be_finite(literal):
+    # json.loads turns these literals into floats
+    decoded = json.loads(f'{{"id": 1, "sport": "cricket", "home_team": "A", "away_team": "B", '
+                         f'"date": "2030-03-01", "away_score": {literal}}}')
+    with pytest.raises(IngestError, match='away_score must be a finite number'):
+        validate_event(decoded, 'scraper')
+
+
+def test_ndjson_lines_are_numbered_and_bad_ones_reported():
+    body = io.BytesIO(b'{"id": 1}\n\nnot json\n' + b'x' * (MAX_LINE_BYTES + 10) + b'\n{"id": 2}\n')
+    lines = list(read_ndjson(body))
+    assert [number for number, _ in lines] == [1, 3, 4, 5]
+    assert lines[0][1] == {'id': 1}
+    assert isinstance(lines[1][1], IngestError) and 'invalid JSON' in str(lines[1][1])
+    assert isinstance(lines[2][1], IngestError) and 'longer than' in str(lines[2][1])
+    assert lines[3][1] == {'id': 2}
+
+
+def test_webhook_shapes():
+    assert list(read_webhook({'id': 1})) == [(1, {'id': 1})]
+    assert list(read_webhook([{'id': 1}, {'id': 2}])) == [(1, {'id': 1}), (2, {'id': 2})]
+    assert list(read_webhook({'events': [{'id': 3}]})) == [(1, {'id': 3})]
+    with pytest.raises(IngestError):
+        list(read_webhook('not an event'))
+
+
+def test_pushed_ids_never_replace_another_providers_event(sports_state, client, monkeypatch):
+    from app.utils import sports_api
+    monkeypatch.setitem(INGEST_TOKENS, 'partner', 'secret')
+    polled = {'id': 'cricket-0', 'sport': 'cricket', 'home_team': 'Mumbai Indians',
+              'away_team': 'Chennai Super Kings', 'date': '2030-03-01T14:00:00Z'}
+    sports_api.refresh_source('cricket', [polled])
+
+    pushed = dict(polled, id='cricket-0', home_team='Evil')
+    response = client.post('/api/ingest', json=pushed, headers={'Authorization': 'Bearer secret'})
+    assert response.status_code == 200
+    assert response.get_json()['accepted'] == 1
+    assert get_event('cricket-0')['home_team'] == 'Mumbai Indians'
+    assert get_event('partner:cricket-0')['provider'] == 'partner'
+
+    response = client.post('/api/ingest', json=dict(pushed, home_team='Evil XI'),
+                           headers={'Authorization': 'Bearer secret'})
+    assert response.get_json()['changed'] == 1
+    assert get_event('partner:cricket-0')['home_team'] == 'Evil XI'
+
+
+def test_unknown_tokens_are_refused(client, monkeypatch):
+    monkeypatch.setitem(INGEST_TOKENS, 'partner', 'secret')
+    response = client.post('/api/ingest', json=record(), headers={'Authorization': 'Bearer guess'})
+    assert response.status_code == 401
@@ -0,0 +1,118 @@
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils import live_poller
+from app.utils.event_store import get_event
+from app.utils.shared_state import RedisLease, FileLease, FileSnapshot
+
+
+def iso(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def game(game_id, status, started_ago=600, **fields):
+    return dict({'id': f'basketball-{game_id}', 'sport': 'basketball', 'provider': 'balldontlie',
+                 'home_team': 'Boston Celtics', 'away_team': 'Miami Heat',
+                 'date': iso(time.time() - started_ago), 'status': status}, **fields)
+
+
+class FakeRedis:
+    """The SET NX PX and renew script semantics RedisLease relies on"""
+
+    def __init__(self):
+        self.values = {}
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    def eval(self, script, numkeys, key, token, ttl_ms):
+        return 1 if self.values.get(key) == token else 0
+
+
+class UnreachableRedis:
+    def set(self, *args, **kwargs):
+        raise ConnectionError('connection refused')
+
+
+@pytest.fixture
+def poller(sports_state, monkeypatch):
+    """A clean poller schedule, with BallDontLie games refreshed from `scores`"""
+    scores = {}
+    monkeypatch.setitem(live_poller.poller_state, 'next_poll', {})
+    monkeypatch.setitem(live_poller.poller_state, 'published', {})
+    monkeypatch.setitem(live_poller.live_refreshers, 'balldontlie',
+                        lambda events: [scores[event['id']] for event in events if event['id'] in scores])
+    return scores
+
+
+def test_file_lease_is_held_by_one_process_at_a_time(tmp_path):
+    path = str(tmp_path / 'poller.lock')
+    holder, other = FileLease(path), FileLease(path)
+    assert holder.acquire()
+    # flock locks belong to the open file, so a second open stands in for another process
+    assert not other.acquire()
+    assert holder.acquire()
+
+
+def test_redis_lease_is_renewed_and_lost():
+    client = FakeRedis()
+    holder = RedisLease(None, 'poller', 15, client=client)
+    other = RedisLease(None, 'poller', 15, client=client)
+    assert holder.acquire()
+    assert not other.acquire()
+    assert holder.acquire()
+
+    # The key expired and another process took it
+    del client.values['poller']
+    assert other.acquire()
+    assert not holder.acquire()
+
+
+def test_nobody_holds_the_lease_without_redis():
+    assert not RedisLease(None, 'poller', 15, client=UnreachableRedis()).acquire()
+
+
+def test_holder_publishes_and_other_processes_apply(poller, tmp_path):
+    from app.utils import sports_api
+    sports_api.feed_events([game(1, 'Scheduled')])
+    poller['basketball-1'] = game(1, 'LIVE', home_score=51, away_score=48)
+    published = FileSnapshot(str(tmp_path / 'live-updates.json'))
+
+    emitted = []
+    changed = live_poller.poll_once(lambda name, payload: emitted.append(payload),
+                                    publish=lambda reports: live_poller.publish_live_updates(reports, published))
+    assert [event['home_score'] for event in changed] == [51]
+    assert emitted == [{'events': changed}]
+
+    # Another process: its store still has the scheduled game
+    sports_api.feed_events([game(1, 'Scheduled')])
+    follower = FileSnapshot(published.path)
+    changed = live_poller.sync_live_updates(follower)
+    assert [event['status'] for event in changed] == ['LIVE']
+    assert get_event('basketball-1')['home_score'] == 51
+    # Nothing new to apply until the holder publishes again
+    assert live_poller.sync_live_updates(follower) == []
+
+
+def test_unchanged_refreshes_are_not_republished(poller, tmp_path):
+    from app.utils import sports_api
+    sports_api.feed_events([game(1, 'Scheduled')])
+    poller['basketball-1'] = game(1, 'LIVE', home_score=51)
+    snapshot = FileSnapshot(str(tmp_path / 'live-updates.json'))
+    live_poller.publish_live_updates([poller['basketball-1']], snapshot)
+    first = snapshot.read()
+    live_poller.publish_live_updates([poller['basketball-1']], snapshot)
+    assert first['events'] == [poller['basketball-1']]
+    assert snapshot.read() is None
+
+
+def test_snapshots_of_finished_fixtures_are_ignored(poller, tmp_path):
+    snapshot = FileSnapshot(str(tmp_path / 'live-updates.json'))
+    snapshot.publish({'events': [game(1, 'LIVE', started_ago=live_poller.LIVE_LOOKBACK + 3600)]})
+    assert live_poller.sync_live_updates(FileSnapshot(snapshot.path)) == []
+    assert get_event('basketball-1') is None
@@ -0,0 +1,149 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.utils import llm_dispatch
+from app.utils.llm_dispatch import LLMDispatchError, dispatch_chat
+
+MESSAGES = [{'role': 'user', 'content': 'Who plays tonight?'}]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Chat completions for /<provider>/chat/completions, answering after the
+    provider's delay with its status and its name as the content
+    """
+
+    def do_POST(self):
+        provider = self.path.split('/')[1]
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        behaviour = self.server.behaviour[provider]
+        self.server.calls.append(provider)
+        time.sleep(behaviour.get('delay', 0))
+
+        body = json.dumps({'choices': [{'message': {'content': f'answer from {provider}'}}]}).encode()
+        try:
+            self.send_response(behaviour.get('status', 200))
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            pass  # the client gave up waiting
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        pass
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    """
+    Two providers, 'primary' then 'secondary', served by a local stub whose
+    per-provider delay and status the test sets in server.behaviour; the
+    providers called are listed in server.calls
+    """
+    server = StubServer(('127.0.0.1', 0), StubHandler)
+    server.behaviour = {'primary': {}, 'secondary': {}}
+    server.calls = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    base = f'http://127.0.0.1:{server.server_port}'
+    providers = {
+        name: {'name': name, 'api_key': 'test-key', 'api_base': f'{base}/{name}', 'model': 'stub',
+               'timeout': 2.0, 'extra_headers': {}, 'extra_body': {}}
+        for name in server.behaviour
+    }
+    monkeypatch.setattr(llm_dispatch, 'LLM_PROVIDERS', providers)
+    monkeypatch.setattr(llm_dispatch, 'LLM_PROVIDER_ORDER', ['primary', 'secondary'])
+    monkeypatch.setattr(llm_dispatch, 'disabled_providers', set())
+    monkeypatch.setattr(llm_dispatch, 'recent_latency', {})
+    monkeypatch.setattr(llm_dispatch, 'LLM_HEDGE_DEFAULT_DELAY', 0.2)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def recorded(provider, outcome):
+    """How many calls the latency histogram holds for provider and outcome"""
+    for suffix, key, extra, value in llm_dispatch.llm_request_duration.samples():
+        if suffix == '_count' and key == (provider, outcome):
+            return value
+    return 0
+
+
+def wait_for_count(provider, outcome, expected, timeout=5.0):
+    """Wait for a call finishing in the background to be recorded"""
+    deadline = time.monotonic() + timeout
+    while recorded(provider, outcome) < expected and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return recorded(provider, outcome)
+
+
+def test_fast_primary_answers_without_a_hedge(stub):
+    stub.behaviour['primary']['delay'] = 0.05
+    before = recorded('primary', 'success')
+
+    assert dispatch_chat(MESSAGES, hedge=True) == ('answer from primary', 'primary')
+    assert stub.calls == ['primary']
+    assert recorded('primary', 'success') == before + 1
+
+
+def test_hedge_wins_and_the_slow_primary_is_cancelled(stub):
+    stub.behaviour['primary']['delay'] = 1.0
+    stub.behaviour['secondary']['delay'] = 0.05
+    cancelled = recorded('primary', 'cancelled')
+    successes = (recorded('primary', 'success'), recorded('secondary', 'success'))
+
+    started = time.monotonic()
+    assert dispatch_chat(MESSAGES, hedge=True) == ('answer from secondary', 'secondary')
+    assert time.monotonic() - started < 0.8
+    assert stub.calls == ['primary', 'secondary']
+
+    # The primary still answers, but is recorded as cancelled, not as a success
+    assert wait_for_count('primary', 'cancelled', cancelled + 1) == cancelled + 1
+    assert (recorded('primary', 'success'), recorded('secondary', 'success')) == (successes[0], successes[1] + 1)
+    assert llm_dispatch.recent_latency.keys() == {'secondary'}
+
+
+def test_without_hedging_the_slow_primary_is_awaited(stub):
+    stub.behaviour['primary']['delay'] = 0.4
+
+    assert dispatch_chat(MESSAGES, hedge=False) == ('answer from primary', 'primary')
+    assert stub.calls == ['primary']
+
+
+def test_failed_primary_falls_back_to_the_next_provider(stub):
+    stub.behaviour['primary']['status'] = 500
+    errors = recorded('primary', 'error')
+
+    assert dispatch_chat(MESSAGES, hedge=False) == ('answer from secondary', 'secondary')
+    assert stub.calls == ['primary', 'secondary']
+    assert recorded('primary', 'error') == errors + 1
+
+
+def test_timed_out_primary_falls_back_to_the_next_provider(stub):
+    stub.behaviour['primary']['delay'] = 1.0
+    llm_dispatch.LLM_PROVIDERS['primary']['timeout'] = 0.2
+    timeouts = recorded('primary', 'timeout')
+
+    assert dispatch_chat(MESSAGES, hedge=False) == ('answer from secondary', 'secondary')
+    assert recorded('primary', 'timeout') == timeouts + 1
+
+
+def test_every_provider_failing_raises(stub):
+    stub.behaviour['primary']['status'] = 500
+    stub.behaviour['secondary']['status'] = 503
+
+    with pytest.raises(LLMDispatchError, match='primary returned status 500; secondary returned status 503'):
+        dispatch_chat(MESSAGES, hedge=True)
+
@@ -0,0 +1,88 @@
+import pytest
+
+from app.utils.metrics import Counter, Gauge, Histogram, counter, render_metrics
+
+
+def test_counter_uses_one_name_in_metadata_and_samples():
+    requests_seen = Counter('requests_seen', 'Requests seen', ('route',))
+    requests_seen.inc(route='/a')
+    requests_seen.inc(2, route='/a')
+    requests_seen.inc(route='/b')
+    assert requests_seen.render().splitlines() == [
+        '# HELP requests_seen_total Requests seen',
+        '# TYPE requests_seen_total counter',
+        'requests_seen_total{route="/a"} 3',
+        'requests_seen_total{route="/b"} 1',
+    ]
+
+
+def test_gauge_without_labels():
+    sessions = Gauge('open_sessions', 'Sessions open')
+    sessions.inc(5)
+    sessions.dec(2)
+    assert sessions.render().splitlines() == [
+        '# HELP open_sessions Sessions open',
+        '# TYPE open_sessions gauge',
+        'open_sessions 3',
+    ]
+
+
+def test_histogram_buckets_are_cumulative():
+    latency = Histogram('latency_seconds', 'Latency', ('outcome',), buckets=[0.1, 1.0])
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value, outcome='ok')
+    assert latency.render().splitlines() == [
+        '# HELP latency_seconds Latency',
+        '# TYPE latency_seconds histogram',
+        'latency_seconds_bucket{outcome="ok",le="0.1"} 2',
+        'latency_seconds_bucket{outcome="ok",le="1"} 3',
+        'latency_seconds_bucket{outcome="ok",le="+Inf"} 4',
+        'latency_seconds_sum{outcome="ok"} 3.65',
+        'latency_seconds_count{outcome="ok"} 4',
+    ]
+
+
+def test_label_values_are_escaped():
+    errors = Counter('errors', 'Errors', ('message',))
+    errors.inc(message='say "hi"\\n\nbye')
+    assert errors.render().splitlines()[-1] == 'errors_total{message="say \\"hi\\"\\\\n\\nbye"} 1'
+
+
+def test_labels_must_match_the_declaration():
+    errors = Counter('errors', 'Errors', ('message',))
+    with pytest.raises(ValueError, match='expects labels'):
+        errors.inc(route='/a')
+
+
+def test_registered_metrics_are_rendered_once():
+    first = counter('test_registered_total_events', 'Events counted by the test')
+    assert counter('test_registered_total_events', 'Registered twice') is first
+    first.inc()
+    body = render_metrics()
+    assert body.endswith('\n')
+    assert body.count('# TYPE test_registered_total_events_total counter') == 1
+    assert 'test_registered_total_events_total 1\n' in body
+    assert '# TYPE sports_cache_requests_total counter' in body
+
+
+def request_count(body, labels):
+    prefix = f'http_request_duration_seconds_count{{{labels}}} '
+    lines = [line for line in body.splitlines() if line.startswith(prefix)]
+    return int(lines[0][len(prefix):]) if lines else 0
+
+
+def test_metrics_route_counts_requests_by_route_template(client):
+    before = client.get('/metrics').get_data(as_text=True)
+    client.get('/api/chat/stats')
+    client.delete('/api/chat/session/not%20valid%21')
+    client.get('/no/such/page')
+
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.headers['Content-Type'] == 'text/plain; version=0.0.4; charset=utf-8'
+    body = response.get_data(as_text=True)
+    for labels in ('method="GET",route="/api/chat/stats",status="200"',
+                   'method="DELETE",route="/api/chat/session/<session_id>",status="400"',
+                   'method="GET",route="unmatched",status="404"'):
+        assert request_count(body, labels) == request_count(before, labels) + 1
+    assert '# TYPE llm_request_duration_seconds histogram' in body
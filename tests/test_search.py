@@ -0,0 +1,108 @@
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils import sports_api
+from app.utils.search_index import search_index, MAX_PAGE_SIZE
+
+
+def iso(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def fixture(event_id, hours_ahead, sport='football', home='Arsenal', away='Chelsea', **fields):
+    return dict({'id': event_id, 'sport': sport, 'home_team': home, 'away_team': away,
+                 'date': iso(time.time() + hours_ahead * 3600)}, **fields)
+
+
+def refresh():
+    """Run a refresh on the next request rather than when the hourly cache expires"""
+    sports_api.sports_data_cache['last_updated'] = None
+
+
+def search(client, query, **params):
+    params['q'] = query
+    return client.get('/api/sports/search', query_string=params).get_json()
+
+
+def ids(result):
+    return [event['id'] for event in result['results']]
+
+
+@pytest.fixture
+def league(sports_state):
+    """Football and cricket fixtures listed out of start order"""
+    sports_state['football'] = [
+        fixture('f3', 72, home='Arsenal', away='Liverpool', venue='Emirates Stadium'),
+        fixture('f1', 24, home='Chelsea', away='Arsenal', venue='Stamford Bridge'),
+        fixture('f2', 48, home='Liverpool', away='Everton', venue='Anfield'),
+    ]
+    sports_state['cricket'] = [
+        fixture('c1', 36, sport='cricket', home='Mumbai Indians', away='Chennai Super Kings',
+                venue='Wankhede Stadium'),
+    ]
+    return sports_state
+
+
+def test_results_are_ordered_by_start_time(league, client):
+    assert ids(search(client, 'arsenal')) == ['f1', 'f3']
+    assert ids(search(client, 'stadium')) == ['c1', 'f3']
+
+
+def test_every_word_must_match(league, client):
+    assert ids(search(client, 'arsenal liverpool')) == ['f3']
+    assert ids(search(client, 'arsenal mumbai')) == []
+
+
+def test_only_the_last_word_matches_as_a_prefix(league, client):
+    assert ids(search(client, 'liv')) == ['f2', 'f3']
+    assert ids(search(client, 'arsenal liv')) == ['f3']
+    assert ids(search(client, 'ars liverpool')) == []
+
+
+def test_events_are_found_by_date(league, client):
+    day = league['cricket'][0]['date'][:10]
+    assert 'c1' in ids(search(client, day))
+
+
+def test_results_are_paged(league, client):
+    result = search(client, 'football', per_page=2, page=2)
+    assert (result['total'], result['page'], result['per_page']) == (3, 2, 2)
+    assert ids(result) == ['f3']
+    assert search(client, 'arsenal', per_page=10 ** 6)['per_page'] == MAX_PAGE_SIZE
+
+
+def test_an_empty_query_matches_nothing(league, client):
+    assert search(client, '') == {'query': '', 'total': 0, 'page': 1, 'per_page': 20, 'results': []}
+
+
+def test_changed_events_are_reindexed(league, client):
+    search(client, 'arsenal')
+    league['football'][0] = fixture('f3', 72, home='Tottenham', away='Liverpool')
+    refresh()
+    assert ids(search(client, 'arsenal')) == ['f1']
+    assert ids(search(client, 'tottenham')) == ['f3']
+    assert 'emirates' not in search_index['postings']
+
+
+def test_withdrawn_events_are_unindexed(league, client):
+    search(client, 'arsenal')
+    league['football'] = []
+    refresh()
+    assert ids(search(client, 'arsenal')) == []
+    assert ids(search(client, 'mumbai')) == ['c1']
+    assert search_index['events'].keys() == {'c1'}
+
+
+def test_evicted_events_are_unindexed(league, client):
+    search(client, 'arsenal')
+    sports_api.evict_past_events(now=time.time() + 40 * 3600 + sports_api.EVENT_RETENTION)
+    assert ids(search(client, 'football')) == ['f2', 'f3']
+    assert ids(search(client, 'mumbai')) == []
+
+
+def test_results_are_localized_on_request(league, client):
+    result = search(client, 'mumbai', tz='Asia/Kolkata')
+    assert result['results'][0]['local_date'].endswith('IST')
+    assert client.get('/api/sports/search?q=mumbai&tz=Mars/Olympus_Mons').status_code == 400
@@ -0,0 +1,249 @@
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from app.utils import sports_api
+from app.utils.batch_fetch import RateLimiter
+from app.utils.shared_state import FileLease, FileSnapshot
+from app.utils.event_store import get_event, event_store
+from app.utils.fixture_merge import fixture_registry
+from app.utils.search_index import search_index, search_events
+
+
+def iso(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def fixture(event_id, days_ahead, home='Mumbai Indians', away='Chennai Super Kings', sport='cricket', **fields):
+    return dict({'id': event_id, 'sport': sport, 'home_team': home, 'away_team': away,
+                 'date': iso(time.time() + days_ahead * 86400)}, **fields)
+
+
+def fallback_cricket():
+    return [fixture(f'cricket-{i}', i + 1, home=f'Home {i}', away=f'Away {i}') for i in range(10)]
+
+
+def refresh(sport_type='all'):
+    """Run a refresh now rather than when the hourly cache expires"""
+    sports_api.sports_data_cache['last_updated'] = None
+    return sports_api.get_sports_data(sport_type)
+
+
+def exported_ids(client):
+    body = client.get('/api/sports/export').get_data(as_text=True)
+    return [json.loads(line)['id'] for line in body.splitlines()]
+
+
+def paged_ids(client, query='type=all'):
+    return [event['id'] for event in client.get(f'/api/sports/events?{query}&limit=200').get_json()['events']]
+
+
+def test_events_a_source_stops_returning_are_withdrawn(sports_state):
+    sports_api.refresh_source('cricket', fallback_cricket())
+    sports_api.refresh_source('cricket', [fixture('real1', 2)])
+    assert get_event('real1') is not None
+    assert get_event('cricket-0') is None
+    assert 'cricket-0' not in search_index['events']
+    assert search_events('Home')['total'] == 0
+
+
+def test_events_another_source_still_returns_are_kept(sports_state):
+    shared = fixture('shared', 1)
+    sports_api.refresh_source('cricket', [shared])
+    sports_api.refresh_source('thesportsdb:all', [shared])
+    sports_api.refresh_source('cricket', [])
+    assert get_event('shared') is not None
+    sports_api.refresh_source('thesportsdb:all', [])
+    assert get_event('shared') is None
+
+
+def test_fed_events_outlive_refreshes(sports_state):
+    sports_api.feed_events([fixture('pushed', 1)])
+    sports_api.refresh_source('cricket', fallback_cricket())
+    sports_api.refresh_source('cricket', [])
+    assert get_event('pushed') is not None
+
+
+def test_replaced_fallback_leaves_every_read_path(sports_state, client):
+    sports_state['cricket'] = fallback_cricket()
+    refresh()
+    assert len(paged_ids(client)) == 10
+
+    sports_state['cricket'] = [fixture('real1', 2)]
+    refresh()
+    plain = [event['id'] for event in client.get('/api/sports/events?type=all').get_json()]
+    assert plain == ['real1']
+    assert paged_ids(client) == ['real1']
+    assert exported_ids(client) == ['real1']
+    assert client.get('/api/sports/search?q=home').get_json()['total'] == 0
+
+
+def test_balldontlie_ingest_withdraws_games_no_longer_listed(sports_state, monkeypatch):
+    today = datetime.now(timezone.utc).date()
+    tipoff = iso(datetime.combine(today + timedelta(days=1), datetime.min.time(), timezone.utc).timestamp() + 3600)
+
+    def game(game_id):
+        return {'id': f'basketball-{game_id}', 'sport': 'basketball', 'provider': 'balldontlie',
+                'competition': 'NBA', 'home_team': f'Home {game_id}', 'away_team': 'Away', 'date': tipoff}
+
+    listed = {'games': [game(1), game(2)]}
+
+    def fetch_window(season, start_date, end_date):
+        sports_api.feed_events(listed['games'])
+        return listed['games']
+
+    monkeypatch.setattr(sports_api, 'fetch_balldontlie_window', fetch_window)
+    sports_api.ingest_balldontlie_games(today=today)
+    assert get_event('basketball-2') is not None
+
+    listed['games'] = [game(1)]
+    sports_api.ingest_balldontlie_games(today=today)
+    assert get_event('basketball-1') is not None
+    assert get_event('basketball-2') is None
+
+
+def test_failed_balldontlie_window_withdraws_nothing(sports_state, monkeypatch):
+    today = datetime.now(timezone.utc).date()
+    sports_api.feed_events([fixture('basketball-1', 1, sport='basketball', provider='balldontlie')])
+
+    def fetch_window(season, start_date, end_date):
+        raise ConnectionError('unreachable')
+
+    monkeypatch.setattr(sports_api, 'fetch_balldontlie_window', fetch_window)
+    assert sports_api.ingest_balldontlie_games(today=today) == 0
+    assert get_event('basketball-1') is not None
+
+
+def test_every_read_path_serves_one_event_per_fixture(sports_state, client):
+    sports_state['cricket'] = [fixture('x1', 1, provider='cricapi')]
+    refresh()
+    sports_api.feed_events([fixture('tsdb9', 1, provider='thesportsdb', venue='Wankhede Stadium')])
+
+    plain = client.get('/api/sports/events?type=all').get_json()
+    assert [event['id'] for event in plain] == ['x1']
+    assert plain[0]['sources'] == ['cricapi', 'thesportsdb']
+    assert plain[0]['venue'] == 'Wankhede Stadium'
+    assert paged_ids(client) == ['x1']
+    assert paged_ids(client, 'type=cricket') == ['x1']
+    assert [event['id'] for event in client.get('/api/sports/search?q=mumbai').get_json()['results']] == ['x1']
+    assert exported_ids(client) == ['x1']
+    assert get_event('tsdb9') is None
+
+
+def test_a_withdrawn_report_leaves_the_merged_fixture(sports_state, client):
+    sports_state['cricket'] = [fixture('x1', 1, provider='cricapi')]
+    refresh()
+    sports_api.feed_events([fixture('tsdb9', 1, provider='thesportsdb')])
+    sports_state['cricket'] = []
+    refresh()
+    assert paged_ids(client) == ['tsdb9']
+    assert [event['id'] for event in client.get('/api/sports/search?q=mumbai').get_json()['results']] == ['tsdb9']
+    assert 'sources' not in get_event('tsdb9')
+
+
+def response(status, body):
+    reply = requests.Response()
+    reply.status_code = status
+    reply._content = json.dumps(body).encode()
+    return reply
+
+
+@pytest.fixture
+def thesportsdb(monkeypatch):
+    """One football league on TheSportsDB, answering with whatever the test queues"""
+    replies = []
+    monkeypatch.setattr(sports_api, 'LEAGUE_CATALOG', {'football': [{'id': '4328', 'name': 'Premier League'}]})
+    monkeypatch.setattr(sports_api, 'thesportsdb_league_cache', {})
+    monkeypatch.setattr(sports_api, 'thesportsdb_rate_limiter', RateLimiter(0))
+    monkeypatch.setattr(sports_api, 'THESPORTSDB_LEAGUE_TTL', 0)
+    monkeypatch.setattr(sports_api.requests, 'get', lambda url, **kwargs: replies.pop(0))
+    return replies
+
+
+LEAGUE_EVENTS = {'events': [{'idEvent': '101', 'strHomeTeam': 'Arsenal', 'strAwayTeam': 'Chelsea',
+                             'strTimestamp': '2030-03-01T15:00:00+00:00'}]}
+
+
+def test_failed_league_fetch_raises(thesportsdb):
+    thesportsdb.append(response(503, {}))
+    with pytest.raises(requests.HTTPError):
+        sports_api.fetch_thesportsdb_events('http://stub', '4328', 'football')
+
+
+def test_failed_league_keeps_serving_its_last_good_events(thesportsdb):
+    thesportsdb.extend([response(200, LEAGUE_EVENTS), response(503, {}), response(200, {'events': None})])
+    assert [event['id'] for event in sports_api.get_thesportsdb_data('football')] == ['101']
+    cached = sports_api.thesportsdb_league_cache['4328']
+
+    # The entry has expired (TTL 0) and the refetch fails: the last good
+    # events are served and nothing is cached
+    assert [event['id'] for event in sports_api.get_thesportsdb_data('football')] == ['101']
+    assert sports_api.thesportsdb_league_cache['4328'] is cached
+
+    # The next refresh retries, and a successful empty answer replaces them
+    assert sports_api.get_thesportsdb_data('football') == []
+    assert sports_api.thesportsdb_league_cache['4328']['events'] == []
+
+
+def test_failed_league_without_good_events_is_not_cached(thesportsdb):
+    thesportsdb.append(response(500, {}))
+    assert sports_api.get_thesportsdb_data('football') == []
+    assert '4328' not in sports_api.thesportsdb_league_cache
+
+
+@pytest.fixture
+def ingest(sports_state, monkeypatch, tmp_path):
+    """
+    The BallDontLie ingest loop with a shared lock and snapshot in tmp_path,
+    ingesting the games the test lists and counting its runs
+    """
+    listed = {'games': [], 'runs': 0}
+
+    def ingest_games(sweep=False, today=None):
+        listed['runs'] += 1
+        if not sweep:
+            sports_api.feed_events(listed['games'])
+        return len(listed['games'])
+
+    monkeypatch.setattr(sports_api, 'ingest_balldontlie_games', ingest_games)
+    monkeypatch.setattr(sports_api, 'balldontlie_ingest_state', dict(sports_api.balldontlie_ingest_state,
+                                                                     last_run=None, last_sweep=None))
+    listed['lock'] = str(tmp_path / 'ingest.lock')
+    listed['snapshot'] = str(tmp_path / 'games.json')
+    return listed
+
+
+def nba_game(game_id):
+    return fixture(f'basketball-{game_id}', 1, sport='basketball', provider='balldontlie',
+                   home=f'Home {game_id}', away='Away')
+
+
+def test_only_the_lease_holder_ingests(ingest):
+    ingest['games'] = [nba_game(1), nba_game(2)]
+    holder = (FileLease(ingest['lock']), FileSnapshot(ingest['snapshot']))
+    other = (FileLease(ingest['lock']), FileSnapshot(ingest['snapshot']))
+
+    assert sports_api.balldontlie_ingest_tick(*holder)
+    assert ingest['runs'] == 2  # the games around now, then the season sweep
+    # Not due again until BALLDONTLIE_REFRESH_INTERVAL has passed
+    assert not sports_api.balldontlie_ingest_tick(*holder)
+    assert not sports_api.balldontlie_ingest_tick(*other)
+    assert ingest['runs'] == 2
+
+
+def test_other_processes_apply_the_published_games(ingest):
+    holder = (FileLease(ingest['lock']), FileSnapshot(ingest['snapshot']))
+    ingest['games'] = [nba_game(1), nba_game(2)]
+    sports_api.balldontlie_ingest_tick(*holder)
+
+    # Another process: its own store still has a game the holder dropped
+    for value in (*event_store.values(), *fixture_registry.values()):
+        value.clear()
+    sports_api.feed_events([nba_game(3)])
+    changed = sports_api.sync_balldontlie_games(FileSnapshot(ingest['snapshot']))
+    assert sorted(event['id'] for event in changed) == ['basketball-1', 'basketball-2']
+    assert get_event('basketball-3') is None
+    assert sports_api.balldontlie_ingest_state['last_run'] is not None
@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytz
+
+from app.utils.timezones import format_local, utc_offset, localize_events, get_timezone_table, InvalidTimezoneError
+
+
+def expected(timestamp, name):
+    """What pytz itself renders for a moment"""
+    local = datetime.fromtimestamp(timestamp, pytz.utc).astimezone(pytz.timezone(name))
+    return local.strftime('%Y-%m-%d %H:%M %Z')
+
+
+def around(transition_utc, minutes=90, step=15):
+    """UTC timestamps from before to after a transition"""
+    start = datetime.fromisoformat(transition_utc).replace(tzinfo=timezone.utc)
+    return [(start + timedelta(minutes=offset)).timestamp() for offset in range(-minutes, minutes + 1, step)]
+
+
+@pytest.mark.parametrize('name, transition', [
+    ('Europe/London', '2025-03-30T01:00:00'),       # GMT -> BST
+    ('Europe/London', '2025-10-26T01:00:00'),       # BST -> GMT
+    ('America/New_York', '2025-03-09T07:00:00'),    # EST -> EDT
+    ('America/New_York', '2025-11-02T06:00:00'),    # EDT -> EST
+    ('Australia/Sydney', '2025-04-05T16:00:00'),    # AEDT -> AEST
+])
+def test_matches_pytz_across_dst_transitions(name, transition):
+    for timestamp in around(transition):
+        assert format_local(timestamp, name) == expected(timestamp, name)
+
+
+def test_offset_changes_exactly_at_the_transition():
+    transition = datetime(2025, 3, 30, 1, tzinfo=timezone.utc).timestamp()
+    assert utc_offset(transition - 1, 'Europe/London') == (0, 'GMT')
+    assert utc_offset(transition, 'Europe/London') == (3600, 'BST')
+
+
+def test_zones_without_dst():
+    timestamp = datetime(2025, 7, 1, 12, tzinfo=timezone.utc).timestamp()
+    assert format_local(timestamp, 'Asia/Kolkata') == '2025-07-01 17:30 IST'
+    assert format_local(timestamp, 'UTC') == '2025-07-01 12:00 UTC'
+
+
+def test_unknown_zone():
+    with pytest.raises(InvalidTimezoneError):
+        get_timezone_table('Mars/Olympus_Mons')
+
+
+def test_localize_events_copies_events():
+    timestamp = int(datetime(2025, 10, 26, 0, 30, tzinfo=timezone.utc).timestamp())
+    events = [{'id': 'a', 'timestamp': timestamp}, {'id': 'b'}]
+    localized = localize_events(events, 'Europe/London')
+    assert localized[0]['local_date'] == '2025-10-26 01:30 BST'
+    assert localized[1]['local_date'] == 'Date not available'
+    assert all(event['timezone'] == 'Europe/London' for event in localized)
+    assert 'local_date' not in events[0]
+
+
+@pytest.fixture
+def kickoff(sports_state):
+    """One football fixture at 2030-07-01 12:00 UTC"""
+    sports_state['football'] = [{'id': 'f1', 'sport': 'football', 'home_team': 'Arsenal', 'away_team': 'Chelsea',
+                                 'date': '2030-07-01T12:00:00Z'}]
+    return sports_state
+
+
+def test_events_route_localizes_with_tz_or_header(kickoff, client):
+    event = client.get('/api/sports/events?tz=Asia/Kolkata').get_json()[0]
+    assert (event['local_date'], event['timezone']) == ('2030-07-01 17:30 IST', 'Asia/Kolkata')
+    event = client.get('/api/sports/events', headers={'X-Timezone': 'Europe/London'}).get_json()[0]
+    assert event['local_date'] == '2030-07-01 13:00 BST'
+    page = client.get('/api/sports/events?limit=5&tz=America/New_York').get_json()
+    assert page['events'][0]['local_date'] == '2030-07-01 08:00 EDT'
+
+
+def test_events_route_without_a_zone_leaves_events_canonical(kickoff, client):
+    event = client.get('/api/sports/events').get_json()[0]
+    assert 'local_date' not in event
+    assert event['date'] == '2030-07-01T12:00:00Z'
+
+
+@pytest.mark.parametrize('path', ['/api/sports/events?tz=Mars/Olympus_Mons',
+                                  '/api/sports/events?limit=5&tz=Mars/Olympus_Mons'])
+def test_events_route_rejects_unknown_zones(kickoff, client, path):
+    response = client.get(path)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()